@@ -18,9 +18,10 @@ from google.rpc.error_details_pb2 import BadRequest, ErrorInfo
 from grpclib import events, server, utils
 from grpclib.reflection import service
 
+from app.eligibility import configuration_cache
 from app.eligibility.client_specific import service as client_specific
 from app.utils.status_code_mapping import grpc_to_http_status_code
-from db.clients import postgres_connector
+from db.clients import client, postgres_connector
 from db.mono import client as mono
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,25 @@ TEAM_NS_TAG = "team_ns"
 SERVICE_NS = "eligibility-api"
 TEAM_NS = "eligibility"
 
+# The queries behind verification, by client, which we prepare on each of our
+#   database connections before we serve.
+WARMUP_QUERIES = {
+    name: (
+        "get_by_dob_and_email",
+        "get_by_secondary_verification",
+        "get_by_tertiary_verification",
+        "get_by_client_specific_verification",
+        "get_by_org_identity",
+        "get_by_dob_name_and_work_state",
+        "get_by_email_and_name",
+        "get_by_overeligibility",
+        "get_all_by_name_and_date_of_birth",
+        "get_by_name_and_unique_corp_id",
+        "get_by_date_of_birth_and_unique_corp_id",
+    )
+    for name in ("member_versioned", "member_2")
+}
+
 
 def factory(
     services: Collection[server.IServable],
@@ -144,11 +164,24 @@ async def listen_finish_span(event: events.SendMessage):
 @contextlib.asynccontextmanager
 async def app_context(**kwargs):
     structlog.contextvars.bind_contextvars(**kwargs)
+    # Before we open our pools, so each connection prepares these as it opens.
+    await postgres_connector.warmup(warmup_statements())
     await postgres_connector.initialize()
+    await configuration_cache.cache().initialize()
     await mono.initialize()
     await client_specific.initialize()
     ctx = contextvars.copy_context()
     yield ctx
     await client_specific.teardown()
+    await configuration_cache.cache().close()
     await mono.teardown()
     await postgres_connector.teardown()
+
+
+def warmup_statements() -> dict[str, str]:
+    loader = client.QueryLoader()
+    return {
+        f"{name}.{query}": getattr(loader.load(name), query).sql
+        for name, queries in WARMUP_QUERIES.items()
+        for query in queries
+    }
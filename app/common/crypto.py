@@ -2,7 +2,7 @@ import base64
 import hashlib
 import hmac
 import secrets
-from typing import AnyStr, Tuple, TypeVar
+from typing import AnyStr, AsyncIterable, AsyncIterator, BinaryIO, Tuple, TypeVar
 
 import orjson
 from Crypto.Cipher import AES
@@ -41,10 +41,16 @@ metadata_signature_keys = frozenset(
 dek_byte_length = 32
 auth_tag_byte_length = 16  # This is for compatibility with Go's `crypto.cipher.AEAD`
 nonce_byte_length = 12  # This is for compatibility with Go's `crypto.cipher.AEAD`
+# The size of each read when encrypting a file.
+encrypt_chunk_byte_length = 8 * 1024 * 1024
 
 _T = TypeVar("_T")
 
 
+class DecryptionError(ValueError):
+    """Raised when decrypted data fails authentication or its integrity check."""
+
+
 class Cryptographer:
     """A client encrypting and decrypting data with Envelope Encryption via Google KMS."""
 
@@ -69,6 +75,48 @@ class Cryptographer:
             )
         return cleartext, metadata
 
+    async def decrypt_stream(
+        self, chunks: AsyncIterable[bytes], metadata: dict
+    ) -> AsyncIterator[bytes]:
+        """Incrementally decrypt a stream of ciphertext chunks.
+
+        The auth tag is held back from the tail of the stream and verified, along with
+        the sha256 hashcode, once the final chunk has been decrypted. Callers MUST
+        consume the stream to the end and treat everything yielded before as
+        untrusted until then.
+
+        Raises:
+            DecryptionError: If the auth tag or the hashcode don't match.
+        """
+        kek_name, encrypted_dek, nonce, hashcode = await self._validate_metadata(
+            metadata
+        )
+        cipher = await self._get_cipher(kek_name, encrypted_dek, nonce)
+        digest = hashlib.sha256()
+        # The tail of the stream may be all or part of the auth tag, so we always
+        #   keep at least `auth_tag_byte_length` bytes in reserve.
+        tail = b""
+        async for chunk in chunks:
+            buffered = tail + chunk
+            tail = buffered[-auth_tag_byte_length:]
+            ciphertext = buffered[:-auth_tag_byte_length]
+            if not ciphertext:
+                continue
+            cleartext = cipher.decrypt(ciphertext)
+            digest.update(cleartext)
+            yield cleartext
+
+        try:
+            cipher.verify(tail)
+        except ValueError as e:
+            raise DecryptionError(f"data authentication failed: {e}") from e
+        computed_hashcode = digest.digest()
+        if not hmac.compare_digest(hashcode, computed_hashcode):
+            raise DecryptionError(
+                f"data hashcode comparison failed: "
+                f"expected {hashcode} but found {computed_hashcode}"
+            )
+
     async def encrypt(
         self,
         cleartext: AnyStr,
@@ -91,12 +139,59 @@ class Cryptographer:
             cleartext = cleartext.encode("utf8")
         # Encrypt the data
         ciphertext, encrypted_dek, nonce = await self._encrypt(kek_name, cleartext)
-        # Build the metadata for this object.
+        hashcode = hashlib.sha256(cleartext).hexdigest()
+        metadata = await self._build_metadata(
+            kek_name, signing_key_name, encrypted_dek, nonce, hashcode
+        )
+        return hashcode, ciphertext, metadata
+
+    async def encrypt_file(
+        self,
+        cleartext: BinaryIO,
+        ciphertext: BinaryIO,
+        kek_name: str,
+        signing_key_name: str,
+    ) -> Tuple[str, dict]:
+        """Encrypt the contents of `cleartext` into `ciphertext`, a chunk at a time.
+
+        The output is the same as `encrypt`, but we never hold the whole file in memory.
+
+        Args:
+            cleartext: A binary file to read the data to encrypt from.
+            ciphertext: A binary file to write the encrypted data to.
+            kek_name: The name of the target KEK in GC KMS.
+            signing_key_name: The name used to determine the signing key for encryption.
+
+        Returns:
+            hashcode: A sha256 fingerprint for this data.
+            metadata: Encryption metadata required for decryption.
+        """
+        cipher, encrypted_dek, nonce = await self._get_new_cipher(kek_name)
+        digest = hashlib.sha256()
+        while chunk := cleartext.read(encrypt_chunk_byte_length):
+            digest.update(chunk)
+            ciphertext.write(cipher.encrypt(chunk))
+        # N.B. - This is for compatibility with AES-GCM in Go
+        #   which automatically appends the MAC tag to the end of the ciphertext.
+        ciphertext.write(cipher.digest())
+        hashcode = digest.hexdigest()
+        metadata = await self._build_metadata(
+            kek_name, signing_key_name, encrypted_dek, nonce, hashcode
+        )
+        return hashcode, metadata
+
+    async def _build_metadata(
+        self,
+        kek_name: str,
+        signing_key_name: str,
+        encrypted_dek: bytes,
+        nonce: bytes,
+        hashcode: str,
+    ) -> dict:
         # N.B. - This rstrip for compatibility with `base64.RawStdEncoding` in Go
         #   which uses no pad.
         unpadded_dek = base64.b64encode(encrypted_dek).rstrip(b"=").decode()
         unpadded_nonce = base64.b64encode(nonce).rstrip(b"=").decode()
-        hashcode = hashlib.sha256(cleartext).hexdigest()
         metadata = {
             kek_metadata_key_name: kek_name,
             dek_metadata_key_name: unpadded_dek,
@@ -110,7 +205,7 @@ class Cryptographer:
         #   which uses no pad.
         unpadded_signature = base64.b64encode(signature).rstrip(b"=").decode()
         metadata[sig_metadata_key_name] = unpadded_signature
-        return hashcode, ciphertext, metadata
+        return metadata
 
     @staticmethod
     def _fingerprint_metadata(metadata: dict) -> bytes:
@@ -132,18 +227,24 @@ class Cryptographer:
     async def _encrypt(
         self, kek_name: str, cleartext: AnyStr
     ) -> [Tuple[bytes, bytes, bytes]]:
-        nonce = secrets.token_bytes(nonce_byte_length)
-        dek = secrets.token_bytes(dek_byte_length)
-
-        cipher = AES.new(dek, AES.MODE_GCM, nonce=nonce, mac_len=auth_tag_byte_length)
+        cipher, encrypted_dek, nonce = await self._get_new_cipher(kek_name)
         ciphertext, tag = cipher.encrypt_and_digest(cleartext)
         # N.B. - This is for compatibility with AES-GCM in Go
         #   which automatically appends the MAC tag to the end of the ciphertext.
         ciphertext += tag
+
+        return ciphertext, encrypted_dek, nonce
+
+    async def _get_new_cipher(self, kek_name: str):
+        """Generate a new DEK and nonce, and encrypt the DEK with our KEK."""
+        nonce = secrets.token_bytes(nonce_byte_length)
+        dek = secrets.token_bytes(dek_byte_length)
+
+        cipher = AES.new(dek, AES.MODE_GCM, nonce=nonce, mac_len=auth_tag_byte_length)
         response = await self.kms.encrypt(request={"name": kek_name, "plaintext": dek})
         encrypted_dek = response.ciphertext
 
-        return ciphertext, encrypted_dek, nonce
+        return cipher, encrypted_dek, nonce
 
     @staticmethod
     def _pad_encoded_value(value):
@@ -182,15 +283,17 @@ class Cryptographer:
 
         return metadata[kek_metadata_key_name], encrypted_dek, nonce, hashcode
 
-    async def _decrypt(self, key_name, encrypted_dek, nonce, ciphertext_and_tag):
+    async def _get_cipher(self, key_name, encrypted_dek, nonce):
         response = await self.kms.decrypt(
             request={"name": key_name, "ciphertext": encrypted_dek}
         )
+        dek = response.plaintext
+        return AES.new(dek, AES.MODE_GCM, nonce=nonce, mac_len=auth_tag_byte_length)
 
+    async def _decrypt(self, key_name, encrypted_dek, nonce, ciphertext_and_tag):
         auth_tag = ciphertext_and_tag[len(ciphertext_and_tag) - auth_tag_byte_length :]
         ciphertext = ciphertext_and_tag[
             : len(ciphertext_and_tag) - auth_tag_byte_length
         ]
-        dek = response.plaintext
-        cipher = AES.new(dek, AES.MODE_GCM, nonce=nonce, mac_len=auth_tag_byte_length)
+        cipher = await self._get_cipher(key_name, encrypted_dek, nonce)
         return cipher.decrypt_and_verify(ciphertext, auth_tag)
@@ -1,14 +1,18 @@
 import asyncio
 import os
+import shutil
 from collections import defaultdict
 from concurrent.futures.thread import ThreadPoolExecutor
 from functools import partial
-from typing import AnyStr, Optional
+from typing import AnyStr, AsyncIterator, BinaryIO, Optional
 
 from google.cloud import storage
 
 import constants
 
+# The size of each ranged read when streaming a blob.
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class AsyncBlob:
     """An asyncio wrapper object around a `google.cloud.storage.Blob`.
@@ -35,6 +39,33 @@ class AsyncBlob:
         loop = loop or asyncio.get_event_loop()
         return await loop.run_in_executor(self.pool, self.blob.download_as_bytes)
 
+    async def iterchunks(
+        self,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        loop: asyncio.AbstractEventLoop = None,
+    ) -> AsyncIterator[bytes]:
+        """Download the data located in this Blob as a series of ranged reads.
+
+        Every read is pinned to the generation we fetched, so an object which is
+        overwritten mid-stream will fail rather than yield a mix of both versions.
+        """
+        loop = loop or asyncio.get_event_loop()
+        size, start = self.blob.size or 0, 0
+        while start < size:
+            download = partial(
+                self.blob.download_as_bytes,
+                start=start,
+                # N.B. - the end of the range is inclusive.
+                end=min(start + chunk_size, size) - 1,
+                if_generation_match=self.blob.generation,
+            )
+            chunk = await loop.run_in_executor(self.pool, download)
+            if not chunk:
+                break
+            start += len(chunk)
+            yield chunk
+
     async def upload(
         self,
         data: AnyStr,
@@ -49,6 +80,27 @@ class AsyncBlob:
         )
         await loop.run_in_executor(self.pool, upload)
 
+    async def upload_file(
+        self,
+        file: BinaryIO,
+        *,
+        content_type: str = "text/plain",
+        loop: asyncio.AbstractEventLoop = None,
+    ):
+        """Upload the contents of this file into this Blob asynchronously.
+
+        Large files are sent in chunks with a resumable upload, rather than read into
+        memory.
+        """
+        loop = loop or asyncio.get_event_loop()
+        upload = partial(
+            self.blob.upload_from_file,
+            file,
+            rewind=True,
+            content_type=content_type,
+        )
+        await loop.run_in_executor(self.pool, upload)
+
 
 class Storage:
     """A simple crud client for fetching or saving a blob in GCS."""
@@ -88,6 +140,23 @@ class Storage:
         async_blob = AsyncBlob(blob, pool=self.pool)
         await async_blob.upload(data=data, content_type=content_type, loop=loop)
 
+    async def save_blob_from_file(
+        self,
+        file: BinaryIO,
+        name: str,
+        bucket_name: str,
+        *,
+        content_type: str = "text/plain",
+        **metadata,
+    ):
+        """Save a blob to GCS with the contents of the given file."""
+        loop = asyncio.get_event_loop()
+        bucket: storage.Bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(name)
+        blob.metadata = metadata
+        async_blob = AsyncBlob(blob, pool=self.pool)
+        await async_blob.upload_file(file, content_type=content_type, loop=loop)
+
 
 FIXTURES = constants.PROJECT_DIR / ".storage"
 
@@ -110,6 +179,21 @@ class LocalBlob:
             return path.read_bytes()
         return None
 
+    @property
+    def size(self) -> Optional[int]:
+        path = FIXTURES / self.bucket / self.name
+        if path.exists():
+            return path.stat().st_size
+        return None
+
+    def _read_chunk(self, start: int, size: int) -> bytes:
+        path = FIXTURES / self.bucket / self.name
+        if not path.exists():
+            return b""
+        with path.open("rb") as f:
+            f.seek(start)
+            return f.read(size)
+
     def _write(self, data: AnyStr):
         dir = FIXTURES / self.bucket
         dir.mkdir(parents=True, exist_ok=True)
@@ -121,10 +205,31 @@ class LocalBlob:
         path = dir / self.name
         path.write_bytes(data) if isinstance(data, bytes) else path.write_text(data)
 
+    def _write_file(self, file: BinaryIO):
+        path = FIXTURES / self.bucket / self.name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file.seek(0)
+        with path.open("wb") as f:
+            shutil.copyfileobj(file, f)
+
     async def download(self, *, loop: asyncio.AbstractEventLoop = None):
         loop = loop or asyncio.get_event_loop()
         return await loop.run_in_executor(self.pool, self._read)
 
+    async def iterchunks(
+        self,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        loop: asyncio.AbstractEventLoop = None,
+    ) -> AsyncIterator[bytes]:
+        loop = loop or asyncio.get_event_loop()
+        start = 0
+        while chunk := await loop.run_in_executor(
+            self.pool, self._read_chunk, start, chunk_size
+        ):
+            start += len(chunk)
+            yield chunk
+
     async def upload(
         self,
         data: AnyStr,
@@ -135,6 +240,16 @@ class LocalBlob:
         loop = loop or asyncio.get_event_loop()
         return await loop.run_in_executor(self.pool, self._write, data)
 
+    async def upload_file(
+        self,
+        file: BinaryIO,
+        *,
+        content_type: str = "text/plain",
+        loop: asyncio.AbstractEventLoop = None,
+    ):
+        loop = loop or asyncio.get_event_loop()
+        return await loop.run_in_executor(self.pool, self._write_file, file)
+
 
 class LocalStorage:
     """A local mock for running in dev environments."""
@@ -162,3 +277,16 @@ class LocalStorage:
         blob = await self.get_blob(name, bucket_name)
         blob.metadata = metadata
         await blob.upload(data, content_type=content_type)
+
+    async def save_blob_from_file(
+        self,
+        file: BinaryIO,
+        name: str,
+        bucket_name: str,
+        *,
+        content_type: str = "text/plain",
+        **metadata,
+    ):
+        blob = await self.get_blob(name, bucket_name)
+        blob.metadata = metadata
+        await blob.upload_file(file, content_type=content_type)
@@ -132,6 +132,20 @@ class FileParseResults:
                 )
         return len(results)
 
+    async def copy_file_parse_errors(
+        self,
+        *,
+        errors: Iterable[db_model.FileParseError],
+    ) -> int:
+        return await self.bulk_persist_file_parse_errors(errors=errors)
+
+    async def copy_file_parse_results(
+        self,
+        *,
+        results: Iterable[db_model.FileParseResult] = (),
+    ) -> int:
+        return await self.bulk_persist_file_parse_results(results=results)
+
     def _iterdump(self, models: Iterable[T]) -> Iterator[T]:
         kvs = self._get_kvs
         yield from (kvs(m) for m in models)
@@ -23,6 +23,13 @@ class ClientSpecificCaller(Generic[_ResponseT]):
     service: str
     resource: str
     timeout: int = 5
+    # Connections are kept alive and shared between calls, so we only pay for
+    #   DNS, TCP and TLS setup when the pool needs a new connection.
+    limit: int = 100
+    limit_per_host: int = 32
+    keepalive_timeout: int = 60
+    dns_cache_ttl: int = 300
+    connector: aiohttp.TCPConnector | None = None
 
     def __init__(self, url: str):
         self.url = url
@@ -30,6 +37,24 @@ class ClientSpecificCaller(Generic[_ResponseT]):
         self.service = parsed.hostname
         self.resource = parsed.path
 
+    async def initialize(self):
+        if not self.open:
+            self.connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+
+    async def close(self):
+        if self.open:
+            await self.connector.close()
+        self.connector = None
+
+    @property
+    def open(self) -> bool:
+        return self.connector is not None and not self.connector.closed
+
     async def call(self, request: ClientSpecificRequest) -> _ResponseT:
         with ddtrace.tracer.trace(
             "client_specific_call",
@@ -41,15 +66,23 @@ class ClientSpecificCaller(Generic[_ResponseT]):
             headers = await self._get_headers()
             async with self.session(headers=headers) as session:
                 response = await self._do_request(session=session, payload=payload)
-                if not response.ok:
-                    return await self._handle_client_error(
-                        request=request, response=response
-                    )
-                data = await self._extract_body(response)
-                return self._do_validate(body=data, response=response)
+                try:
+                    if not response.ok:
+                        return await self._handle_client_error(
+                            request=request, response=response
+                        )
+                    data = await self._extract_body(response)
+                    return self._do_validate(body=data, response=response)
+                finally:
+                    response.release()
 
     def session(self, *, headers: dict = None) -> aiohttp.ClientSession:
+        # Sessions are cheap; the connector holds the pool, so it outlives them.
+        #   The pool is only opened by `initialize` at startup. Until then, each call
+        #   gets a session with a connector of its own.
         return aiohttp.ClientSession(
+            connector=self.connector if self.open else None,
+            connector_owner=not self.open,
             headers=headers,
             timeout=aiohttp.ClientTimeout(total=self.timeout),
             json_serialize=translate.dump,
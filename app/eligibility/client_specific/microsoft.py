@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import os
+import time
 from typing import Optional, Tuple, TypedDict
 
 import aiohttp
@@ -106,6 +107,16 @@ def _get_certificate_path(msft_settings: Microsoft) -> str:
 
 
 class MicrosoftSpecificCaller(ClientSpecificCaller[MicrosoftResponse]):
+    # Tokens are refreshed in the background this long before they expire. msal only
+    #   considers a cached token stale within five minutes of expiry, so stay inside that.
+    token_refresh_margin: int = 240
+    # We only refresh on the request path if the background refresh has fallen behind.
+    token_expiry_margin: int = 30
+    token_retry_delay: int = 10
+    _token: str | None = None
+    _token_expires_at: float = 0.0
+    _refresher: asyncio.Task | None = None
+
     def __init__(self):
         msft_settings = settings.Microsoft()
         super().__init__(url=msft_settings.url)
@@ -126,7 +137,27 @@ class MicrosoftSpecificCaller(ClientSpecificCaller[MicrosoftResponse]):
             MicrosoftResponse
         ] = typic.get_constraints(MicrosoftResponse)
 
+    async def initialize(self):
+        await super().initialize()
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_token_periodically())
+
+    async def close(self):
+        if self._refresher is not None:
+            self._refresher.cancel()
+            await asyncio.gather(self._refresher, return_exceptions=True)
+            self._refresher = None
+        await super().close()
+
     async def get_token(self) -> str:
+        if (
+            self._token is not None
+            and time.monotonic() < self._token_expires_at - self.token_expiry_margin
+        ):
+            return self._token
+        return await self.refresh_token()
+
+    async def refresh_token(self) -> str:
         # Firstly, looks up a token from cache
         # Since we are looking for token for the current app, NOT for an end user,
         # notice we give account parameter as None.
@@ -148,9 +179,33 @@ class MicrosoftSpecificCaller(ClientSpecificCaller[MicrosoftResponse]):
                 context=data,
             )
         logger.info("Acquired authentication token.")
-        return data[self._TOKEN_KEY]
+        self._token = data[self._TOKEN_KEY]
+        self._token_expires_at = time.monotonic() + int(
+            data.get(self._EXPIRES_IN_KEY) or 0
+        )
+        return self._token
+
+    async def _refresh_token_periodically(self):
+        while True:
+            try:
+                await self.refresh_token()
+                delay = max(
+                    self._token_expires_at
+                    - self.token_refresh_margin
+                    - time.monotonic(),
+                    self.token_retry_delay,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to refresh authentication token.",
+                    error=str(e),
+                    retry_in=self.token_retry_delay,
+                )
+                delay = self.token_retry_delay
+            await asyncio.sleep(delay)
 
     _TOKEN_KEY = "access_token"
+    _EXPIRES_IN_KEY = "expires_in"
 
     async def _get_headers(self) -> dict[str, str]:
         token = await self.get_token()
@@ -246,12 +246,12 @@ def get_client_specific_protocol(
 
 async def initialize():
     for protocol in _IMPL_TO_CHECK_TYPE.values():
-        protocol()
+        await protocol().caller.initialize()
 
 
 async def teardown():
-    # no-op
-    ...
+    for protocol in _IMPL_TO_CHECK_TYPE.values():
+        await protocol().caller.close()
 
 
 _IMPL_TO_CHECK_TYPE: dict[
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+from typing import Dict, Optional
+
+import asyncpg
+from mmlib.ops import log
+
+from db import model as db_model
+from db.clients import configuration_client, postgres_connector
+
+logger = log.getLogger(__name__)
+
+# The channel `eligibility.notify_configuration_change()` notifies with an organization ID.
+CHANNEL = "configuration_changed"
+# How often, in seconds, we look for configurations which changed since our last look.
+#   This bounds our staleness if we miss a notification.
+REFRESH_INTERVAL = 60
+# How far, in seconds, we look back past the newest change we've seen. A row's
+#   `updated_at` is set when its transaction starts, so it may commit after a newer one.
+REFRESH_OVERLAP = 60
+
+
+class ConfigurationCache:
+    """An in-process cache of every organization's configuration.
+
+    Once initialized, the cache holds all configurations (there are only a few thousand),
+    so an organization check needs no round-trip. We stay current in two ways:
+
+        1. We LISTEN for `configuration_changed`, which is sent when a configuration row
+           is committed, and drop the organization so the next read fetches it.
+        2. We periodically fetch the configurations updated since our last refresh, in
+           case we missed a notification (e.g., while reconnecting).
+
+    Until initialized, reads go straight to the database.
+    """
+
+    __slots__ = (
+        "configurations",
+        "by_organization",
+        "updated_at",
+        "listener",
+        "refresher",
+        "initialized",
+    )
+
+    def __init__(
+        self, configurations: configuration_client.Configurations | None = None
+    ):
+        self.configurations = configurations or configuration_client.Configurations()
+        self.by_organization: Dict[int, db_model.Configuration] = {}
+        self.updated_at: Optional[datetime.datetime] = None
+        self.listener: Optional[asyncpg.Connection] = None
+        self.refresher: Optional[asyncio.Task] = None
+        self.initialized = False
+
+    def __repr__(self):
+        size, initialized = len(self.by_organization), self.initialized
+        return f"<{self.__class__.__name__} {size=} {initialized=}>"
+
+    async def initialize(self):
+        if self.initialized:
+            return
+        await self.listen()
+        await self.load()
+        self.refresher = asyncio.create_task(self._refresh_periodically())
+        self.initialized = True
+
+    async def close(self):
+        self.initialized = False
+        if self.refresher is not None:
+            self.refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.refresher
+            self.refresher = None
+        await self.unlisten()
+        self.clear()
+
+    async def get(
+        self,
+        organization_id: int,
+        *,
+        configs: configuration_client.Configurations | None = None,
+    ) -> Optional[db_model.Configuration]:
+        """Get an organization's configuration, reading through to the database."""
+        configuration = self.by_organization.get(organization_id)
+        if configuration is not None:
+            return configuration
+        configuration = await (configs or self.configurations).get(organization_id)
+        if self.initialized and configuration is not None:
+            self._put(configuration)
+        return configuration
+
+    def invalidate(self, organization_id: int):
+        self.by_organization.pop(organization_id, None)
+
+    def clear(self):
+        self.by_organization.clear()
+        self.updated_at = None
+
+    async def load(self):
+        """Replace the cache with every configuration."""
+        configurations = await self.configurations.all()
+        self.clear()
+        for configuration in configurations:
+            self._put(configuration)
+        logger.info("Loaded organization configurations.", cache=self)
+
+    async def refresh(self):
+        """Fetch the configurations which have changed since we last looked."""
+        if self.updated_at is None:
+            return await self.load()
+        since = self.updated_at - datetime.timedelta(seconds=REFRESH_OVERLAP)
+        for configuration in await self.configurations.get_updated_since(since):
+            self._put(configuration)
+
+    async def listen(self):
+        dsn = postgres_connector.cached_connectors()["main"].dsn
+        try:
+            self.listener = await asyncpg.connect(dsn)
+            await self.listener.add_listener(CHANNEL, self._on_notification)
+        except Exception as e:
+            # We'll try again on our next refresh.
+            logger.warning(
+                "Couldn't listen for configuration changes.",
+                error=e.__class__.__name__,
+                exception=str(e),
+            )
+            await self.unlisten()
+
+    async def unlisten(self):
+        listener, self.listener = self.listener, None
+        if listener is None or listener.is_closed():
+            return
+        with contextlib.suppress(Exception):
+            await listener.close(timeout=5)
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ):
+        try:
+            self.invalidate(int(payload))
+        except ValueError:
+            logger.warning("Got an unexpected configuration change.", payload=payload)
+
+    def _put(self, configuration: db_model.Configuration):
+        self.by_organization[configuration.organization_id] = configuration
+        updated_at = configuration.updated_at
+        if updated_at is not None and (
+            self.updated_at is None or updated_at > self.updated_at
+        ):
+            self.updated_at = updated_at
+
+    async def _refresh_periodically(self):
+        while True:
+            await asyncio.sleep(REFRESH_INTERVAL)
+            try:
+                if self.listener is None or self.listener.is_closed():
+                    # We may have missed deletions while we weren't listening.
+                    await self.listen()
+                    await self.load()
+                else:
+                    await self.refresh()
+            except Exception as e:
+                logger.warning(
+                    "Couldn't refresh organization configurations.",
+                    error=e.__class__.__name__,
+                    exception=str(e),
+                )
+
+
+_CACHE: ConfigurationCache | None = None
+
+
+def cache() -> ConfigurationCache:
+    """Get the process-wide configuration cache."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ConfigurationCache()
+    return _CACHE
@@ -88,3 +88,16 @@ class E9yFeatureFlag(str, enum.Enum):
     )
     E9Y_DISABLE_WRITE = "e9y-disable-write"
     RELEASE_OPTUM_FILE_LOGGING_SWITCH = "release-optum-file-logging-switch"
+    RELEASE_COPY_STAGING_WRITES_ENABLED_ORGS = (
+        "release-eligibility-copy-staging-writes-enabled-orgs"
+    )
+    RELEASE_E9Y_2_SPECULATIVE_READS = "release-eligibility-2-speculative-reads"
+    RELEASE_SHARDED_PARSE_ENABLED_ORGS = (
+        "release-eligibility-sharded-parse-enabled-orgs"
+    )
+    RELEASE_HASH_PREFILTER_ENABLED_ORGS = (
+        "release-eligibility-hash-prefilter-enabled-orgs"
+    )
+    RELEASE_CHUNKED_FLUSH_ENABLED_ORGS = (
+        "release-eligibility-chunked-flush-enabled-orgs"
+    )
@@ -1,6 +1,16 @@
 import dataclasses
 from datetime import date
-from typing import Dict, Mapping, Sequence, TypedDict, Union
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 import typic
 
@@ -10,6 +20,7 @@ __all__ = (
     "ProcessedRecords",
     "ParsedFileRecords",
     "FileActions",
+    "KnownHashes",
     "RowT",
 )
 
@@ -40,3 +51,40 @@ class ParsedFileRecords:
     errors: list[model.FileParseError] = dataclasses.field(default_factory=list)
     valid: list[model.FileParseResult] = dataclasses.field(default_factory=list)
     missing: list[model.Member] = dataclasses.field(default_factory=list)
+
+
+class KnownHashes:
+    """The hashes of the current records of an organization's members, for a file's rows.
+
+    Only the leading 128 bits of each hash are kept, as an int in a frozenset, which
+    is a fraction of the size of the hash strings.
+    """
+
+    __slots__ = ("_hashes",)
+
+    def __init__(self, hashes: Iterable[str] = ()):
+        self._hashes: FrozenSet[int] = frozenset(map(self._key, hashes))
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} size={len(self)}>"
+
+    def split(
+        self, valid: Iterable[model.FileParseResult]
+    ) -> Tuple[List[model.FileParseResult], List[str]]:
+        """Split rows into those we need to stage and the hashes of those unchanged."""
+        changed, seen = [], []
+        hashes = self._hashes
+        for result in valid:
+            if result.hash_value and self._key(result.hash_value) in hashes:
+                seen.append(result.hash_value)
+            else:
+                changed.append(result)
+        return changed, seen
+
+    @staticmethod
+    def _key(hash_value: str) -> int:
+        # Hash values are the hex digest followed by the organization ID.
+        return int(hash_value[:32], 16)
@@ -25,7 +25,10 @@ class ParsedRecordsAbstractRepository(Protocol):
 
     @abstractmethod
     async def persist(
-        self, parsed_records: model.ParsedRecords, file: File
+        self,
+        parsed_records: model.ParsedRecords,
+        file: File,
+        known: model.KnownHashes | None = None,
     ) -> model.ProcessedRecords:
         """
         Top-level function call to persist the records contained within a ParsedRecords instance
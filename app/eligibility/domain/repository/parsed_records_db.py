@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-from typing import List, Optional, Set
+from typing import Iterable, List, Optional, Set
 
 import ddtrace
 import structlog
+from mmlib.ops import stats
 
+import constants
 from app.eligibility.domain import model
 from app.eligibility.domain.repository import ParsedRecordsAbstractRepository
 from app.tasks import pre_verify
+from app.utils import feature_flag, utils
 from db import model as db_model
 from db.clients.configuration_client import Configurations
 from db.clients.file_client import Files
@@ -24,6 +28,12 @@ __all__ = "ParsedRecordsDatabaseRepository"
 logger = structlog.getLogger(__name__)
 
 PERSIST_ALL_THRESHOLD = 1000_000
+# The number of members we'll move out of the staging tables per transaction, when
+#   flushing a file in chunks.
+FLUSH_CHUNK_SIZE = 50_000
+# The number of organizations in a data-provider file we'll flush at once, each on
+#   its own connection.
+FLUSH_CONCURRENCY = 4
 
 
 class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
@@ -34,6 +44,7 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
         "member_versioned_client",
         "verification_client",
         "config_client",
+        "flush_concurrency",
     )
 
     def __init__(
@@ -45,8 +56,10 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
         file_client: Files | None = None,
         config_client: Configurations | None = None,
         use_tmp: bool | None = False,
+        flush_concurrency: int = FLUSH_CONCURRENCY,
     ):
         self._use_tmp: bool = use_tmp
+        self.flush_concurrency = max(flush_concurrency, 1)
         self.fpr_client = fpr_client or FileParseResults()
         self.member_client = member_client or Members()
         self.member_versioned_client = member_versioned_client or MembersVersioned()
@@ -56,7 +69,10 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
 
     @ddtrace.tracer.wrap()
     async def persist(
-        self, parsed_records: model.ParsedFileRecords, file: db_model.File
+        self,
+        parsed_records: model.ParsedFileRecords,
+        file: db_model.File,
+        known: model.KnownHashes | None = None,
     ) -> model.ProcessedRecords:
         """
         Top-level function call to persist records and errors in postgres.
@@ -64,6 +80,8 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
         Args:
             parsed_records:
             file:
+            known: The hashes of existing members. Valid records which are unchanged
+                from an existing member are recorded as seen, rather than staged.
 
         Returns: model.ProcessedRecords
 
@@ -76,17 +94,21 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
                 count=len(parsed_records.errors),
             )
             processed.errors = await self.persist_errors(
-                errors=parsed_records.errors, file=file.id
+                errors=parsed_records.errors, file=file
             )
 
-        if parsed_records.valid:
+        valid = parsed_records.valid
+        if valid and known and not self._use_tmp:
+            valid, seen = known.split(valid)
+            if seen:
+                processed.valid += await self.persist_seen(hash_values=seen, file=file)
+
+        if valid:
             logger.info(
                 "Persisting records to staging tables in DB",
-                count=len(parsed_records.valid),
-            )
-            processed.valid = await self.persist_valid(
-                valid=parsed_records.valid, file=file.id
+                count=len(valid),
             )
+            processed.valid += await self.persist_valid(valid=valid, file=file)
 
         return processed
 
@@ -177,6 +199,8 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
             return await self.fpr_client.tmp_bulk_persist_file_parse_errors(
                 errors=errors
             )
+        elif self._use_copy(file):
+            return await self.fpr_client.copy_file_parse_errors(errors=errors)
         else:
             return await self.fpr_client.bulk_persist_file_parse_errors(errors=errors)
 
@@ -198,9 +222,60 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
             return await self.fpr_client.tmp_bulk_persist_file_parse_results(
                 results=valid
             )
+        elif self._use_copy(file):
+            return await self.fpr_client.copy_file_parse_results(results=valid)
         else:
             return await self.fpr_client.bulk_persist_file_parse_results(results=valid)
 
+    @ddtrace.tracer.wrap()
+    async def persist_seen(
+        self, hash_values: Iterable[str], file: db_model.File
+    ) -> int:
+        """
+        Record the existing members whose rows were unchanged in the file, in place of
+        staging the rows. Flushing the file moves these members to it.
+
+        Args:
+            hash_values: The hashes of the unchanged rows.
+            file:
+
+        Returns: int
+
+        """
+        return await self.fpr_client.persist_file_parse_seen(
+            file_id=file.id, hash_values=hash_values, hash_version=utils.HASH_VERSION
+        )
+
+    @ddtrace.tracer.wrap()
+    async def get_known_hashes(self, file: db_model.File) -> model.KnownHashes:
+        """
+        Load the hashes of the current records of the members of the organizations in
+        this file.
+
+        Args:
+            file:
+
+        Returns: model.KnownHashes
+
+        """
+        organization_ids: Set[int] = await self.get_organization_ids_for_file(file=file)
+        records = (
+            await self.member_versioned_client.get_current_hashes_for_organizations(
+                *organization_ids, hash_version=utils.HASH_VERSION
+            )
+        )
+        return model.KnownHashes(r["hash_value"] for r in records)
+
+    @staticmethod
+    def _use_copy(file: db_model.File | None) -> bool:
+        """Whether to stage records for this file with a binary COPY."""
+        return (
+            file is not None
+            and feature_flag.organization_enabled_for_copy_staging_writes(
+                file.organization_id
+            )
+        )
+
     @ddtrace.tracer.wrap()
     async def persist_missing(self, file: db_model.File) -> int:
         """
@@ -218,8 +293,28 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
                 file_id=file.id, organization_id=file.organization_id
             )
 
+        # The two tables are expired independently, so do so concurrently.
+        tasks = [
+            asyncio.create_task(self._persist_missing_versioned(file=file)),
+            asyncio.create_task(
+                self.fpr_client.expire_missing_records_for_file(
+                    file_id=file.id, organization_id=file.organization_id
+                )
+            ),
+        ]
+        try:
+            expired, _ = await asyncio.gather(*tasks)
+        finally:
+            # N.B. - If one fails (or we're cancelled), don't leave the other running
+            #   with its connection after we've returned.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return expired
+
+    async def _persist_missing_versioned(self, file: db_model.File) -> int:
         try:
-            expired = await self.fpr_client.expire_missing_records_for_file_versioned(
+            return await self.fpr_client.expire_missing_records_for_file_versioned(
                 file_id=file.id, organization_id=file.organization_id
             )
         except Exception as e:
@@ -227,25 +322,27 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
                 "[dual-ingest] Exception encountered while expiring file records",
                 error=e,
             )
-        await self.fpr_client.expire_missing_records_for_file(
-            file_id=file.id, organization_id=file.organization_id
-        )
-        return expired
+            return 0
 
     @ddtrace.tracer.wrap()
     async def persist_as_members(self, file: db_model.File) -> int:
+        # Members which were unchanged in this file were never staged, so move them
+        #   to it first, as flushing their staged rows would have.
+        await self._touch_seen_members(file)
+        if feature_flag.organization_enabled_for_chunked_flush(file.organization_id):
+            return await self._persist_members_in_chunks(file)
         # in case file count > than threshold, we persist in smaller batch by file and org
         if file.success_count > PERSIST_ALL_THRESHOLD:
             organization_ids: Set[int] = await self.get_organization_ids_for_file(
                 file=file
             )
-            for organization_id in organization_ids:
-                logger.info(
-                    "Persisting members for file and org",
-                    file_id=file.id,
-                    organization_id=organization_id,
-                )
-                await self._persist_organization_members(file, organization_id)
+            await pre_verify.gather_with_concurrency(
+                self.flush_concurrency,
+                (
+                    self._persist_organization_members(file, organization_id)
+                    for organization_id in organization_ids
+                ),
+            )
         # in case there is missing org, we do a persist all at the end
         logger.info(
             "Persisting remaining members for file",
@@ -253,9 +350,87 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
         )
         return await self._persist_all_as_members(file)
 
+    async def _touch_seen_members(self, file: db_model.File) -> int:
+        """
+        Move the unchanged members we've seen for a file to it in chunks of
+        FLUSH_CHUNK_SIZE members, each in its own transaction, as we flush the rest.
+
+        Args:
+            file:
+
+        Returns: int
+
+        """
+        total = 0
+        while touched := await self.fpr_client.touch_seen_members_for_file(
+            file.id, chunk_size=FLUSH_CHUNK_SIZE
+        ):
+            total += touched
+        logger.info(
+            "Moved unchanged members to file",
+            file_id=file.id,
+            organization_id=file.organization_id,
+            touched=total,
+        )
+        return total
+
+    async def _persist_members_in_chunks(self, file: db_model.File) -> int:
+        """
+        Move the valid records from the temp tables into the member record tables in
+        chunks of FLUSH_CHUNK_SIZE members, each in its own transaction, so we never
+        hold locks on the member tables for the whole file.
+
+        Every chunk removes its records from the temp tables and records the last
+        member it flushed on the file as it commits, so a flush which was interrupted
+        picks up after that member when it's run again.
+
+        Args:
+            file:
+
+        Returns: int
+
+        """
+        total, chunk_num = 0, 0
+        after = await self.file_client.get_flush_checkpoint(file.id)
+        if after:
+            logger.info(
+                "Resuming interrupted flush",
+                file_id=file.id,
+                organization_id=file.organization_id,
+                after=after,
+            )
+        while (
+            chunk := await self.fpr_client.bulk_persist_parsed_records_chunk_for_file_dual_write_hash(
+                file.id, chunk_size=FLUSH_CHUNK_SIZE, after=after
+            )
+        ) is not None:
+            flushed, after = chunk["flushed"], chunk
+            total += flushed
+            chunk_num += 1
+            stats.increment(
+                metric_value=flushed,
+                metric_name="eligibility.process.file_flush.records_flushed",
+                pod_name=constants.POD,
+                tags=[f"organization_id:{file.organization_id}"],
+            )
+            logger.info(
+                "Flushed chunk of members",
+                file_id=file.id,
+                organization_id=file.organization_id,
+                chunk=chunk_num,
+                flushed=flushed,
+                total_flushed=total,
+            )
+        return total
+
     async def _persist_organization_members(
         self, file: db_model.File, organization_id: int
     ) -> None:
+        logger.info(
+            "Persisting members for file and org",
+            file_id=file.id,
+            organization_id=organization_id,
+        )
         return await self.fpr_client.bulk_persist_parsed_records_for_file_and_org_dual_write_hash(
             file.id, organization_id
         )
@@ -352,13 +527,18 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
             file:
         """
         organization_ids: Set[int] = await self.get_organization_ids_for_file(file=file)
-        for org_id in organization_ids:
-            await pre_verify.pre_verify_org(
-                organization_id=org_id,
-                file_id=file.id,
-                members_versioned=self.member_versioned_client,
-                verifications=self.verification_client,
-            )
+        await pre_verify.gather_with_concurrency(
+            self.flush_concurrency,
+            (
+                pre_verify.pre_verify_org(
+                    organization_id=org_id,
+                    file_id=file.id,
+                    members_versioned=self.member_versioned_client,
+                    verifications=self.verification_client,
+                )
+                for org_id in organization_ids
+            ),
+        )
 
     @ddtrace.tracer.wrap()
     async def delete_errors(self, file: db_model.File) -> int:
@@ -392,6 +572,7 @@ class ParsedRecordsDatabaseRepository(ParsedRecordsAbstractRepository):
                 file.id
             )
         else:
+            await self.fpr_client.delete_file_parse_seen_for_files(file.id)
             return await self.fpr_client.delete_file_parse_results_for_files(file.id)
 
     @ddtrace.tracer.wrap()
@@ -157,6 +157,7 @@ async def persist(
     file: File,
     parsed_records: model.ParsedFileRecords,
     db_repository: repository.ParsedRecordsDatabaseRepository,
+    known: model.KnownHashes | None = None,
 ) -> model.ProcessedRecords:
     """
     Orchestrates the persistence for parsed records into temp storage
@@ -165,12 +166,13 @@ async def persist(
         file:
         parsed_records:
         db_repository:
+        known: The hashes of existing members, so unchanged records aren't staged.
 
     Returns:
 
     """
     db_processed: model.ProcessedRecords = await db_repository.persist(
-        parsed_records=parsed_records, file=file
+        parsed_records=parsed_records, file=file, known=known
     )
 
     return db_processed
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import AnyStr, Optional
+import collections
+import contextlib
+import io
+from typing import AnyStr, AsyncIterator, Optional
 
 import ddtrace
 
@@ -43,6 +46,41 @@ class EligibilityFileManager:
         decrypted, metadata = await self.crypto.decrypt(data, metadata)
         return decrypted
 
+    async def stream(
+        self,
+        name: str,
+        bucket_name: str,
+        *,
+        chunk_size: int = gcs.DEFAULT_CHUNK_SIZE,
+    ) -> Optional[AsyncIterator[bytes]]:
+        """Stream the data saved at `name` in the bucket at `bucket_name` in GCS.
+
+        Unlike `get`, the blob is never held in memory as a whole: it is downloaded
+        with ranged reads of `chunk_size` and decrypted chunk-by-chunk.
+        """
+        loop = asyncio.get_event_loop()
+        blob = await self.storage.get_blob(name, bucket_name)
+        if not blob:
+            return None
+        # Add filename and file size to datadog span tags
+        current_span = ddtrace.tracer.current_span()
+
+        if (current_span is not None) and (not isinstance(blob, gcs.LocalBlob)):
+            current_span.set_tag("file.name", blob.name)
+            current_span.set_tag("file.size", blob.size)
+
+        chunks = blob.iterchunks(chunk_size=chunk_size, loop=loop)
+        metadata = blob.metadata or {}
+        if not self.encrypted or not metadata:
+            return chunks
+
+        return self.crypto.decrypt_stream(chunks, metadata)
+
+    async def size(self, name: str, bucket_name: str) -> Optional[int]:
+        """Get the size, in bytes, of the blob saved at `name`, if it exists."""
+        blob = await self.storage.get_blob(name, bucket_name)
+        return blob and blob.size
+
     @ddtrace.tracer.wrap()
     async def put(
         self,
@@ -76,3 +114,87 @@ class EligibilityFileManager:
             )
         else:
             await self.storage.save_blob(data, name, bucket_name)
+
+
+class EligibilityFileStream(io.RawIOBase):
+    """A read-only, file-like view over a stream of chunks from `EligibilityFileManager`.
+
+    The chunks are owned by the event loop, so blocking reads MUST happen in another
+    thread (e.g., via `asyncio.to_thread`). Chunks are pulled on demand, so at most
+    one chunk (plus anything `peek`-ed) is held in memory at a time.
+    """
+
+    def __init__(
+        self, chunks: AsyncIterator[bytes], *, loop: asyncio.AbstractEventLoop = None
+    ):
+        super().__init__()
+        self.chunks = chunks
+        self.loop = loop or asyncio.get_event_loop()
+        self._pending: collections.deque[memoryview] = collections.deque()
+        self._exhausted = False
+
+    def __repr__(self):
+        exhausted = self._exhausted
+        return f"<{self.__class__.__name__} {exhausted=}>"
+
+    def readable(self) -> bool:
+        return True
+
+    async def peek(self, size: int) -> bytes:
+        """Buffer and return (at most) the first `size` bytes without consuming them."""
+        buffered = sum(len(v) for v in self._pending)
+        while buffered < size and (chunk := await self._next_chunk()):
+            self._pending.append(memoryview(chunk))
+            buffered += len(chunk)
+        return b"".join(self._pending)[:size]
+
+    def readinto(self, b) -> int:
+        if not self._pending:
+            if _running_loop() is self.loop:
+                raise RuntimeError(
+                    f"Can't block on {self!r} from within its own event loop."
+                )
+            chunk = asyncio.run_coroutine_threadsafe(
+                self._next_chunk(), self.loop
+            ).result()
+            if not chunk:
+                return 0
+            self._pending.append(memoryview(chunk))
+
+        view = self._pending[0]
+        n = min(len(b), len(view))
+        b[:n] = view[:n]
+        if n == len(view):
+            self._pending.popleft()
+        else:
+            self._pending[0] = view[n:]
+        return n
+
+    async def aclose(self):
+        """Release the underlying stream, whether or not it was read to the end."""
+        self._pending.clear()
+        self._exhausted = True
+        if hasattr(self.chunks, "aclose"):
+            # A worker thread which was abandoned mid-read (e.g., on cancellation)
+            #   may still be waiting on the stream; it'll see EOF instead.
+            with contextlib.suppress(RuntimeError):
+                await self.chunks.aclose()
+        self.close()
+
+    async def _next_chunk(self) -> Optional[bytes]:
+        while not self._exhausted:
+            try:
+                chunk = await self.chunks.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+                break
+            if chunk:
+                return chunk
+        return None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
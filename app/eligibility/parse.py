@@ -5,18 +5,23 @@ client.
 """
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import csv
 import enum
 import functools
 import io
 import itertools
 import re
+import sys
 from typing import (
     AnyStr,
+    BinaryIO,
     Callable,
     ItemsView,
     Iterable,
     Iterator,
+    NamedTuple,
     Protocol,
     Sequence,
     Type,
@@ -59,14 +64,18 @@ class DelimiterError(Exception):
 
 
 class EligibilityCSVReader:
-    """A ReaderProtocol for ingesting CSV data."""
+    """A ReaderProtocol for ingesting CSV data.
+
+    `data` may be the raw contents of a file or a binary, file-like stream of them
+    (e.g., an `EligibilityFileStream`), in which case it is read incrementally.
+    """
 
     __slots__ = "headers", "data", "encoding"
 
     def __init__(
         self,
         headers: model.HeaderMapping,
-        data: AnyStr,
+        data: AnyStr | BinaryIO,
         *,
         encoding: str = "utf-8",
     ):
@@ -115,14 +124,20 @@ class EligibilityCSVReader:
 
         return final_header_list
 
-    def _get_reader(self) -> csv.DictReader:
-        buffer = (
-            io.TextIOWrapper(io.BytesIO(self.data), encoding=self.encoding)
-            if isinstance(self.data, bytes)
-            else io.StringIO(self.data)
-        )
+    def _get_buffer(self) -> io.TextIOBase:
+        if isinstance(self.data, bytes):
+            return io.TextIOWrapper(io.BytesIO(self.data), encoding=self.encoding)
+        if isinstance(self.data, str):
+            return io.StringIO(self.data)
+        stream = self.data
+        if isinstance(stream, io.RawIOBase):
+            stream = io.BufferedReader(stream)
+        return io.TextIOWrapper(stream, encoding=self.encoding)
+
+    @staticmethod
+    def _sniff(header_line: str) -> Type[csv.Dialect]:
         try:
-            dialect = csv.Sniffer().sniff(buffer.readline(), delimiters=",\t")
+            return csv.Sniffer().sniff(header_line, delimiters=",\t")
         except Exception:
             logger.error(
                 "Error in processing file- non-standard delimiter used for csv"
@@ -133,14 +148,58 @@ class EligibilityCSVReader:
                 tags=["eligibility:error"],
             )
             raise DelimiterError
-        buffer.seek(0)
-        reader = csv.DictReader(buffer, restkey=_EXTRA_HEADER, dialect=dialect)
+
+    def _get_reader(self) -> csv.DictReader:
+        buffer = self._get_buffer()
+        # N.B. - Streams can't be rewound, so we hold on to the header line we sniff
+        #   and chain it back in front of the rest of the data.
+        header_line = buffer.readline()
+        dialect = self._sniff(header_line)
+        reader = csv.DictReader(
+            itertools.chain((header_line,), buffer),
+            restkey=_EXTRA_HEADER,
+            dialect=dialect,
+        )
         reader.fieldnames = self._remap_headers(reader.fieldnames)
         return reader
 
     def __iter__(self) -> Iterator[dict]:
         yield from self._get_reader()
 
+    def shards(self, size: int) -> Iterator[str]:
+        """Split the data into self-contained CSV documents of up to `size` records.
+
+        Each shard is prefixed with the header record, so it may be read on its own.
+        Records are only split on line breaks which fall outside a quoted field.
+        """
+        buffer = self._get_buffer()
+        header_line = buffer.readline()
+        dialect = self._sniff(header_line)
+        records = _iter_records(
+            itertools.chain((header_line,), buffer),
+            quotechar=dialect.quotechar or '"',
+        )
+        header = next(records, None)
+        if header is None:
+            return
+        for chunk in chunker(records, size):
+            yield header + "".join(chunk)
+
+
+def _iter_records(lines: Iterable[str], *, quotechar: str) -> Iterator[str]:
+    # A line break inside a quoted field is part of the field, not the end of the
+    #   record. Escaped quotes are doubled, so they never flip the parity of the count.
+    record = []
+    quoted = False
+    for line in lines:
+        record.append(line)
+        quoted ^= line.count(quotechar) % 2 == 1
+        if not quoted:
+            yield "".join(record)
+            record.clear()
+    if record:
+        yield "".join(record)
+
 
 class EligibilityFileParser:
     """The Core API for transformation and validation of an eligibility file.
@@ -164,6 +223,7 @@ class EligibilityFileParser:
         "reader",
         "logged_file_without_dob",
         "parse_line_no",
+        "optum_file_logging_enabled",
     )
 
     CONVERTERS_BY_KEY = {
@@ -204,11 +264,12 @@ class EligibilityFileParser:
         file: model.File,
         configuration: model.Configuration,
         headers: model.HeaderMapping,
-        data: AnyStr,
+        data: AnyStr | BinaryIO,
         external_id_mappings: dict = {},
         custom_attributes: dict = {},
         *,
         reader_cls: Type[ReaderProtocolT] = EligibilityCSVReader,
+        optum_file_logging_enabled: bool | None = None,
     ):
         self.file = file
         self.configuration = configuration
@@ -226,6 +287,8 @@ class EligibilityFileParser:
         self.reader = reader_cls(self.headers, self.data, encoding=self.file.encoding)
         self.logged_file_without_dob = set()
         self.parse_line_no = 0
+        # Pinned when parsing in a separate process, where we can't evaluate flags.
+        self.optum_file_logging_enabled = optum_file_logging_enabled
 
     def _is_optum_provider(self):
         return (
@@ -233,6 +296,11 @@ class EligibilityFileParser:
             and self.configuration.directory_name.startswith("optum")
         )
 
+    def _is_optum_file_logging_enabled(self) -> bool:
+        if self.optum_file_logging_enabled is None:
+            return feature_flag.is_optum_file_logging_enabled()
+        return self.optum_file_logging_enabled
+
     def _get_parser(self) -> Callable:  # noqa: C901
         # The main reason for the factory function is pinning all of these values to
         #   the local function namespace. This is useless in normal circumstances,
@@ -314,7 +382,7 @@ class EligibilityFileParser:
                     # for optum file, check whether we want to log the client_id errors
                     if (
                         self._is_optum_provider()
-                        and not feature_flag.is_optum_file_logging_enabled()
+                        and not self._is_optum_file_logging_enabled()
                     ):
                         stats.increment(
                             metric_name="eligibility.process.file_parse.client_id_errors",
@@ -544,6 +612,83 @@ class EligibilityFileParser:
                     valid.append(typic.transmute(model.FileParseResult, parsed))
             yield ParsedFileRecords(errors=errors, valid=valid)
 
+    def parse_sharded(
+        self,
+        executor: concurrent.futures.Executor,
+        *,
+        batch_size: int = 10_000,
+        prefetch: int = 4,
+    ) -> Iterator[ParsedFileRecords]:
+        """Parse shards of batch_size records across the workers of `executor`.
+
+        Batches are yielded in file order, just as with `parse`, and each record's
+        `parse_line_no` is its position in the whole file, not in its shard.
+
+        Args:
+            executor: The (process) pool to parse shards in.
+            batch_size: The number of records in each shard.
+            prefetch: The number of shards we'll have in flight at once.
+
+        Returns:
+            Iterator[ParsedFileRecords]
+        """
+        optum_file_logging_enabled = self._is_optum_file_logging_enabled()
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+        try:
+            for data in self.reader.shards(batch_size):
+                shard = ParseShard(
+                    file=self.file,
+                    configuration=self.configuration,
+                    headers=self.headers,
+                    data=data,
+                    external_id_mappings=self.external_id_mappings,
+                    custom_attributes=self.custom_attributes,
+                    optum_file_logging_enabled=optum_file_logging_enabled,
+                )
+                pending.append(executor.submit(_parse_shard, shard))
+                if len(pending) >= prefetch:
+                    yield self._renumber(pending.popleft().result())
+            while pending:
+                yield self._renumber(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _renumber(self, batch: ParsedFileRecords) -> ParsedFileRecords:
+        # Shards are numbered from 1, offset them by the records which came before.
+        offset = self.parse_line_no
+        for parsed in itertools.chain(batch.errors, batch.valid):
+            if isinstance(parsed.record, dict) and "parse_line_no" in parsed.record:
+                parsed.record["parse_line_no"] += offset
+        self.parse_line_no += len(batch.errors) + len(batch.valid)
+        return batch
+
+
+class ParseShard(NamedTuple):
+    """A self-contained slice of a file, to be parsed in a worker process."""
+
+    file: model.File
+    configuration: model.Configuration
+    headers: model.HeaderMapping
+    data: str
+    external_id_mappings: dict
+    custom_attributes: dict
+    optum_file_logging_enabled: bool
+
+
+def _parse_shard(shard: ParseShard) -> ParsedFileRecords:
+    parser = EligibilityFileParser(
+        file=shard.file,
+        configuration=shard.configuration,
+        headers=shard.headers,
+        data=shard.data,
+        external_id_mappings=shard.external_id_mappings,
+        custom_attributes=shard.custom_attributes,
+        optum_file_logging_enabled=shard.optum_file_logging_enabled,
+    )
+    batches = [*parser.parse(batch_size=sys.maxsize)]
+    return batches[0] if batches else ParsedFileRecords()
+
 
 _EXTRA_HEADER = "extra"
 
@@ -562,12 +707,12 @@ class ReaderProtocolT(Protocol):
     """
 
     configuration: model.Configuration
-    data: AnyStr
+    data: AnyStr | BinaryIO
 
     def __init__(
         self,
         headers: model.HeaderMapping,
-        data: AnyStr,
+        data: AnyStr | BinaryIO,
         *,
         encoding: str = "utf-8",
     ):
@@ -44,6 +44,7 @@ class PopulationInformation:
     sub_pop_lookup_keys_csv: str
     advanced: bool
     organization_id: int | None = None
+    updated_at: datetime | None = None
 
 
 @dataclasses.dataclass
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any, Dict, Mapping, Tuple
+
+from mmlib.ops import log
+
+from app.eligibility.populations import model as pop_model
+from app.utils import eligibility_member as e9y_member_utils
+from db import model as db_model
+from db.clients import population_client
+
+logger = log.getLogger(__name__)
+
+_DEFAULT_CASE = pop_model.SpecialCaseAttributes.DEFAULT_CASE.value
+_IS_NULL = pop_model.SpecialCaseAttributes.IS_NULL.value
+
+
+class CompiledPopulation:
+    """A population's sub-population lookup, compiled for walking in memory.
+
+    The lookup map is a trie keyed by the member's attribute values, in the order
+    of the lookup keys. Advanced populations may also route a missing attribute via
+    `ATTRIBUTE_IS_NULL` and an unmapped one via `ATTRIBUTE_DEFAULT_CASE`.
+    """
+
+    __slots__ = ("population_id", "version", "advanced", "lookup_keys", "trie")
+
+    def __init__(
+        self,
+        *,
+        population_id: int,
+        version: datetime.datetime | None,
+        advanced: bool,
+        lookup_keys: Tuple[str, ...],
+        trie: Mapping[str, Any],
+    ):
+        self.population_id = population_id
+        self.version = version
+        self.advanced = advanced
+        self.lookup_keys = lookup_keys
+        self.trie = trie
+
+    def __repr__(self):
+        population_id, version = self.population_id, self.version
+        return f"<{self.__class__.__name__} {population_id=} {version=}>"
+
+    @classmethod
+    def compile(cls, population: pop_model.Population) -> CompiledPopulation:
+        keys_csv = population.sub_pop_lookup_keys_csv or ""
+        return cls(
+            population_id=population.id,
+            version=population.updated_at,
+            advanced=population.advanced,
+            lookup_keys=tuple(k for k in keys_csv.split(",") if k),
+            trie=population.sub_pop_lookup_map_json or {},
+        )
+
+    def resolve(
+        self, member: db_model.MemberVersioned | db_model.Member2
+    ) -> int | None:
+        """Walk the trie with the member's attributes to find their sub-population ID."""
+        if not self.lookup_keys:
+            return None
+        if self.advanced:
+            return self._resolve_advanced(member)
+        node = self.trie
+        for key in self.lookup_keys:
+            attribute = e9y_member_utils.get_member_attribute(member, key)
+            if attribute is None or not isinstance(node, dict):
+                return None
+            node = node.get(str(attribute))
+            if node is None:
+                return None
+        return node if isinstance(node, int) else None
+
+    def _resolve_advanced(
+        self, member: db_model.MemberVersioned | db_model.Member2
+    ) -> int | None:
+        node = self.trie
+        attribute_sequence = ""
+        for key in self.lookup_keys:
+            attribute = e9y_member_utils.get_member_attribute(member, key)
+            if attribute is None:
+                attribute = _IS_NULL
+            attribute_sequence = f"{attribute_sequence},{attribute}"
+            if isinstance(node, dict):
+                node = node.get(attribute, node.get(_DEFAULT_CASE))
+            else:
+                node = None
+            if node is None:
+                logger.error(
+                    f"Attribute combination not covered by population definition: {attribute_sequence}",
+                    member_id=member.id,
+                    population_id=self.population_id,
+                )
+                return None
+
+        if not isinstance(node, int):
+            logger.error(
+                f"Attribute combination retrieved unexpected value: {attribute_sequence}: {node}",
+                member_id=member.id,
+                population_id=self.population_id,
+            )
+            return None
+        return node
+
+
+class SubPopulationResolver:
+    """A process-local cache of compiled populations.
+
+    The caller already has the population's `updated_at` from its population
+    information query, so we only fetch the population when we've never compiled it,
+    or when it has changed since we did. Resolving a member is then a walk in memory.
+    """
+
+    __slots__ = ("populations", "compiled")
+
+    def __init__(self, populations: population_client.Populations | None = None):
+        self.populations = populations or population_client.Populations()
+        self.compiled: Dict[int, CompiledPopulation] = {}
+
+    def __repr__(self):
+        size = len(self.compiled)
+        return f"<{self.__class__.__name__} {size=}>"
+
+    async def get(
+        self, pop_info: pop_model.PopulationInformation
+    ) -> CompiledPopulation | None:
+        population_id, version = pop_info.population_id, pop_info.updated_at
+        compiled = self.compiled.get(population_id)
+        if compiled is not None and version is not None and compiled.version == version:
+            return compiled
+
+        population: pop_model.Population = await self.populations.get(pk=population_id)
+        if population is None:
+            self.compiled.pop(population_id, None)
+            return None
+        compiled = CompiledPopulation.compile(population)
+        # Without a version to compare against, we can't tell when to recompile.
+        if compiled.version is not None:
+            self.compiled[population_id] = compiled
+        return compiled
+
+    async def resolve(
+        self,
+        pop_info: pop_model.PopulationInformation,
+        member: db_model.MemberVersioned | db_model.Member2,
+    ) -> int | None:
+        compiled = await self.get(pop_info)
+        if compiled is None:
+            return None
+        return compiled.resolve(member)
+
+    def clear(self):
+        self.compiled.clear()
+
+
+_RESOLVER: SubPopulationResolver | None = None
+
+
+def resolver() -> SubPopulationResolver:
+    """Get the process-wide resolver, so every request shares its compiled populations."""
+    global _RESOLVER
+    if _RESOLVER is None:
+        _RESOLVER = SubPopulationResolver()
+    return _RESOLVER
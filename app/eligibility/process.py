@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from concurrent.futures.process import ProcessPoolExecutor
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import cchardet
 import structlog
@@ -10,8 +10,9 @@ from ddtrace import tracer
 from mmlib.ops import stats
 
 import constants
-from app.common import apm
+from app.common import apm, crypto
 from app.eligibility.domain import model, repository, service
+from app.utils import feature_flag
 from db import model as db_model
 from db.clients import (
     configuration_client,
@@ -20,6 +21,7 @@ from db.clients import (
     header_aliases_client,
     member_client,
     member_versioned_client,
+    postgres_connector,
     verification_client,
 )
 from db.mono.client import MavenOrgExternalID
@@ -28,11 +30,15 @@ from ..common.gcs import LocalStorage, Storage
 from . import parse
 from .constants import ProcessingResult
 from .domain.model import ProcessedRecords
-from .gcs import EligibilityFileManager
+from .gcs import EligibilityFileManager, EligibilityFileStream
 
 logger = structlog.getLogger(__name__)
 
 RESOURCE = "process-file"
+# The number of batches we'll persist to the staging tables at once, per file.
+PERSIST_CONCURRENCY = 4
+# The number of processes we'll parse shards of a file in, when sharding is enabled.
+PARSE_WORKERS = 2
 
 
 class EligibilityFileProcessor:
@@ -64,6 +70,9 @@ class EligibilityFileProcessor:
         "members_versioned",
         "verifications",
         "loop",
+        "persist_concurrency",
+        "parse_workers",
+        "flush_concurrency",
     )
 
     def __init__(
@@ -80,6 +89,9 @@ class EligibilityFileProcessor:
         members: member_client.Members | None = None,
         members_versioned: member_versioned_client.MembersVersioned | None = None,
         verifications: verification_client.Verifications | None = None,
+        persist_concurrency: int = PERSIST_CONCURRENCY,
+        parse_workers: int = PARSE_WORKERS,
+        flush_concurrency: int = repository.parsed_records_db.FLUSH_CONCURRENCY,
     ):
         if project and project != "local-dev":
             storage = Storage(project)
@@ -91,7 +103,7 @@ class EligibilityFileProcessor:
         self.bucket = bucket
         self.project = project
         self.project_supervisor = project_supervisor
-        self.pool = ProcessPoolExecutor(2)
+        self.pool = ProcessPoolExecutor(parse_workers)
         self.files = files or file_client.Files()
         self.file_parse_results_client = (
             fpr_client or file_parse_results_client.FileParseResults()
@@ -106,8 +118,17 @@ class EligibilityFileProcessor:
         self.verifications = verifications or verification_client.Verifications()
 
         self.loop = loop
+        self.persist_concurrency = persist_concurrency
+        self.parse_workers = parse_workers
+        self.flush_concurrency = flush_concurrency
+
+    async def file_size(self, file: db_model.File) -> int | None:
+        """The size, in bytes, of the file in cloud storage, if it exists."""
+        return await self.manager.size(file.name, self.bucket)
 
     DEFAULT_ENCODING = "utf-8"
+    # How much of the head of a file we read to detect its encoding.
+    ENCODING_SAMPLE_SIZE = 1024 * 1024
 
     @tracer.wrap(service=apm.ApmService.ELIGIBILITY_WORKER, resource=RESOURCE)
     async def process(
@@ -130,16 +151,65 @@ class EligibilityFileProcessor:
         Returns:
             The `ProcessedRecords`, if file data was located in the storage bucket.
         """
-        if data_provider_file := config.data_provider:
+        if config.data_provider:
             logger.info(
                 "Got an organization configuration associated with a data_provider",
             )
 
         file.started_at = await self.files.set_started_at(file.id)
-        logger.info("Fetching contents from GCS.")
-        data = await self.manager.get(file.name, self.bucket)
+        logger.info("Streaming contents from GCS.")
+        chunks = await self.manager.stream(file.name, self.bucket)
+        data = chunks and EligibilityFileStream(chunks, loop=asyncio.get_event_loop())
+        # Staging and flushing a file can hold connections for minutes, so it's kept
+        #   off the pool which serves our api.
+        with postgres_connector.workload(postgres_connector.BATCH):
+            try:
+                return await self._process_stream(
+                    data, file=file, config=config, batch_size=batch_size
+                )
+            finally:
+                if data:
+                    await data.aclose()
+
+    async def _process_stream(
+        self,
+        data: EligibilityFileStream | None,
+        *,
+        file: db_model.File,
+        config: db_model.Configuration,
+        batch_size: int,
+    ) -> Tuple[ProcessingResult, model.ProcessedRecords | None]:
+        data_provider_file = config.data_provider
+        # Read a sample of the head of our file, to detect its encoding from.
+        try:
+            sample = data and await data.peek(self.ENCODING_SAMPLE_SIZE)
+        except crypto.DecryptionError as e:
+            # A file smaller than the sample is fully read (and authenticated) here.
+            logger.exception("Could not authenticate file contents", error=e)
+            stats.increment(
+                metric_name="eligibility.process.file_process.decryption_error",
+                pod_name=constants.POD,
+                tags=[
+                    "eligibility:error",
+                    f"organization_id:{config.organization_id}",
+                ],
+            )
+            return ProcessingResult.ERROR_DURING_PROCESSING, None
+        except Exception as e:
+            # Reading from storage failed, which says nothing about the file itself.
+            logger.exception("Could not read file contents", error=e)
+            stats.increment(
+                metric_name="eligibility.process.file_process.read_error",
+                pod_name=constants.POD,
+                tags=[
+                    "eligibility:error",
+                    f"organization_id:{config.organization_id}",
+                    f"file_id:{file.id}",
+                ],
+            )
+            return ProcessingResult.ERROR_DURING_PROCESSING, None
 
-        if not data:
+        if not sample:
             stats.increment(
                 metric_name="eligibility.process.file_content_missing",
                 pod_name=constants.POD,
@@ -149,9 +219,9 @@ class EligibilityFileProcessor:
             file.completed_at = await self.files.set_completed_at(file.id)
             return ProcessingResult.FILE_MISSING, None
 
-        # Attempt to detect the encoding of our file
+        # Attempt to detect the encoding of our file from the sample.
         try:
-            result = cchardet.detect(data)
+            result = cchardet.detect(sample)
             logger.info("Detected encoding.", **result)
         except Exception as e:
             logger.exception("Could not detect encoding of file", error=e)
@@ -167,7 +237,7 @@ class EligibilityFileProcessor:
             return ProcessingResult.BAD_FILE_ENCODING, None
 
         # Set the file encoding
-        file.encoding = (result["encoding"] or self.DEFAULT_ENCODING).lower()
+        file.encoding = self._resolve_encoding(result["encoding"])
         await self.files.set_encoding(file.id, encoding=file.encoding)
 
         headers = await self.headers.get_header_mapping(file.organization_id)
@@ -214,42 +284,39 @@ class EligibilityFileProcessor:
                     verification_client=self.verifications,
                     file_client=self.files,
                     config_client=self.configs,
+                    flush_concurrency=self.flush_concurrency,
                 )
             )
 
-            num_valid, num_error, batch_num, num_not_persisted = 0, 0, 0, 0
-            for batch in parser.parse(batch_size=batch_size):
-                try:
-                    processed_batch: model.ProcessedRecords = await service.persist(
-                        file=file,
-                        parsed_records=batch,
-                        db_repository=db_repository,
-                    )
-                except Exception as e:
-                    logger.exception(
-                        "Encountered an error in saving processed file results to temp tables",
-                        error=e,
-                    )
-                    stats.increment(
-                        metric_name="eligibility.process.file_process.temp_table_persist_error",
-                        pod_name=constants.POD,
-                        tags=[
-                            "eligibility:error",
-                            f"organization_id:{config.organization_id}",
-                        ],
-                    )
-                    return ProcessingResult.ERROR_DURING_PROCESSING, None
-                else:
-                    num_valid += processed_batch.valid
-                    num_error += processed_batch.errors
-                    batch_num += 1
-                    logger.info(
-                        f"{num_valid} valid rows, {num_error} errors rows completed in {batch_num} batches"
-                    )
-
-                    num_not_persisted += (len(batch.valid) - processed_batch.valid) + (
-                        len(batch.errors) - processed_batch.errors
-                    )
+            if feature_flag.organization_enabled_for_sharded_parse(
+                file.organization_id
+            ):
+                batches = parser.parse_sharded(
+                    self.pool, batch_size=batch_size, prefetch=self.parse_workers * 2
+                )
+            else:
+                batches = parser.parse(batch_size=batch_size)
+
+            try:
+                num_valid, num_error, num_not_persisted = await self._stage(
+                    batches,
+                    file=file,
+                    db_repository=db_repository,
+                )
+            except _StagingError as e:
+                logger.exception(
+                    "Encountered an error in saving processed file results to temp tables",
+                    error=e.__cause__,
+                )
+                stats.increment(
+                    metric_name="eligibility.process.file_process.temp_table_persist_error",
+                    pod_name=constants.POD,
+                    tags=[
+                        "eligibility:error",
+                        f"organization_id:{config.organization_id}",
+                    ],
+                )
+                return ProcessingResult.ERROR_DURING_PROCESSING, None
 
             if num_not_persisted > 0:
                 logger.warning(
@@ -264,6 +331,20 @@ class EligibilityFileProcessor:
                 failure_count=num_error,
             )
 
+        except crypto.DecryptionError as e:
+            logger.exception("Could not authenticate file contents", error=e)
+            stats.increment(
+                metric_name="eligibility.process.file_process.decryption_error",
+                pod_name=constants.POD,
+                tags=[
+                    "eligibility:error",
+                    f"organization_id:{config.organization_id}",
+                ],
+            )
+            # Anything we've staged so far came from unauthenticated data.
+            await db_repository.delete_errors(file=file)
+            await db_repository.delete_results(file=file)
+            return ProcessingResult.ERROR_DURING_PROCESSING, None
         except Exception as e:
             logger.exception("Unable to parse file- error encountered", error=e)
             stats.increment(
@@ -310,6 +391,95 @@ class EligibilityFileProcessor:
 
         return ProcessingResult.PROCESSING_SUCCESSFUL, processed
 
+    async def _stage(
+        self,
+        batches: Iterable[model.ParsedFileRecords],
+        *,
+        file: db_model.File,
+        db_repository: repository.ParsedRecordsDatabaseRepository,
+    ) -> Tuple[int, int, int]:
+        """Parse the batches and persist them to the staging tables as a pipeline.
+
+        A single producer parses batches in order (so `parse_line_no` is preserved)
+        in a worker thread, while up to `persist_concurrency` batches are persisted
+        concurrently. The queue between the two is bounded, so parsing never gets
+        more than a few batches ahead of the database.
+
+        Returns:
+            The number of valid rows, error rows, and rows which weren't persisted.
+
+        Raises:
+            _StagingError: If any batch couldn't be persisted.
+        """
+        concurrency = self.persist_concurrency
+        queue: asyncio.Queue[model.ParsedFileRecords | None] = asyncio.Queue(
+            maxsize=concurrency
+        )
+        totals = model.ProcessedRecords()
+        num_not_persisted, batch_num = 0, 0
+        known: model.KnownHashes | None = None
+        if feature_flag.organization_enabled_for_hash_prefilter(file.organization_id):
+            # Most rows are unchanged from the last file, so only stage the ones
+            #   which aren't already a member.
+            known = await db_repository.get_known_hashes(file=file)
+            logger.info("Loaded known member hashes", count=len(known))
+
+        async def produce():
+            # Parsing pulls from the file stream, which blocks on GCS and can't be
+            #   done on the event loop, so each batch is parsed in a worker thread.
+            it = iter(batches)
+            while (batch := await asyncio.to_thread(next, it, None)) is not None:
+                await queue.put(batch)
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def consume():
+            nonlocal num_not_persisted, batch_num
+            while (batch := await queue.get()) is not None:
+                try:
+                    processed_batch: model.ProcessedRecords = await service.persist(
+                        file=file,
+                        parsed_records=batch,
+                        db_repository=db_repository,
+                        known=known,
+                    )
+                except Exception as e:
+                    raise _StagingError from e
+                totals.valid += processed_batch.valid
+                totals.errors += processed_batch.errors
+                batch_num += 1
+                logger.info(
+                    f"{totals.valid} valid rows, {totals.errors} errors rows completed in {batch_num} batches"
+                )
+                num_not_persisted += (len(batch.valid) - processed_batch.valid) + (
+                    len(batch.errors) - processed_batch.errors
+                )
+
+        tasks = [
+            asyncio.create_task(produce()),
+            *(asyncio.create_task(consume()) for _ in range(concurrency)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return totals.valid, totals.errors, num_not_persisted
+
     def _detect_encoding(self, data: bytes) -> str:
         detected_encoding = cchardet.detect(data)
-        return (detected_encoding["encoding"] or self.DEFAULT_ENCODING).lower()
+        return self._resolve_encoding(detected_encoding["encoding"])
+
+    def _resolve_encoding(self, encoding: str | None) -> str:
+        encoding = (encoding or self.DEFAULT_ENCODING).lower()
+        # We only sample the head of the file, and an ASCII head doesn't tell us that
+        #   the tail won't contain multi-byte characters. UTF-8 is a superset.
+        if encoding == "ascii":
+            return self.DEFAULT_ENCODING
+        return encoding
+
+
+class _StagingError(Exception):
+    """Raised by the staging pipeline when a batch couldn't be persisted."""
@@ -12,7 +12,7 @@ from app.eligibility.query_framework import errors
 from app.eligibility.query_framework.registry import QueryDefinition, QueryRegistry
 from app.eligibility.query_framework.result import EligibilityResult, QueryResult
 from app.eligibility.query_framework.types import MemberResult, MemberResultType
-from app.utils import eligibility_validation, feature_flag
+from app.utils import eligibility_validation, feature_flag, speculative
 from db import model
 from db.clients import configuration_client
 
@@ -80,18 +80,29 @@ class EligibilityQueryExecutor:
         Execute eligibility queries with V1/V2 strategy.
         Returns a QueryVersioningResult with the result to use and metadata.
         """
-        # Execute V1 queries first
-        v1_result, v1_id, org_id = await self._try_v1_queries(method, params)
+        # V2 queries may be started speculatively, alongside V1, and discarded if
+        #   the V1 result tells us we don't need them.
+        async with speculative.Speculative(
+            lambda: self._execute_v2_queries(method, params),
+            enabled=feature_flag.is_e9y_2_speculative_read_enabled(),
+        ) as v2_queries:
+            # Execute V1 queries first
+            v1_result, v1_id, org_id = await self._try_v1_queries(method, params)
+
+            # Determine if we should try V2 queries
+            use_v1_result, reason = self._determine_query_version(
+                v1_result, org_id, method
+            )
+            result_to_use = v1_result.result  # Default to V1
 
-        # Determine if we should try V2 queries
-        use_v1_result, reason = self._determine_query_version(v1_result, org_id, method)
-        result_to_use = v1_result.result  # Default to V1
+            # Try V2 if needed
+            v2_result = None
+            if not use_v1_result:
+                v2_result = await self._try_v2_queries(
+                    v1_result.first_result, method, params, prefetched=v2_queries
+                )
 
-        # Try V2 if needed
         if not use_v1_result:
-            v2_result = await self._try_v2_queries(
-                v1_result.first_result, method, params
-            )
             if v2_result:
                 result_to_use = v2_result
                 reason = "V2 validation successful"
@@ -147,13 +158,21 @@ class EligibilityQueryExecutor:
         return v1_result, v1_id, org_id
 
     async def _try_v2_queries(
-        self, v1_record, method: EligibilityMethod, params: Dict[str, Any]
+        self,
+        v1_record,
+        method: EligibilityMethod,
+        params: Dict[str, Any],
+        *,
+        prefetched: speculative.Speculative[QueryResult] | None = None,
     ) -> Optional[MemberResult]:
-        """Attempt V2 queries and return result if valid, None otherwise."""
-        v2_queries = QueryRegistry.get_v2_queries(method)
-        v2_result = await self._execute_queries(
-            queries=v2_queries, method=method, params=params
-        )
+        """Attempt V2 queries and return result if valid, None otherwise.
+
+        If the V2 queries were started speculatively, we wait on those instead.
+        """
+        if prefetched is None:
+            v2_result = await self._execute_v2_queries(method, params)
+        else:
+            v2_result = await prefetched.result()
 
         if v2_result.is_success and self._validate_results(
             v1_record, v2_result.first_result
@@ -165,6 +184,15 @@ class EligibilityQueryExecutor:
             return v2_result.result
         return None
 
+    async def _execute_v2_queries(
+        self, method: EligibilityMethod, params: Dict[str, Any]
+    ) -> QueryResult:
+        """Execute V2 queries and return the result, without validating it."""
+        v2_queries = QueryRegistry.get_v2_queries(method)
+        return await self._execute_queries(
+            queries=v2_queries, method=method, params=params
+        )
+
     def _determine_query_version(
         self, v1_result: QueryResult, org_id: str, method: EligibilityMethod
     ) -> Tuple[bool, Optional[str]]:
@@ -16,11 +16,10 @@ from tests.factories.data_models import (
 )
 from verification.repository.verification import VerificationRepository
 
-from app.eligibility import client_specific, convert, errors
+from app.eligibility import client_specific, configuration_cache, convert, errors
 from app.eligibility.constants import ORGANIZATIONS_NOT_SENDING_DOB, EligibilityMethod
-from app.utils import async_ttl_cache
-from app.utils import eligibility_member as e9y_member_utils
-from app.utils import feature_flag
+from app.eligibility.populations import resolver as population_resolver
+from app.utils import feature_flag, speculative
 from app.utils.eligibility_validation import (
     cached_organization_eligibility_type,
     check_member_org_active_and_overeligibility,
@@ -59,6 +58,7 @@ class EligibilityService:
         "verifications",
         "populations",
         "sub_populations",
+        "sub_population_resolver",
         "members_2",
     )
 
@@ -72,6 +72,7 @@ class EligibilityService:
         )
         self.populations = population_client.Populations()
         self.sub_populations = sub_population_client.SubPopulations()
+        self.sub_population_resolver = population_resolver.resolver()
         self.verifications = VerificationRepository()
 
     # region check_standard_eligibility
@@ -94,25 +95,31 @@ class EligibilityService:
             A StandardMatchError, if no match is found.
         """
         validated_dob = self._validate_date(date_of_birth)
-        member_versioned = await self._get_by_dob_and_email_v1(validated_dob, email)
-        member_record = member_versioned
-        v1_id = member_versioned.id
-        is_v2 = False
-        v2_id = None
-        if feature_flag.organization_enabled_for_e9y_2_write(
-            member_versioned.organization_id
-        ):
-            set_tracer_tags(
-                {"is_v2": True, "organization_id": member_versioned.organization_id}
-            )
-            member_2 = await self._get_by_dob_and_email_v2(
+        # We don't know if we need the v2 record until we have the v1 record, so we
+        #   may look it up concurrently and discard it if the org isn't enabled.
+        async with speculative.Speculative(
+            lambda: self._get_by_dob_and_email_v2(
                 date_of_birth=validated_dob, email=email
-            )
-            if member_2.organization_id != member_versioned.organization_id:
-                raise ValueError("member_versioned and member_2 not fully synced")
-            is_v2 = True
-            member_record = member_2
-            v2_id = member_2.id
+            ),
+            enabled=feature_flag.is_e9y_2_speculative_read_enabled(),
+        ) as member_2_lookup:
+            member_versioned = await self._get_by_dob_and_email_v1(validated_dob, email)
+            member_record = member_versioned
+            v1_id = member_versioned.id
+            is_v2 = False
+            v2_id = None
+            if feature_flag.organization_enabled_for_e9y_2_write(
+                member_versioned.organization_id
+            ):
+                set_tracer_tags(
+                    {"is_v2": True, "organization_id": member_versioned.organization_id}
+                )
+                member_2 = await member_2_lookup.result()
+                if member_2.organization_id != member_versioned.organization_id:
+                    raise ValueError("member_versioned and member_2 not fully synced")
+                is_v2 = True
+                member_record = member_2
+                v2_id = member_2.id
 
         return self._convert_member_to_member_response(
             member_record, is_v2, v1_id, v2_id
@@ -193,93 +200,105 @@ class EligibilityService:
             An AlternateMatchError, if no match is found.
         """
         dob = self._validate_date(date_of_birth)
-        if unique_corp_id:
-            member_list = await self.members_versioned.get_by_tertiary_verification(
-                date_of_birth=dob, unique_corp_id=unique_corp_id
-            )
 
-        else:
-            member_list = await self.members_versioned.get_by_secondary_verification(
+        def get_member_2_list():
+            if unique_corp_id:
+                return self.members_2.get_by_tertiary_verification(
+                    date_of_birth=dob, unique_corp_id=unique_corp_id
+                )
+            return self.members_2.get_by_secondary_verification(
                 date_of_birth=dob,
                 first_name=first_name,
                 last_name=last_name,
                 work_state=work_state,
             )
 
-        entries = len(member_list)
-        if entries == 0:
-            raise errors.AlternateMatchError()
-
-        #
-        try:
-            member_record = await check_member_org_active_and_single_org(
-                configuration_client=self.configurations, member_list=member_list
-            )
-        except errors.MatchMultipleError as err:
-            raise errors.AlternateMatchMultipleError(err)
-        except Exception as err:
-            raise errors.AlternateMatchError(err)
-
-        member_result = member_record
-        v1_id = member_result.id
-        is_v2 = False
-        v2_id = None
-        if feature_flag.organization_enabled_for_e9y_2_write(
-            member_record.organization_id
-        ):
-            set_tracer_tags(
-                {"is_v2": True, "organization_id": member_record.organization_id}
-            )
+        # We don't know if we need the v2 records until we have the v1 record, so we
+        #   may look them up concurrently and discard them if the org isn't enabled.
+        async with speculative.Speculative(
+            get_member_2_list,
+            enabled=feature_flag.is_e9y_2_speculative_read_enabled(),
+        ) as member_2_lookup:
             if unique_corp_id:
-                member_2_list = await self.members_2.get_by_tertiary_verification(
+                member_list = await self.members_versioned.get_by_tertiary_verification(
                     date_of_birth=dob, unique_corp_id=unique_corp_id
                 )
+
             else:
-                member_2_list = await self.members_2.get_by_secondary_verification(
-                    date_of_birth=dob,
-                    first_name=first_name,
-                    last_name=last_name,
-                    work_state=work_state,
+                member_list = (
+                    await self.members_versioned.get_by_secondary_verification(
+                        date_of_birth=dob,
+                        first_name=first_name,
+                        last_name=last_name,
+                        work_state=work_state,
+                    )
                 )
-            entries = len(member_2_list)
+
+            entries = len(member_list)
             if entries == 0:
-                logger.error(
-                    "No member_2 records found for alternate eligibility",
-                    date_of_birth=date_of_birth,
-                    unique_corp_id=unique_corp_id,
-                )
-                raise errors.AlternateMatchError(
-                    "No member_2 records found for alternate eligibility"
-                )
+                raise errors.AlternateMatchError()
 
+            #
             try:
-                member_2_record = await check_member_org_active_and_single_org(
-                    configuration_client=self.configurations, member_list=member_2_list
+                member_record = await check_member_org_active_and_single_org(
+                    configuration_client=self.configurations, member_list=member_list
                 )
             except errors.MatchMultipleError as err:
-                logger.error(
-                    "Multiple organization records found for user of v2.",
-                    member_list=member_2_list,
-                )
                 raise errors.AlternateMatchMultipleError(err)
             except Exception as err:
-                logger.error(
-                    f"Exception {err} of v2.",
-                    member_list=member_2_list,
-                )
                 raise errors.AlternateMatchError(err)
 
-            if member_2_record.organization_id != member_record.organization_id:
-                logger.error(
-                    "Organization mismatch between member_versioned and member_2 records found for alternate eligibility",
-                    member_record=member_record,
-                    member_2_record=member_2_record,
+            member_result = member_record
+            v1_id = member_result.id
+            is_v2 = False
+            v2_id = None
+            if feature_flag.organization_enabled_for_e9y_2_write(
+                member_record.organization_id
+            ):
+                set_tracer_tags(
+                    {"is_v2": True, "organization_id": member_record.organization_id}
                 )
-                raise ValueError("member_versioned and member_2 not fully synced")
+                member_2_list = await member_2_lookup.result()
+                entries = len(member_2_list)
+                if entries == 0:
+                    logger.error(
+                        "No member_2 records found for alternate eligibility",
+                        date_of_birth=date_of_birth,
+                        unique_corp_id=unique_corp_id,
+                    )
+                    raise errors.AlternateMatchError(
+                        "No member_2 records found for alternate eligibility"
+                    )
 
-            member_result = member_2_record
-            is_v2 = True
-            v2_id = member_2_record.id
+                try:
+                    member_2_record = await check_member_org_active_and_single_org(
+                        configuration_client=self.configurations,
+                        member_list=member_2_list,
+                    )
+                except errors.MatchMultipleError as err:
+                    logger.error(
+                        "Multiple organization records found for user of v2.",
+                        member_list=member_2_list,
+                    )
+                    raise errors.AlternateMatchMultipleError(err)
+                except Exception as err:
+                    logger.error(
+                        f"Exception {err} of v2.",
+                        member_list=member_2_list,
+                    )
+                    raise errors.AlternateMatchError(err)
+
+                if member_2_record.organization_id != member_record.organization_id:
+                    logger.error(
+                        "Organization mismatch between member_versioned and member_2 records found for alternate eligibility",
+                        member_record=member_record,
+                        member_2_record=member_2_record,
+                    )
+                    raise ValueError("member_versioned and member_2 not fully synced")
+
+                member_result = member_2_record
+                is_v2 = True
+                v2_id = member_2_record.id
 
         return self._convert_member_to_member_response(
             member_result, is_v2, v1_id, v2_id
@@ -2290,25 +2309,12 @@ class EligibilityService:
             )
             return None, True
 
-        if not pop_info.advanced:
-            # Find the sub-population ID using the lookup keys and the Eligibility Member information
-            return (
-                await self.populations.get_the_sub_pop_id_using_lookup_keys_for_member(
-                    lookup_keys_csv=pop_info.sub_pop_lookup_keys_csv,
-                    member=member,
-                    population_id=pop_info.population_id,
-                ),
-                True,
-            )
-        else:
-            # Find the sub-population ID for the advanced population configuration
-            return (
-                await e9y_member_utils.get_advanced_sub_pop_id_for_member(
-                    member=member,
-                    population_id=pop_info.population_id,
-                ),
-                True,
-            )
+        # Find the sub-population ID by walking the population's compiled lookup map
+        #   with the Eligibility Member information
+        return (
+            await self.sub_population_resolver.resolve(pop_info, member),
+            True,
+        )
 
     async def get_sub_population_id_for_user_and_org(
         self,
@@ -2394,25 +2400,12 @@ class EligibilityService:
             )
             return None, True
 
-        if not pop_info.advanced:
-            # Find the sub-population ID using the lookup keys and the Eligibility Member information
-            return (
-                await self.populations.get_the_sub_pop_id_using_lookup_keys_for_member(
-                    lookup_keys_csv=pop_info.sub_pop_lookup_keys_csv,
-                    member=member,
-                    population_id=pop_info.population_id,
-                ),
-                True,
-            )
-        else:
-            # Find the sub-population ID for the advanced population configuration
-            return (
-                await e9y_member_utils.get_advanced_sub_pop_id_for_member(
-                    member=member,
-                    population_id=pop_info.population_id,
-                ),
-                True,
-            )
+        # Find the sub-population ID by walking the population's compiled lookup map
+        #   with the Eligibility Member information
+        return (
+            await self.sub_population_resolver.resolve(pop_info, member),
+            True,
+        )
 
     async def get_other_user_ids_in_family(self, user_id: int) -> List[int]:
         """
@@ -2653,14 +2646,15 @@ class EligibilityService:
             )
         return verification_type.upper()
 
-    @async_ttl_cache.AsyncTTLCache(time_to_live=30 * 60, max_size=1024)
     async def _check_organization_active_status(self, organization_id: int) -> bool:
         """
         get organization information and return if organization is active or not
         :param organization_id: organization id
         :return: True or False
         """
-        organization = await self.configurations.get(organization_id)
+        organization = await configuration_cache.cache().get(
+            organization_id, configs=self.configurations
+        )
         return is_organization_activated(organization)
 
 
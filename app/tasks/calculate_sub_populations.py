@@ -146,7 +146,11 @@ async def process_sub_populations(
     # Set up DB connection
     dsn = postgres_connector.get_dsn()
     pool = postgres_connector.create_pool(dsn=dsn, min_size=5, max_size=10)
-    connector = postgres_connector.PostgresConnector(dsn=dsn, pool=pool)
+    connector = postgres_connector.PostgresConnector(
+        dsn=dsn,
+        pool=pool,
+        profile=postgres_connector.pool_profiles()[postgres_connector.BATCH],
+    )
 
     # Get active populations
     pop_client = population_client.Populations(connector=connector)
@@ -93,13 +93,28 @@ async def pre_verify_org(
 
 
 async def gather_with_concurrency(n, awaitables):
+    """Gather the coroutines, running at most `n` at once.
+
+    If one fails (or we're cancelled), the rest are cancelled and awaited before we
+    return, so none are left running on their own connections.
+    """
     semaphore = asyncio.Semaphore(n)
 
     async def with_semaphore(coro):
-        async with semaphore:
-            return await coro
+        try:
+            async with semaphore:
+                return await coro
+        finally:
+            # N.B. - If we're cancelled before it starts, it's never awaited.
+            coro.close()
 
-    return await asyncio.gather(*(with_semaphore(c) for c in awaitables))
+    tasks = [asyncio.create_task(with_semaphore(c)) for c in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 
 @tracer.wrap(service=apm.ApmService.ELIGIBILITY_TASKS, resource="pre_verify")
@@ -107,7 +122,11 @@ async def pre_verify(batch_size: int = 10_000):
     """Pre-verify records for all organizations - as enabled by feature flag"""
     dsn = postgres_connector.get_dsn()
     pool = postgres_connector.create_pool(dsn=dsn, min_size=10, max_size=20)
-    connector = postgres_connector.PostgresConnector(dsn=dsn, pool=pool)
+    connector = postgres_connector.PostgresConnector(
+        dsn=dsn,
+        pool=pool,
+        profile=postgres_connector.pool_profiles()[postgres_connector.BATCH],
+    )
     configs = configuration_client.Configurations(connector=connector)
     member_versioned = member_versioned_client.MembersVersioned(connector=connector)
     verifications = verification_client.Verifications(connector=connector)
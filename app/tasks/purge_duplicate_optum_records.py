@@ -33,7 +33,11 @@ async def optum_hash_and_discard_by_org():
     """For Optum organizations, clear out duplicate records and hash records that do not have a hash associated"""
     dsn = postgres_connector.get_dsn()
     pool = postgres_connector.create_pool(dsn=dsn, min_size=10, max_size=20)
-    connector = postgres_connector.PostgresConnector(dsn=dsn, pool=pool)
+    connector = postgres_connector.PostgresConnector(
+        dsn=dsn,
+        pool=pool,
+        profile=postgres_connector.pool_profiles()[postgres_connector.BATCH],
+    )
     configs = configuration_client.Configurations(connector=connector)
     member_versioned = member_versioned_client.MembersVersioned(connector=connector)
 
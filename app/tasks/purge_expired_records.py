@@ -1,6 +1,8 @@
 import asyncio
+import time
 from typing import Awaitable, List
 
+import asyncpg
 import structlog
 from ddtrace import tracer
 from mmlib.ops import stats
@@ -12,10 +14,14 @@ from db.clients import configuration_client, member_versioned_client, postgres_c
 
 logger = structlog.getLogger(__name__)
 MAX_CONCURRENT = 10
+# How far behind, in seconds, our replicas may fall before we pause purging.
+MAX_REPLICATION_LAG = 30
+# How long, in seconds, we wait before checking the replication lag again.
+REPLICATION_LAG_BACKOFF = 5
 
 
-def main():
-    return asyncio.run(purge_by_org())
+def main(*, concurrency: int = MAX_CONCURRENT):
+    return asyncio.run(purge_by_org(concurrency=concurrency))
 
 
 @tracer.wrap(service=apm.ApmService.ELIGIBILITY_TASKS, resource="purge_expired_for_org")
@@ -23,28 +29,53 @@ async def purge_expired_for_single_org(
     *,
     organization_id: int,
     members_versioned: member_versioned_client.MembersVersioned,
+    max_replication_lag: float = MAX_REPLICATION_LAG,
 ):
     """Purge expired or invalid records for a single organization"""
-    try:
-        async with members_versioned.client.connector.transaction() as c:
+
+    async def throttle(connection: asyncpg.Connection):
+        # Give our replicas a chance to catch up before we purge another batch.
+        while (
+            lag := await members_versioned.get_replication_lag(connection=connection)
+        ) > max_replication_lag:
             logger.info(
-                "Starting purge of expired records", organization_id=organization_id
-            )
-            num_purged: int = await members_versioned.purge_expired_records(
-                connection=c, organization_id=organization_id
+                "Waiting for replication to catch up before purging",
+                organization_id=organization_id,
+                replication_lag=lag,
             )
+            await asyncio.sleep(REPLICATION_LAG_BACKOFF)
 
-            stats.increment(
-                metric_value=num_purged,
-                metric_name="eligibility.tasks.purge_expired_records",
-                pod_name=constants.POD,
-                tags=[
-                    f"organization_id:{organization_id}",
-                ],
-            )
+    try:
+        logger.info(
+            "Starting purge of expired records", organization_id=organization_id
+        )
+        start = time.perf_counter()
+        num_purged: int = await members_versioned.purge_expired_records(
+            organization_id=organization_id, before_batch=throttle
+        )
+        elapsed = time.perf_counter() - start
+
+        stats.increment(
+            metric_value=num_purged,
+            metric_name="eligibility.tasks.purge_expired_records",
+            pod_name=constants.POD,
+            tags=[
+                f"organization_id:{organization_id}",
+            ],
+        )
+        stats.gauge(
+            metric_value=num_purged / elapsed if elapsed else 0,
+            metric_name="eligibility.tasks.purge_expired_records.rate",
+            pod_name=constants.POD,
+            tags=[
+                f"organization_id:{organization_id}",
+            ],
+        )
         logger.info(
             "Expired record purging completed for org",
             organization_id=organization_id,
+            num_purged=num_purged,
+            elapsed=round(elapsed, 3),
         )
     except Exception as e:
         logger.exception(
@@ -65,11 +96,19 @@ async def gather_with_concurrency(n, awaitables):
 
 
 @tracer.wrap(service=apm.ApmService.ELIGIBILITY_TASKS, resource="purge_by_org")
-async def purge_by_org():
+async def purge_by_org(*, concurrency: int = MAX_CONCURRENT):
     """Purge expired or invalid records for all organizations - as enabled by feature flag"""
     dsn = postgres_connector.get_dsn()
-    pool = postgres_connector.create_pool(dsn=dsn, min_size=10, max_size=20)
-    connector = postgres_connector.PostgresConnector(dsn=dsn, pool=pool)
+    # Each organization holds a connection for its whole purge, which leaves a few
+    #   over for everything else.
+    pool = postgres_connector.create_pool(
+        dsn=dsn, min_size=concurrency, max_size=concurrency * 2
+    )
+    connector = postgres_connector.PostgresConnector(
+        dsn=dsn,
+        pool=pool,
+        profile=postgres_connector.pool_profiles()[postgres_connector.BATCH],
+    )
     configs = configuration_client.Configurations(connector=connector)
     member_versioned = member_versioned_client.MembersVersioned(connector=connector)
 
@@ -87,4 +126,11 @@ async def purge_by_org():
             )
         )
 
-    await gather_with_concurrency(MAX_CONCURRENT, tasks_by_org)
+    start = time.perf_counter()
+    await gather_with_concurrency(concurrency, tasks_by_org)
+    logger.info(
+        "Expired record purging completed",
+        organizations=len(tasks_by_org),
+        concurrency=concurrency,
+        elapsed=round(time.perf_counter() - start, 3),
+    )
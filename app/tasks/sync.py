@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import contextvars
-from typing import List
+import hashlib
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import aiomysql
 import orjson
@@ -24,16 +25,20 @@ RESOURCE = "sync"
 logger = log.getLogger(__name__)
 
 
-def main(batch_size: int = 1_000):
-    asyncio.run(sync(batch_size=batch_size))
+def main(batch_size: int = 1_000, full: bool = False):
+    asyncio.run(sync(batch_size=batch_size, full=full))
 
 
 # region sync mono
 
 
 @tracer.wrap(service=apm.ApmService.ELIGIBILITY_TASKS, resource=RESOURCE)
-async def sync(batch_size: int = 1_000):
-    """Synchronize mono organizations with e9y configurations."""
+async def sync(batch_size: int = 1_000, full: bool = False):
+    """Synchronize mono organizations with e9y configurations.
+
+    Only organizations which have changed since they were last synced are persisted,
+    unless `full` is set.
+    """
     logger.info("Beginning org-configuration sync.")
     with inflight():
         with stats.timed(metric_name=f"{_STATS_PREFIX}.run", pod_name=_POD):
@@ -44,7 +49,7 @@ async def sync(batch_size: int = 1_000):
                     mclient.MavenMonoClient(),
                 )
                 await sync_all_mono_orgs(
-                    configs, header_aliases, mono, batch_size=batch_size
+                    configs, header_aliases, mono, batch_size=batch_size, full=full
                 )
                 await sync_all_mono_external_ids(configs, mono)
 
@@ -57,14 +62,22 @@ async def sync_all_mono_orgs(
     header_aliases: header_aliases_client.HeaderAliases,
     mono: mclient.MavenMonoClient,
     batch_size: int = 1_000,
+    full: bool = False,
 ):
-    """Pull in organization configurations in mono and persist them in e9y."""
+    """Pull in organization configurations in mono and persist them in e9y.
+
+    Mono doesn't track when an organization was modified, so we fingerprint each
+    translated configuration and header mapping, and skip the organizations whose
+    fingerprint matches the one we stored when we last synced them.
+    """
 
-    logger.info("Syncing organizations and header mappings to e9y.")
+    logger.info("Syncing organizations and header mappings to e9y.", full=full)
+    synced: Dict[int, str] = {} if full else await configs.get_sync_fingerprints()
     cursor: aiomysql.Cursor
     async with mono.get_orgs_for_sync_cursor() as cursor:
         seen = set()
         ignored = set()
+        unchanged = 0
         while batch := (await cursor.fetchmany(size=batch_size)):
             logger.info("Handling batch of orgs (%s)", len(batch))
             stats.gauge(
@@ -80,6 +93,7 @@ async def sync_all_mono_orgs(
             ):
                 headers_by_org: dict[int, dict[str, str]] = {}
                 orgs = []
+                fingerprints: Dict[int, str] = {}
                 for mono_org in batch:
                     # Decode the email domains to a set of strings.
                     mono_org_json = format.sanitize_json_input(mono_org["json"])
@@ -108,8 +122,13 @@ async def sync_all_mono_orgs(
                         ignored.add(config["organization_id"])
                         continue
                     seen.add(config["directory_name"])
+                    fingerprint = _fingerprint(config, headers)
+                    if synced.get(config["organization_id"]) == fingerprint:
+                        unchanged += 1
+                        continue
                     orgs.append(config)
                     headers_by_org[config["organization_id"]] = headers
+                    fingerprints[config["organization_id"]] = fingerprint
             logger.info("Done extracting configs and header mappings for batch.")
 
             if orgs:
@@ -124,12 +143,36 @@ async def sync_all_mono_orgs(
                     await header_aliases.bulk_refresh(
                         headers_by_org.items(), coerce=False
                     )
-                logger.info("Done persisting batch.")
+                    # Finally, remember what we've synced.
+                    await configs.bulk_persist_sync_fingerprints(fingerprints)
+                logger.info("Done persisting batch.", changed=len(orgs))
 
-    logger.info("Done syncing organizations and header mappings to e9y.")
+    stats.gauge(
+        metric_name=f"{_STATS_PREFIX}.orgs.unchanged",
+        pod_name=_POD,
+        metric_value=unchanged,
+    )
+    logger.info(
+        "Done syncing organizations and header mappings to e9y.", unchanged=unchanged
+    )
     return ignored
 
 
+def _fingerprint(config: Mapping[str, Any], headers: Mapping[str, str]) -> str:
+    payload = orjson.dumps(
+        {"config": config, "headers": dict(headers)},
+        default=_sorted_set,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _sorted_set(o: Any):
+    if isinstance(o, (set, frozenset)):
+        return sorted(o)
+    raise TypeError
+
+
 @tracer.wrap(service=apm.ApmService.ELIGIBILITY_TASKS, resource=RESOURCE)
 async def sync_all_mono_external_ids(
     configs: configuration_client.Configurations, mono: mclient.MavenMonoClient
@@ -168,22 +211,32 @@ async def sync_all_mono_external_ids(
             metric_name=f"{_STATS_PREFIX}.sync_external_ids.skipped", pod_name=_POD
         )
 
-    # Enter a transaction- delete all existing external_ids and recreate
-    # Because of resolution and indexing, it's easier to just drop the externalIDs and recreate
-    # This will hopefully be replaced when we move to syncing org_external_ids a little more tactically for our external integrations
-    logger.info("Handling batch of external IDs (%s).", len(valid_external_ids))
+    # Diff against what we already have, so we only touch the rows which changed.
+    existing = await configs.get_all_external_ids()
+    upserts, deletes = diff_external_ids(existing, valid_external_ids)
+    logger.info(
+        "Handling batch of external IDs (%s).",
+        len(valid_external_ids),
+        upserts=len(upserts),
+        deletes=len(deletes),
+    )
     stats.gauge(
         metric_name=f"{_STATS_PREFIX}.external_ids.batch.size",
         pod_name=_POD,
         metric_value=len(valid_external_ids),
     )
+    stats.gauge(
+        metric_name=f"{_STATS_PREFIX}.external_ids.batch.changed",
+        pod_name=_POD,
+        metric_value=len(upserts) + len(deletes),
+    )
     with stats.timed(
-        metric_name=f"{_STATS_PREFIX}.external_ids.batch.delete_and_recreate",
+        metric_name=f"{_STATS_PREFIX}.external_ids.batch.sync",
         pod_name=_POD,
     ):
         try:
-            await configs.delete_and_recreate_all_external_ids(valid_external_ids)
-            logger.info("Done recreating batch of external IDs.")
+            await configs.sync_external_ids(upserts, deletes)
+            logger.info("Done syncing batch of external IDs.")
         except Exception as e:
             stats.increment(
                 metric_name=f"{_STATS_PREFIX}.sync_external_ids.failed", pod_name=_POD
@@ -192,6 +245,37 @@ async def sync_all_mono_external_ids(
     logger.info("Done syncing external IDs to e9y.")
 
 
+def diff_external_ids(
+    existing: List[mclient.MavenOrgExternalID],
+    desired: List[mclient.MavenOrgExternalID],
+) -> Tuple[List[mclient.MavenOrgExternalID], List[mclient.MavenOrgExternalID]]:
+    """Get the external IDs to upsert and to delete, to turn `existing` into `desired`.
+
+    External IDs are unique by source & external ID. Those without a source (from data
+    providers) are unique by data provider & external ID. Both are matched exactly, as
+    they're looked up, so a change in case is a new external ID replacing the old one.
+    """
+    current = {_external_id_key(e): e for e in existing}
+    wanted = {_external_id_key(e): e for e in desired}
+    upserts = [
+        e
+        for key, e in wanted.items()
+        if (c := current.get(key)) is None
+        or (c.organization_id, c.data_provider_organization_id)
+        != (e.organization_id, e.data_provider_organization_id)
+    ]
+    deletes = [e for key, e in current.items() if key not in wanted]
+    return upserts, deletes
+
+
+def _external_id_key(
+    e: mclient.MavenOrgExternalID,
+) -> Tuple[Optional[str], Optional[int], str]:
+    if e.source:
+        return e.source, None, e.external_id
+    return None, e.data_provider_organization_id, e.external_id
+
+
 async def sync_single_mono_org_for_directory(
     configuration_client: Configurations,
     header_client: HeaderAliases,
@@ -1,44 +1,55 @@
+from __future__ import annotations
+
+import asyncio
 import datetime
+import enum
+import time
 from collections import OrderedDict
-from typing import Any, Optional
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
 
 """Heavily influenced by (lifted from) async-cache (https://pypi.org/project/async-cache/)
 """
 
+# Arguments of these types are used in the cache key as they are.
+_PRIMITIVES = frozenset(
+    (str, int, float, bool, bytes, type(None), datetime.date, datetime.datetime)
+)
+# Separates the positional arguments from the keyword arguments in a cache key.
+_KWARGS = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
 
 class AsyncTTLCache:
     """This class will keep a cached copy of the return values of async coroutines. It
     should only be used for coroutines that retrieve values. Any modification of values
     by the coroutine would not actually be run while a return value is stored in the
     cache.
-    """
 
-    class _CacheKey:
-        """This class is used to create the hash key for the cache, with the basic idea
-        being that the arguments passed to the cached function will be used as the
-        basis for the hash so that each call with different arguments will be stored
-        separately.
-        """
-
-        def __init__(self, *args, **kwargs):
-            self.args = args
-            self.kwargs = kwargs
-
-        def __eq__(self, obj):
-            return hash(self) == hash(obj)
+    Concurrent calls which miss the cache for the same arguments share a single call of
+    the coroutine, rather than each making their own.
+    """
 
-        def __hash__(self):
-            def _hash(param: Any):
-                if isinstance(param, tuple):
-                    return tuple(map(_hash, param))
-                if isinstance(param, dict):
-                    return tuple(map(_hash, param.items()))
-                elif hasattr(param, "__dict__"):
-                    return str(vars(param))
-                else:
-                    return str(param)
+    @staticmethod
+    def _make_key(args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+        """Build the key for the cache from the arguments passed to the cached function,
+        so that each call with different arguments will be stored separately.
 
-            return hash(_hash(self.args) + _hash(self.kwargs))
+        Arguments which are only hashable by identity - clients, services, and the
+        `self` of a cached method - don't describe *what* is being fetched, so they
+        are left out of the key.
+        """
+        if not kwargs and all(type(a) in _PRIMITIVES for a in args):
+            return args
+        key = tuple(map(_key_part, args))
+        if kwargs:
+            key += (_KWARGS, *((k, _key_part(v)) for k, v in kwargs.items()))
+        return key
 
     class _InnerCache(OrderedDict):
         """This class is used to store the returned values. It is an inner class to
@@ -47,78 +58,139 @@ class AsyncTTLCache:
         do this is so that when the maximum size is reached, the least recently
         used entry can easily be removed. The idea behind this is that if a value
         hasn't been used in a while, it is less likely to be needed any time soon.
+
+        Expiry is measured against the monotonic clock, so it isn't affected by changes
+        to the system time.
         """
 
         def __init__(
-            self, time_to_live: Optional[int] = 60, max_size: Optional[int] = 1024
+            self,
+            time_to_live: Optional[int] = 60,
+            max_size: Optional[int] = 1024,
+            negative_time_to_live: Optional[int] = None,
         ):
-            self.time_to_live = (
-                datetime.timedelta(seconds=time_to_live) if time_to_live else None
+            self.time_to_live = time_to_live or None
+            self.negative_time_to_live = (
+                negative_time_to_live
+                if negative_time_to_live is not None
+                else self.time_to_live
             )
             self.max_size = max_size
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
             super().__init__()
 
-        def __contains__(self, key):
-            if key not in self.keys():
-                return False
-            else:
-                key_expiration = super().__getitem__(key)[1]
-                if key_expiration and key_expiration < datetime.datetime.now():
-                    del self[key]
-                    return False
-                else:
-                    return True
-
-        def __getitem__(self, key):
-            value = super().__getitem__(key)[0]
+        def lookup(self, key) -> Tuple[bool, Any]:
+            """Get the value for this key, if we have it and it hasn't expired."""
+            entry = self.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            value, expiration = entry
+            if expiration is not None and expiration < time.monotonic():
+                del self[key]
+                self.evictions += 1
+                self.misses += 1
+                return False, None
             self.move_to_end(key)
-            return value
+            self.hits += 1
+            return True, value
 
-        def __setitem__(self, key, value):
-            time_to_live_value = self._get_time_to_live_value()
-            super().__setitem__(key, (value, time_to_live_value))
+        def store(self, key, value):
+            expiration = self._get_time_to_live_value(negative=not value)
+            self[key] = (value, expiration)
             if self.max_size and len(self) > self.max_size:
-                oldest = next(iter(self))
-                del self[oldest]
-
-        def _get_time_to_live_value(self):
-            return (
-                (datetime.datetime.now() + self.time_to_live)
-                if self.time_to_live
-                else None
-            )
+                self.popitem(last=False)
+                self.evictions += 1
+
+        def _get_time_to_live_value(self, negative: bool = False) -> Optional[float]:
+            time_to_live = self.negative_time_to_live if negative else self.time_to_live
+            return (time.monotonic() + time_to_live) if time_to_live else None
 
     def __init__(
-        self, time_to_live: Optional[int] = 60, max_size: Optional[int] = 1024
+        self,
+        time_to_live: Optional[int] = 60,
+        max_size: Optional[int] = 1024,
+        negative_time_to_live: Optional[int] = None,
     ):
         """If an integer value of time_to_live is provided, the cached copy will expire in
         that many seconds. If it is set to None, it will not expire.
 
+        If an integer value of negative_time_to_live is provided, empty results (None,
+        False, 0 or an empty collection) will instead expire in that many seconds, so
+        we notice sooner when they're filled in. It defaults to time_to_live.
+
         If an integer value of max_size is provided, the cache will only keep that many
         returned values in memory. If it is set to None, the cache size will not be
         limited. When the max size has been reached, the least recently used values will
         be pushed out.
         """
         self._inner_cache = self._InnerCache(
-            time_to_live=time_to_live, max_size=max_size
+            time_to_live=time_to_live,
+            max_size=max_size,
+            negative_time_to_live=negative_time_to_live,
         )
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
 
     def __call__(self, func):
+        inner_cache, in_flight = self._inner_cache, self._in_flight
+
         def reset():
             """This was added to allow resetting of the cache between tests."""
-            self._inner_cache.clear()
+            inner_cache.clear()
+            in_flight.clear()
+            inner_cache.hits = inner_cache.misses = inner_cache.evictions = 0
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(
+                hits=inner_cache.hits,
+                misses=inner_cache.misses,
+                evictions=inner_cache.evictions,
+                size=len(inner_cache),
+            )
 
-        async def wrapper(*args, **kwargs):
-            key = self._CacheKey(args, kwargs)
-            if key in self._inner_cache:
-                val = self._inner_cache[key]
-            else:
-                self._inner_cache[key] = await func(*args, **kwargs)
-                val = self._inner_cache[key]
+        def complete(key, task: asyncio.Future):
+            if in_flight.get(key) is task:
+                del in_flight[key]
+            # Failures aren't cached - the next call will try again.
+            if task.cancelled() or task.exception() is not None:
+                return
+            inner_cache.store(key, task.result())
 
-            return val
+        async def wrapper(*args, **kwargs):
+            key = self._make_key(args, kwargs)
+            found, val = inner_cache.lookup(key)
+            if found:
+                return val
+
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[key] = task
+                # Registered before anyone awaits the task, so the value is cached
+                #   before any of the callers resume.
+                task.add_done_callback(lambda t: complete(key, t))
+            # A caller which is cancelled shouldn't cancel the call for everyone else.
+            return await asyncio.shield(task)
 
         wrapper.__name__ += func.__name__
         wrapper.reset = reset
+        wrapper.cache_info = cache_info
 
         return wrapper
+
+
+def _key_part(param: Any) -> Hashable:
+    kind = type(param)
+    if kind in _PRIMITIVES or isinstance(param, enum.Enum):
+        return param
+    if kind is tuple or kind is list:
+        return tuple(map(_key_part, param))
+    if kind is dict:
+        return tuple((k, _key_part(v)) for k, v in param.items())
+    if kind.__hash__ is object.__hash__:
+        return kind
+    if kind.__hash__ is not None:
+        return param
+    return str(vars(param)) if hasattr(param, "__dict__") else str(param)
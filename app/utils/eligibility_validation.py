@@ -6,8 +6,7 @@ from typing import List, Optional
 
 from mmlib.ops import log
 
-from app.eligibility import errors
-from app.utils import async_ttl_cache
+from app.eligibility import configuration_cache, errors
 from db import model
 from db.clients import configuration_client
 from db.model import MemberVersioned
@@ -36,19 +35,21 @@ def is_effective_range_activated(
     return activated_at.date() < effective_range.upper
 
 
-@async_ttl_cache.AsyncTTLCache(time_to_live=30 * 60, max_size=1024)
 async def is_cached_organization_active(
     organization_id: int, configs: configuration_client.Configurations
 ) -> bool:
-    organization = await configs.get(organization_id)
+    organization = await configuration_cache.cache().get(
+        organization_id, configs=configs
+    )
     return is_organization_activated(organization)
 
 
-@async_ttl_cache.AsyncTTLCache(time_to_live=30 * 60, max_size=1024)
 async def cached_organization_eligibility_type(
     organization_id: int, configs: configuration_client.Configurations
 ) -> str | None:
-    organization = await configs.get(organization_id)
+    organization = await configuration_cache.cache().get(
+        organization_id, configs=configs
+    )
     return organization.eligibility_type
 
 
@@ -1,28 +1,82 @@
-from typing import Set
+import time
+from typing import Any, Callable, Dict, FrozenSet, Set, Tuple
 
 from maven import feature_flags
 
 from app.eligibility import constants as e9y_constants
 
+# How long, in seconds, we'll keep using a flag's value before evaluating it again.
+#   These flags are checked per record on the hot paths of the API and the parser.
+SNAPSHOT_TIME_TO_LIVE = 10
+
+_SNAPSHOTS: Dict[str, Tuple[float, Any]] = {}
+
+
+def _snapshot(flag: str, evaluate: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    snapshot = _SNAPSHOTS.get(flag)
+    if snapshot is not None and snapshot[0] > now:
+        return snapshot[1]
+    value = evaluate()
+    _SNAPSHOTS[flag] = (now + SNAPSHOT_TIME_TO_LIVE, value)
+    return value
+
+
+def _enabled_orgs(flag: str) -> FrozenSet[int]:
+    """Get the organizations in a flag's list, from a snapshot of the flag."""
+    return _snapshot(
+        flag, lambda: frozenset(feature_flags.json_variation(flag, default=[]))
+    )
+
+
+def _is_enabled(flag: str) -> bool:
+    """Get whether a boolean flag is on, from a snapshot of the flag."""
+    return _snapshot(flag, lambda: feature_flags.bool_variation(flag, default=False))
+
+
+def reset_snapshots():
+    """Forget all flag snapshots, so the next check evaluates the flag."""
+    _SNAPSHOTS.clear()
+
 
 def organization_enabled_for_e9y_2_read(organization_id: int) -> bool:
-    enabled_orgs = set(
-        feature_flags.json_variation(
-            e9y_constants.E9yFeatureFlag.RELEASE_ELIGIBILITY_2_ENABLED_ORGS_READ,
-            default=[],
-        )
+    return organization_id in _enabled_orgs(
+        e9y_constants.E9yFeatureFlag.RELEASE_ELIGIBILITY_2_ENABLED_ORGS_READ
     )
-    return organization_id in enabled_orgs
 
 
 def organization_enabled_for_e9y_2_write(organization_id: int) -> bool:
-    enabled_orgs = set(
-        feature_flags.json_variation(
-            e9y_constants.E9yFeatureFlag.RELEASE_ELIGIBILITY_2_ENABLED_ORGS_WRITE,
-            default=[],
-        )
+    return organization_id in _enabled_orgs(
+        e9y_constants.E9yFeatureFlag.RELEASE_ELIGIBILITY_2_ENABLED_ORGS_WRITE
+    )
+
+
+def is_e9y_2_speculative_read_enabled() -> bool:
+    return _is_enabled(e9y_constants.E9yFeatureFlag.RELEASE_E9Y_2_SPECULATIVE_READS)
+
+
+def organization_enabled_for_copy_staging_writes(organization_id: int) -> bool:
+    return organization_id in _enabled_orgs(
+        e9y_constants.E9yFeatureFlag.RELEASE_COPY_STAGING_WRITES_ENABLED_ORGS
+    )
+
+
+def organization_enabled_for_sharded_parse(organization_id: int) -> bool:
+    return organization_id in _enabled_orgs(
+        e9y_constants.E9yFeatureFlag.RELEASE_SHARDED_PARSE_ENABLED_ORGS
+    )
+
+
+def organization_enabled_for_hash_prefilter(organization_id: int) -> bool:
+    return organization_id in _enabled_orgs(
+        e9y_constants.E9yFeatureFlag.RELEASE_HASH_PREFILTER_ENABLED_ORGS
+    )
+
+
+def organization_enabled_for_chunked_flush(organization_id: int) -> bool:
+    return organization_id in _enabled_orgs(
+        e9y_constants.E9yFeatureFlag.RELEASE_CHUNKED_FLUSH_ENABLED_ORGS
     )
-    return organization_id in enabled_orgs
 
 
 def is_overeligibility_enabled() -> bool:
@@ -61,7 +115,4 @@ def is_write_disabled() -> bool:
 
 
 def is_optum_file_logging_enabled() -> bool:
-    return feature_flags.bool_variation(
-        e9y_constants.E9yFeatureFlag.RELEASE_OPTUM_FILE_LOGGING_SWITCH,
-        default=False,
-    )
+    return _is_enabled(e9y_constants.E9yFeatureFlag.RELEASE_OPTUM_FILE_LOGGING_SWITCH)
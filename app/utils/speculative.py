@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Speculative(Generic[T]):
+    """A read we may start before we know whether we'll need its result.
+
+    When `enabled`, the awaitable returned by `factory` is scheduled as a task as soon
+    as we enter the context, so it runs concurrently with whatever we're doing to
+    decide whether we need it. Otherwise, `factory` is only called if we await
+    `result()`. Either way, a read which is still running when we leave the context
+    is cancelled and its outcome discarded.
+
+    Usage:
+        async with Speculative(lambda: fetch_v2(), enabled=True) as v2:
+            v1 = await fetch_v1()
+            if needs_v2(v1):
+                return await v2.result()
+    """
+
+    __slots__ = ("factory", "enabled", "task")
+
+    def __init__(self, factory: Callable[[], Awaitable[T]], *, enabled: bool):
+        self.factory = factory
+        self.enabled = enabled
+        self.task: Optional[asyncio.Task] = None
+
+    def __repr__(self):
+        enabled, task = self.enabled, self.task
+        return f"<{self.__class__.__name__} {enabled=} {task=}>"
+
+    async def __aenter__(self) -> Speculative[T]:
+        if self.enabled:
+            self.task = asyncio.ensure_future(self.factory())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self.task is None:
+            return
+        if not self.task.done():
+            self.task.cancel()
+        self.task.add_done_callback(_discard)
+
+    async def result(self) -> T:
+        """Wait for the speculative read, or perform it now if it was never started."""
+        if self.task is None:
+            return await self.factory()
+        return await self.task
+
+
+def _discard(task: asyncio.Future):
+    # Mark the outcome as retrieved, so an unused read that failed isn't reported
+    #   as an unhandled exception.
+    if not task.cancelled():
+        task.exception()
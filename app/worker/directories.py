@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import time
+from typing import Dict
+
+from mmlib.ops import log, stats
+
+import constants
+from app.tasks import sync
+from db import model
+from db.clients import configuration_client, header_aliases_client
+from db.mono import client as mono_client
+
+logger = log.getLogger(__name__)
+
+# How long, in seconds, we'll trust e9y's configuration for a directory after syncing
+#   it from mono, before we sync it again.
+SYNC_MAX_AGE = 15 * 60
+
+
+class DirectoryIndex:
+    """Resolves the directory a file landed in to its organization's configuration.
+
+    Syncing a directory's organization from mono takes several round-trips to mono and
+    rewrites its configuration, headers and external IDs. A burst of files for the same
+    directory (e.g., the children of a split file) only needs that once, so once we've
+    synced a directory, we read its configuration from e9y until it's `max_age` old.
+    """
+
+    __slots__ = ("configs", "headers", "mono", "max_age", "synced_at")
+
+    def __init__(
+        self,
+        configs: configuration_client.Configurations,
+        headers: header_aliases_client.HeaderAliases,
+        mono: mono_client.MavenMonoClient,
+        *,
+        max_age: float = SYNC_MAX_AGE,
+    ):
+        self.configs = configs
+        self.headers = headers
+        self.mono = mono
+        self.max_age = max_age
+        # The (monotonic) time we last synced each directory.
+        self.synced_at: Dict[str, float] = {}
+
+    def __repr__(self):
+        size, max_age = len(self.synced_at), self.max_age
+        return f"<{self.__class__.__name__} {size=} {max_age=}>"
+
+    def is_fresh(self, directory: str) -> bool:
+        synced_at = self.synced_at.get(directory)
+        return synced_at is not None and time.monotonic() - synced_at < self.max_age
+
+    async def resolve(self, directory: str) -> model.Configuration | None:
+        if self.is_fresh(directory):
+            configuration = await self.configs.get_by_directory_name(directory)
+            if configuration is not None:
+                stats.increment(
+                    metric_name="eligibility.process.pubsub.directory_index",
+                    pod_name=constants.POD,
+                    tags=["result:hit"],
+                )
+                return configuration
+
+        stats.increment(
+            metric_name="eligibility.process.pubsub.directory_index",
+            pod_name=constants.POD,
+            tags=["result:miss"],
+        )
+        configuration = await sync.sync_single_mono_org_for_directory(
+            self.configs, self.headers, self.mono, directory
+        )
+        if configuration is None:
+            self.synced_at.pop(directory, None)
+        else:
+            self.synced_at[directory] = time.monotonic()
+        return configuration
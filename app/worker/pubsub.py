@@ -11,11 +11,11 @@ from structlog.contextvars import bind_contextvars, unbind_contextvars
 
 import constants
 from app.eligibility import convert
-from app.tasks.sync import sync_single_mono_org_for_directory
 from app.utils import async_ttl_cache, utils
 from app.utils.eligibility_validation import is_effective_range_activated
 from app.utils.utils import detect_and_sanitize_possible_ssn
 from app.worker import types
+from app.worker.directories import DirectoryIndex
 from config import settings
 from constants import APP_NAME
 from db import model
@@ -25,6 +25,7 @@ from db.clients import (
     header_aliases_client,
     member_client,
     member_versioned_client,
+    postgres_connector,
 )
 from db.mono import client as mono_client
 
@@ -51,6 +52,7 @@ async def file_notification_handler(
     headers = header_aliases_client.HeaderAliases()
 
     mono = mono_client.MavenMonoClient()
+    directories = DirectoryIndex(configs, headers, mono)
     redis_dsn = make_dsn(redis_settings.host, password=redis_settings.password)
     async with redis.RedisStreamPublisher(
         topic="pending-file", name=subscriptions.name, dsn=redis_dsn
@@ -63,10 +65,9 @@ async def file_notification_handler(
                 logger.info("Got a directory. Ignoring.")
                 continue
 
-            # Retrieve the configuration from mono associated with this file and persist its associated headers and external_ids
-            configuration = await sync_single_mono_org_for_directory(
-                configs, headers, mono, directory
-            )
+            # Retrieve the configuration associated with this file, syncing it (and its
+            #   headers and external_ids) from mono if we haven't done so recently.
+            configuration = await directories.resolve(directory)
 
             if configuration is None:
                 continue
@@ -136,19 +137,20 @@ async def external_record_notification_handler(
             )
             continue
 
-        (
-            persisted_members,
-            persisted_addresses,
-        ) = await members.bulk_persist_external_records(external_records=records)
-
-        # Unfortunately we cannot filter our hashing logic by org for external records (we get a mix of records),
-        # but the logic to insert hashed values should work for orgs where we did not enable the hash values to be generated
-        (
-            persisted_members_versioned,
-            persisted_addresses_versioned,
-        ) = await members_versioned.bulk_persist_external_records_hash(
-            external_records=records
-        )
+        with postgres_connector.workload(postgres_connector.BATCH):
+            (
+                persisted_members,
+                persisted_addresses,
+            ) = await members.bulk_persist_external_records(external_records=records)
+
+            # Unfortunately we cannot filter our hashing logic by org for external records (we get a mix of records),
+            # but the logic to insert hashed values should work for orgs where we did not enable the hash values to be generated
+            (
+                persisted_members_versioned,
+                persisted_addresses_versioned,
+            ) = await members_versioned.bulk_persist_external_records_hash(
+                external_records=records
+            )
 
         logger.info(
             "Persisted member records.",
@@ -376,14 +378,16 @@ async def retrieve_external_org_info(
     return external_org_id[0]
 
 
-@async_ttl_cache.AsyncTTLCache(time_to_live=30 * 60, max_size=1024)
+@async_ttl_cache.AsyncTTLCache(
+    time_to_live=30 * 60, max_size=1024, negative_time_to_live=60
+)
 async def get_cached_external_org_infos_by_value(
     source: str,
     external_id: str,
     configs: configuration_client.Configurations,
 ) -> List[model.ExternalMavenOrgInfo]:
     """TTL Cache of the external ID mapping. Caches up to 1024 of the most
-    recent returned values for 30 minutes.
+    recent returned values for 30 minutes, or 1 minute if there was no mapping.
     """
     # TODO: This will need to be updated to use the data provider ID when we transition optum records over in the external_id table
     # once we have provider ID, call `get_external_org_infos_by_value_and_data_provider`
@@ -8,13 +8,13 @@ import structlog
 from mmlib.ops import stats
 from mmlib.redis.client import make_dsn
 from mmstream import redis
-from structlog.contextvars import bind_contextvars, unbind_contextvars
+from structlog.contextvars import bind_contextvars
 
 import constants
 from app.eligibility import process
 from app.eligibility.constants import ProcessingResult
 from app.eligibility.domain.model.parsed_records import ProcessedRecords
-from app.worker import types
+from app.worker import scheduler, types
 from config import settings
 from constants import APP_NAME
 from db import model
@@ -24,109 +24,217 @@ REDIS_DSN = make_dsn(redis_settings.host, password=redis_settings.password)
 stream_supervisor = redis.RedisStreamSupervisor(APP_NAME, dsn=REDIS_DSN)
 
 SLA_MS = int(pendulum.duration(hours=8).total_seconds() * 1_000)
+GROUP = APP_NAME
 
 logger = structlog.getLogger(__name__)
 
 
 @stream_supervisor.consumer(
     "pending-file",
-    group=APP_NAME,
+    group=GROUP,
     model=types.PendingFileNotification,
     timeoutms=SLA_MS,
 )
 async def process_file(
     stream: redis.RedisStream[model.File],
 ) -> AsyncIterator[process.ProcessedRecords]:
-    """Read in a file and attempt to normalize its contents before shipping off for storage"""
+    """Read in a file and attempt to normalize its contents before shipping off for storage
+
+    Files are processed concurrently, as scheduled by a `FileScheduler`: small and
+    large files are processed in separate lanes and an organization's files are
+    processed one at a time, in the order we received them.
+    """
     # General globals for processing
     bucket = settings.GCP().census_file_bucket
+    worker_settings = settings.FileWorker()
 
     loop = asyncio.get_event_loop()
+    file_scheduler = scheduler.FileScheduler(
+        concurrency=worker_settings.concurrency,
+        large_concurrency=worker_settings.large_concurrency,
+        large_file_size=worker_settings.large_file_size,
+    )
     processor = process.EligibilityFileProcessor(
         bucket=bucket,
         project=stream_supervisor.project,
         project_supervisor=stream_supervisor.name,
         loop=loop,
+        flush_concurrency=flush_concurrency(
+            worker_settings.flush_concurrency,
+            file_concurrency=file_scheduler.concurrency,
+            pool_size=settings.DB().batch_pool_max_size,
+        ),
     )
-    logger.info("Listening for new files.")
-    async for key, messageid, notification in stream:
-        file = await processor.files.get(notification.file_id)
-        if not file:
-            logger.warning(
-                "Couldn't locate File with ID.", file_id=notification.file_id
+    completed: asyncio.Queue[ProcessedRecords | None] = asyncio.Queue()
+
+    async def handle(
+        key: str,
+        messageid: str,
+        file: model.File,
+        config: model.Configuration,
+        turn: scheduler.FileTurn,
+    ):
+        try:
+            processed = await _process_file(
+                processor, file_scheduler, key, messageid, file, config, turn
             )
-            continue
-
-        config = await processor.configs.get(file.organization_id)
-
-        bind_contextvars(
-            file_id=file.id,
-            filename=file.name,
-            organization_id=config.organization_id,
-            stream=key,
-            message_id=messageid,
-        )
+        except Exception as e:
+            # N.B. - We don't acknowledge the notification, so it stays pending for
+            #   our consumer group instead of being dropped with its file.
+            logger.exception(
+                "Unhandled error processing file",
+                file_id=file.id,
+                organization_id=file.organization_id,
+                error=e,
+            )
+            return
+        finally:
+            file_scheduler.finish(turn)
+        # The stream moves on as soon as we've read a notification, long before
+        #   we're done with its file, so acknowledge it ourselves once we are.
+        try:
+            await _ack(stream, key, messageid)
+        except Exception as e:
+            logger.exception(
+                "Couldn't acknowledge processed file",
+                file_id=file.id,
+                organization_id=file.organization_id,
+                error=e,
+            )
+        if processed:
+            await completed.put(processed)
+
+    async def dispatch():
+        tasks = set()
+        try:
+            async for key, messageid, notification in stream:
+                await file_scheduler.reserve()
+                try:
+                    file = await processor.files.get(notification.file_id)
+                    if not file:
+                        logger.warning(
+                            "Couldn't locate File with ID.",
+                            file_id=notification.file_id,
+                        )
+                        await _ack(stream, key, messageid)
+                        file_scheduler.unreserve()
+                        continue
+
+                    config = await processor.configs.get(file.organization_id)
+                except BaseException:
+                    file_scheduler.unreserve()
+                    raise
+                # N.B. - Files are processed in the order they're admitted, so we must
+                #   admit each one before reading the next.
+                turn = file_scheduler.admit(file.organization_id)
+                task = asyncio.create_task(handle(key, messageid, file, config, turn))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await completed.put(None)
+
+    logger.info("Listening for new files.", scheduler=file_scheduler)
+    dispatcher = asyncio.create_task(dispatch())
+    try:
+        while (processed := await completed.get()) is not None:
+            yield processed
+        # Surface any error from reading the stream.
+        await dispatcher
+    finally:
+        dispatcher.cancel()
+        await asyncio.gather(dispatcher, return_exceptions=True)
+
+
+def flush_concurrency(requested: int, *, file_concurrency: int, pool_size: int) -> int:
+    """Cap the organizations a file may flush at once to its share of the batch pool.
+
+    Each organization is flushed on its own connection, and every file we're
+    processing at once shares the same pool.
+    """
+    return max(min(requested, pool_size // max(file_concurrency, 1)), 1)
+
+
+async def _process_file(
+    processor: process.EligibilityFileProcessor,
+    file_scheduler: scheduler.FileScheduler,
+    key: str,
+    messageid: str,
+    file: model.File,
+    config: model.Configuration,
+    turn: scheduler.FileTurn,
+) -> ProcessedRecords | None:
+    # Each file is processed in its own task, so these are scoped to this file.
+    bind_contextvars(
+        file_id=file.id,
+        filename=file.name,
+        organization_id=config.organization_id,
+        stream=key,
+        message_id=messageid,
+    )
 
+    size = await processor.file_size(file)
+    logger.info(
+        "File waiting to be processed",
+        size=size,
+        large=file_scheduler.is_large(size),
+    )
+    async with file_scheduler.slot(turn, size=size):
         logger.info("File parsing starting")
 
         result: ProcessingResult
         processed: ProcessedRecords
         result, processed = await processor.process(key, messageid, file, config)
 
-        if result == ProcessingResult.NO_RECORDS_FOUND:
-            logger.warning("No data processed for file.")
-            unbind_contextvars(
-                "file_id", "filename", "organization_id", "stream", "message_id"
-            )
-            continue
-        elif result == ProcessingResult.ERROR_DURING_PROCESSING:
-            logger.warning("Error processing file")
-            unbind_contextvars(
-                "file_id", "filename", "organization_id", "stream", "message_id"
-            )
-            continue
-        elif result == ProcessingResult.FILE_MISSING:
-            logger.warning("File not found")
-            unbind_contextvars(
-                "file_id", "filename", "organization_id", "stream", "message_id"
-            )
-            continue
-        elif result == ProcessingResult.BAD_FILE_ENCODING:
-            logger.warning("Error detecting file encoding")
-            unbind_contextvars(
-                "file_id", "filename", "organization_id", "stream", "message_id"
-            )
-            continue
-
-        stats.increment(
-            metric_name="eligibility.process.file_parse.valid_rows_encountered",
-            metric_value=processed.valid,
-            pod_name=constants.POD,
-            tags=[
-                "eligibility:info",
-                f"organization_id:{file.organization_id}",
-                f"file_id:{file.id}",
-            ],
-        )
-        stats.increment(
-            metric_name="eligibility.process.file_parse.error_rows_encountered",
-            metric_value=processed.errors,
-            pod_name=constants.POD,
-            tags=[
-                "eligibility:info",
-                f"organization_id:{file.organization_id}",
-                f"file_id:{file.id}",
-            ],
-        )
-
-        logger.info(
-            "File parsing complete",
-            errors=processed.errors,
-            valid=processed.valid,
-        )
-
-        unbind_contextvars(
-            "file_id", "filename", "organization_id", "stream", "message_id"
-        )
-
-        yield processed
+    if result == ProcessingResult.NO_RECORDS_FOUND:
+        logger.warning("No data processed for file.")
+        return None
+    elif result == ProcessingResult.ERROR_DURING_PROCESSING:
+        logger.warning("Error processing file")
+        return None
+    elif result == ProcessingResult.FILE_MISSING:
+        logger.warning("File not found")
+        return None
+    elif result == ProcessingResult.BAD_FILE_ENCODING:
+        logger.warning("Error detecting file encoding")
+        return None
+
+    stats.increment(
+        metric_name="eligibility.process.file_parse.valid_rows_encountered",
+        metric_value=processed.valid,
+        pod_name=constants.POD,
+        tags=[
+            "eligibility:info",
+            f"organization_id:{file.organization_id}",
+            f"file_id:{file.id}",
+        ],
+    )
+    stats.increment(
+        metric_name="eligibility.process.file_parse.error_rows_encountered",
+        metric_value=processed.errors,
+        pod_name=constants.POD,
+        tags=[
+            "eligibility:info",
+            f"organization_id:{file.organization_id}",
+            f"file_id:{file.id}",
+        ],
+    )
+
+    logger.info(
+        "File parsing complete",
+        errors=processed.errors,
+        valid=processed.valid,
+    )
+
+    return processed
+
+
+async def _ack(stream: redis.RedisStream, key: str, messageid: str):
+    """Acknowledge a notification, so it isn't redelivered to our consumer group.
+
+    `stream.redis` is the stream's aioredis client. XACK is idempotent, so this is
+    safe even if the notification has already been acknowledged.
+    """
+    await stream.redis.xack(key, GROUP, messageid)
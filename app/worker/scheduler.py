@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import AsyncIterator, Dict
+
+
+class FileScheduler:
+    """Decides when a worker may start processing a file.
+
+    At most `concurrency` files are processed at once. A file is "large" if it's at
+    least `large_file_size` bytes. Large files may only take `large_concurrency` of
+    those slots, so the rest are reserved for small files and a backlog of large
+    files can never block the small ones.
+
+    Only one file per organization is processed at a time, in the order they were
+    admitted, so we never flush two files for the same organization at once.
+    """
+
+    __slots__ = (
+        "concurrency",
+        "large_concurrency",
+        "large_file_size",
+        "pending",
+        "running",
+        "large",
+        "turns",
+    )
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        large_concurrency: int,
+        large_file_size: int,
+    ):
+        self.concurrency = max(concurrency, 1)
+        # Keep at least one slot for small files, if we have more than one.
+        self.large_concurrency = min(
+            max(large_concurrency, 1), max(self.concurrency - 1, 1)
+        )
+        self.large_file_size = large_file_size
+        # Bound the number of files we've read from the stream which could start now,
+        #   leaving room for files which are waiting on a free slot in their lane.
+        #   Files queued behind their organization, or waiting for the large lane,
+        #   don't hold one of these, so a burst of files for one organization or of
+        #   large files can't stop us reading the others.
+        self.pending = asyncio.Semaphore(self.concurrency * 2)
+        self.running = asyncio.Semaphore(self.concurrency)
+        self.large = asyncio.Semaphore(self.large_concurrency)
+        # The last file admitted for each organization with files in flight.
+        self.turns: Dict[int, FileTurn] = {}
+
+    def __repr__(self):
+        concurrency, large_concurrency = self.concurrency, self.large_concurrency
+        return f"<{self.__class__.__name__} {concurrency=} {large_concurrency=}>"
+
+    def is_large(self, size: int | None) -> bool:
+        return size is not None and size >= self.large_file_size
+
+    async def reserve(self):
+        """Wait until there's room to read another file from the stream."""
+        await self.pending.acquire()
+
+    def unreserve(self):
+        """Give back a reservation which we didn't admit a file with."""
+        self.pending.release()
+
+    def admit(self, organization_id: int) -> FileTurn:
+        """Queue a file behind any others for its organization, using our reservation.
+
+        Files are processed in the order they're admitted, so admit them in the order
+        they're read. Every turn must be finished with `finish`.
+        """
+        previous = self.turns.get(organization_id)
+        turn = FileTurn(organization_id, previous=previous)
+        self.turns[organization_id] = turn
+        turn.done.add_done_callback(lambda _: self._forget(turn))
+        if previous is not None:
+            # We won't be able to start until the files ahead of us are done.
+            self.unreserve()
+        else:
+            turn.reserved = True
+        return turn
+
+    @contextlib.asynccontextmanager
+    async def slot(self, turn: FileTurn, *, size: int | None) -> AsyncIterator[None]:
+        """Wait for the organization's turn, then a free slot in the file's lane."""
+        if turn.previous is not None:
+            # N.B. - Shielded, so we don't cancel it for the files behind us.
+            await asyncio.shield(turn.previous.done)
+            turn.previous = None
+        if self.is_large(size):
+            # N.B. - Don't hold a reservation while we wait for the large lane, or a
+            #   backlog of large files would stop us reading the small ones.
+            self._unreserve(turn)
+            async with self.large:
+                await self._reserve(turn)
+                async with self.running:
+                    yield
+        else:
+            await self._reserve(turn)
+            async with self.running:
+                yield
+
+    def finish(self, turn: FileTurn):
+        """Let the organization's next file go, whether or not this one got a slot."""
+        self._unreserve(turn)
+        if turn.done.done():
+            return
+        previous = turn.previous
+        if previous is not None and not previous.done.done():
+            # We never got our turn, so the files behind us still have to wait for
+            #   the ones ahead of us.
+            previous.done.add_done_callback(lambda _: self.finish(turn))
+        else:
+            turn.done.set_result(None)
+
+    async def _reserve(self, turn: FileTurn):
+        if not turn.reserved:
+            await self.reserve()
+            turn.reserved = True
+
+    def _unreserve(self, turn: FileTurn):
+        if turn.reserved:
+            self.unreserve()
+            turn.reserved = False
+
+    def _forget(self, turn: FileTurn):
+        if self.turns.get(turn.organization_id) is turn:
+            del self.turns[turn.organization_id]
+
+
+class FileTurn:
+    """A file's place in the queue for its organization."""
+
+    __slots__ = ("organization_id", "previous", "reserved", "done")
+
+    def __init__(self, organization_id: int, *, previous: FileTurn | None = None):
+        self.organization_id = organization_id
+        self.previous = previous
+        self.reserved = False
+        self.done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def __repr__(self):
+        organization_id, reserved = self.organization_id, self.reserved
+        return f"<{self.__class__.__name__} {organization_id=} {reserved=}>"
@@ -1,3 +1,5 @@
+from cleo.helpers import option
+
 from bin.commands.base import BaseAppCommand
 
 SUBTITLE = "purge-expired-records"
@@ -9,8 +11,19 @@ class PurgeExpiredRecordsCommand(BaseAppCommand):
     name = "purge-expired-records"
     subtitle = SUBTITLE
 
+    options = [
+        option(
+            "concurrency",
+            None,
+            "How many organizations to purge at once.",
+            flag=False,
+            value_required=True,
+            default=10,
+        ),
+    ]
+
     def handle(self) -> int:
         from app.tasks import purge_expired_records
 
-        purge_expired_records.main()
+        purge_expired_records.main(concurrency=int(self.option("concurrency")))
         return 0
@@ -1,3 +1,5 @@
+from cleo.helpers import option
+
 from bin.commands.base import BaseAppCommand
 
 SUBTITLE = """
@@ -16,8 +18,17 @@ class SyncCommand(BaseAppCommand):
     name = "sync"
     subtitle = SUBTITLE
 
+    options = [
+        option(
+            "full",
+            None,
+            "Persist every organization, even if it hasn't changed since the last sync.",
+            flag=True,
+        ),
+    ]
+
     def handle(self) -> int:
         from app.tasks import sync
 
-        sync.main()
+        sync.main(full=self.option("full"))
         return 0
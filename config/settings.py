@@ -61,6 +61,9 @@ class GCP:
     census_file_group: str = "my-topic-sub"
     census_file_group_tmp: str = "my-topic-sub-2"
     census_file_group_split: str = "file-split-sub"
+    # The KMS keys we encrypt the child files of a split file with.
+    census_file_kek_name: str = ""
+    census_file_signing_key_name: str = ""
     integrations_topic: str = "eligibility-integrations"
     integrations_group: str = "e9y-integrations-workers"
     unprocessed_topic: str = "unprocessed-topic"
@@ -75,6 +78,18 @@ class Redis:
     password: str = ""
 
 
+@typic.settings(prefix="FILE_WORKER_")
+class FileWorker:
+    # The number of files a single pod may process at once.
+    concurrency: int = 4
+    # How many of those may be large files.
+    large_concurrency: int = 1
+    large_file_size: int = 256 * 1024 * 1024
+    # The number of organizations in a data-provider file we may flush at once. This is
+    #   capped to the file's share of the batch pool, across `concurrency` files.
+    flush_concurrency: int = 4
+
+
 @typic.settings(prefix="DB_")
 class DB:
     scheme: str = "postgresql"
@@ -86,6 +101,20 @@ class DB:
     schema: str = "eligibility"
     main_port: int = 5432
     read_port: int = 5434
+    # Connection pools, one per workload. The api pool serves requests, so it's kept
+    #   warm; the batch pool serves file processing and backfills, and grows and
+    #   shrinks with them so it can't take the api's connections.
+    api_pool_min_size: int = 10
+    api_pool_max_size: int = 10
+    api_acquire_timeout: float = 20
+    batch_pool_min_size: int = 0
+    batch_pool_max_size: int = 10
+    batch_acquire_timeout: float = 120
+    read_pool_min_size: int = 10
+    read_pool_max_size: int = 10
+    read_acquire_timeout: float = 20
+    # Close connections which have been idle this long (seconds), down to the min size.
+    pool_max_inactive_connection_lifetime: float = 300
 
 
 @typic.settings(prefix="MONO_DB_")
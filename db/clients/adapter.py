@@ -0,0 +1,58 @@
+"""Our aiosql driver adapter for asyncpg, which reports how long each query takes.
+
+https://github.com/nackjicholson/aiosql/blob/master/aiosql/adapters/asyncpg.py
+"""
+from __future__ import annotations
+
+from typing import Dict, List
+
+from aiosql.adapters.asyncpg import AsyncPGAdapter
+from mmlib.ops import stats
+
+import constants
+
+QUERY_METRIC = "eligibility.db.query"
+
+
+class TimedAsyncPGAdapter(AsyncPGAdapter):
+    """Times each query, tagged with its name (e.g., `member_2.get_by_dob_and_email`).
+
+    Cursors are left alone, since how long they're open is up to the caller.
+    """
+
+    def __init__(self, *, namespace: str):
+        super().__init__()
+        self.namespace = namespace
+        self._tags: Dict[str, List[str]] = {}
+
+    def timed(self, query_name: str):
+        tags = self._tags.get(query_name)
+        if tags is None:
+            tags = self._tags[query_name] = [f"query:{self.namespace}.{query_name}"]
+        return stats.timed(metric_name=QUERY_METRIC, pod_name=constants.POD, tags=tags)
+
+    async def select(self, conn, query_name, *args, **kwargs):
+        with self.timed(query_name):
+            return await super().select(conn, query_name, *args, **kwargs)
+
+    async def select_one(self, conn, query_name, *args, **kwargs):
+        with self.timed(query_name):
+            return await super().select_one(conn, query_name, *args, **kwargs)
+
+    async def select_value(self, conn, query_name, *args, **kwargs):
+        with self.timed(query_name):
+            return await super().select_value(conn, query_name, *args, **kwargs)
+
+    async def insert_returning(self, conn, query_name, *args, **kwargs):
+        with self.timed(query_name):
+            return await super().insert_returning(conn, query_name, *args, **kwargs)
+
+    async def insert_update_delete(self, conn, query_name, *args, **kwargs):
+        with self.timed(query_name):
+            return await super().insert_update_delete(conn, query_name, *args, **kwargs)
+
+    async def insert_update_delete_many(self, conn, query_name, *args, **kwargs):
+        with self.timed(query_name):
+            return await super().insert_update_delete_many(
+                conn, query_name, *args, **kwargs
+            )
@@ -31,7 +31,14 @@ from aiosql.types import QueryFn
 from inflection import underscore
 from mmlib.ops import log
 
-from db.clients.postgres_connector import PostgresConnector, cached_connectors, retry
+from db.clients import decoding
+from db.clients.adapter import TimedAsyncPGAdapter
+from db.clients.postgres_connector import (
+    WORKLOAD,
+    PostgresConnector,
+    cached_connectors,
+    retry,
+)
 from db.clients.utils import singleton
 
 QUERY_PATH = pathlib.Path(__file__).parent.parent / "queries"
@@ -67,11 +74,11 @@ class CoercingCursor:
 
     async def fetch(self, n: int, *, timeout: float = None):
         page = await self.cursor.fetch(n, timeout=timeout)
-        return page and self.service.bulk_protocol(({**r} for r in page))
+        return page and self.service.coerce_many(page)
 
     async def fetchrow(self, *, timeout: float = None):
         row = await self.cursor.fetchrow(timeout=timeout)
-        return row and self.service.protocol({**row})
+        return row and self.service.coerce(row)
 
 
 @overload
@@ -96,11 +103,7 @@ def _coerceable(func: _FuncT = None, *, bulk: bool = False):
             ):
                 coerce = kwargs.get("coerce", True)
                 res: Iterable[asyncpg.Record] = await func_(self, *args, **kwargs)
-                return (
-                    self.bulk_protocol.transmute(({**r} for r in res))
-                    if coerce and res
-                    else res
-                )
+                return self.coerce_many(res) if coerce and res else res
 
             return _maybe_coerce_bulk_result_wrapper
 
@@ -108,7 +111,7 @@ def _coerceable(func: _FuncT = None, *, bulk: bool = False):
         async def _maybe_coerce_result_wrapper(self: ServiceProtocol, *args, **kwargs):
             coerce = kwargs.get("coerce", True)
             res: Optional[asyncpg.Record] = await func_(self, *args, **kwargs)
-            return self.protocol.transmute({**res}) if coerce and res else res
+            return self.coerce(res) if coerce and res else res
 
         return _maybe_coerce_result_wrapper
 
@@ -167,7 +170,10 @@ class QueryLoader:
     def load(self, name: str) -> aiosql.queries.Queries:
         with self._lock:
             if name not in self._queries:
-                self._queries[name] = aiosql.from_path(QUERY_PATH / name, "asyncpg")
+                self._queries[name] = aiosql.from_path(
+                    QUERY_PATH / name,
+                    functools.partial(TimedAsyncPGAdapter, namespace=name),
+                )
             return self._queries[name]
 
 
@@ -196,7 +202,8 @@ class BoundClient(ClientProtocol):
     def _get_connector(self, read_only: bool = False):
         if read_only and "read" in self.connectors:
             return self.connectors["read"]
-        return self.connectors["main"]
+        # Writes go to the pool for the current workload, if we have one for it.
+        return self.connectors.get(WORKLOAD.get()) or self.connectors["main"]
 
     @property
     def connector(self):
@@ -312,6 +319,7 @@ class ServiceProtocol(ClientProtocol[T]):
     client: BoundClient
     protocol: typic.SerdeProtocol
     bulk_protocol: typic.SerdeProtocol
+    decoder: Optional[decoding.RecordDecoder]
     iterator: Callable[[T], Iterator[Tuple[str, Any]]]
     __exclude_fields__ = frozenset(("id", "created_at", "updated_at"))
 
@@ -326,6 +334,7 @@ class ServiceProtocol(ClientProtocol[T]):
         )
         cls.protocol = typic.protocol(cls.model, is_optional=True)
         cls.bulk_protocol = typic.protocol(Iterable[cls.model])
+        cls.decoder = decoding.decoder(cls.model)
         cls.iterator = typic.resolver.translator.iterator(cls.model)
         super().__init_subclass__()
 
@@ -357,6 +366,23 @@ class ServiceProtocol(ClientProtocol[T]):
     ):
         return await self.client.bulk_delete(*pks, connection=connection)
 
+    @classmethod
+    def coerce(cls, record: Union[asyncpg.Record, Mapping]) -> T:
+        """Coerce a row to our model, trusting the database's types if we can."""
+        if cls.decoder is not None and isinstance(record, asyncpg.Record):
+            return cls.decoder.decode(record)
+        return cls.protocol.transmute({**record})
+
+    @classmethod
+    def coerce_many(cls, records: Iterable[Union[asyncpg.Record, Mapping]]) -> list:
+        """Coerce rows to our model, trusting the database's types if we can."""
+        records = records if isinstance(records, list) else [*records]
+        if not records:
+            return []
+        if cls.decoder is not None and isinstance(records[0], asyncpg.Record):
+            return cls.decoder.decode_many(records)
+        return cls.bulk_protocol.transmute(({**r} for r in records))
+
     @classmethod
     def _get_kvs(cls, model: T) -> Mapping:
         return {
@@ -0,0 +1,123 @@
+"""Columnar reads of large result sets.
+
+Reading a whole organization as models builds a Record, a model and every field's
+value for each row, and parses each row's JSON documents, whether or not the caller
+needs them. A `ColumnCursor` instead fetches fixed-size batches from a server-side
+cursor and holds each batch as one tuple per column. A row is only built into a model
+when it's asked for, and JSON columns are kept as the raw bytes from the database
+until then.
+"""
+from __future__ import annotations
+
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import asyncpg
+import orjson
+
+from db.clients import decoding
+
+__all__ = ("ColumnBatch", "ColumnCursor")
+
+T = TypeVar("T")
+
+
+class ColumnBatch(Generic[T]):
+    """A batch of rows, held as one tuple of values per column."""
+
+    __slots__ = ("columns", "size", "decoder", "json_columns")
+
+    def __init__(
+        self,
+        columns: Dict[str, Sequence[Any]],
+        *,
+        size: int,
+        decoder: decoding.RecordDecoder,
+        json_columns: AbstractSet[str] = frozenset(),
+    ):
+        self.columns = columns
+        self.size = size
+        self.decoder = decoder
+        self.json_columns = json_columns
+
+    def __repr__(self):
+        model, size = self.decoder.model.__name__, self.size
+        return f"<{self.__class__.__name__} {model=} {size=}>"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, column: str) -> Sequence[Any]:
+        """Get the values of a column. JSON columns are left as bytes."""
+        return self.columns[column]
+
+    @classmethod
+    def from_records(
+        cls,
+        records: List[asyncpg.Record],
+        *,
+        decoder: decoding.RecordDecoder,
+        json_columns: AbstractSet[str] = frozenset(),
+    ) -> ColumnBatch:
+        names = tuple(records[0].keys()) if records else ()
+        return cls(
+            dict(zip(names, zip(*records))),
+            size=len(records),
+            decoder=decoder,
+            json_columns=json_columns,
+        )
+
+    def row(self, index: int) -> T:
+        """Build the model for a single row."""
+        json_columns = self.json_columns
+        values = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if value is not None and name in json_columns:
+                value = orjson.loads(value)
+            values[name] = value
+        return self.decoder.decode_values(values)
+
+    def rows(self) -> Iterator[T]:
+        """Build the model for each row, one at a time."""
+        return map(self.row, range(self.size))
+
+
+class ColumnCursor(Generic[T]):
+    """Fetches `ColumnBatch`es from a server-side cursor."""
+
+    __slots__ = ("cursor", "decoder", "json_columns")
+
+    def __init__(
+        self,
+        cursor: asyncpg.connection.cursor.Cursor,
+        *,
+        decoder: decoding.RecordDecoder,
+        json_columns: AbstractSet[str] = frozenset(),
+    ):
+        self.cursor = cursor
+        self.decoder = decoder
+        self.json_columns = json_columns
+
+    async def fetch(self, n: int, *, timeout: float = None) -> Optional[ColumnBatch[T]]:
+        """Fetch the next `n` rows, or None if we've read them all."""
+        records = await self.cursor.fetch(n, timeout=timeout)
+        if not records:
+            return None
+        return ColumnBatch.from_records(
+            records, decoder=self.decoder, json_columns=self.json_columns
+        )
+
+    async def batches(self, n: int) -> AsyncIterator[ColumnBatch[T]]:
+        while batch := await self.fetch(n):
+            yield batch
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Optional, TypedDict
+import datetime
+from typing import Dict, List, Optional, TypedDict
 
 import asyncpg
 import typic
@@ -123,6 +124,18 @@ class Configurations(ServiceProtocol[Configuration]):
         async with self.client.connector.connection(c=connection) as c:
             return await self.client.queries.get_for_files(c, file_ids=file_ids)
 
+    @_coerceable(bulk=True)
+    @retry
+    async def get_updated_since(
+        self,
+        updated_at: datetime.datetime,
+        *,
+        connection: asyncpg.Connection = None,
+        coerce: bool = True,
+    ) -> List[Configuration]:
+        async with self.client.connector.connection(c=connection) as c:
+            return await self.client.queries.get_updated_since(c, updated_at=updated_at)
+
     @retry
     async def get_external_ids(
         self,
@@ -146,6 +159,16 @@ class Configurations(ServiceProtocol[Configuration]):
             external_ids = await self.client.queries.get_all_external_ids(c)
             return typic.transmute(List[MavenOrgExternalID], external_ids)
 
+    @retry
+    async def get_sync_fingerprints(
+        self,
+        *,
+        connection: asyncpg.Connection = None,
+    ) -> Dict[int, str]:
+        async with self.client.connector.connection(c=connection) as c:
+            fingerprints = await self.client.queries.get_sync_fingerprints(c)
+            return {r["organization_id"]: r["fingerprint"] for r in fingerprints}
+
     @retry
     async def get_external_ids_by_data_provider(
         self,
@@ -269,6 +292,50 @@ class Configurations(ServiceProtocol[Configuration]):
             )
         return typic.transmute(List[MavenOrgExternalID], deleted)
 
+    @retry
+    async def sync_external_ids(
+        self,
+        upserts: List[MavenOrgExternalID],
+        deletes: List[MavenOrgExternalID],
+        *,
+        connection: asyncpg.Connection = None,
+    ):
+        """Apply a diff of external IDs, deleting before upserting so that moved IDs
+        don't collide with their old rows."""
+        async with self.client.connector.transaction(connection=connection) as c:
+            if deletes:
+                await self.client.queries.bulk_delete_external_ids(
+                    c,
+                    sources=[d.source for d in deletes],
+                    data_provider_organization_ids=[
+                        d.data_provider_organization_id for d in deletes
+                    ],
+                    external_ids=[d.external_id for d in deletes],
+                )
+            # External IDs without a source are unique by their data provider instead.
+            sourced = [u for u in upserts if u.source]
+            unsourced = [u for u in upserts if not u.source]
+            if sourced:
+                data = typic.primitive(sourced)
+                await self.client.queries.bulk_add_external_id(c, data)
+            if unsourced:
+                data = typic.primitive(unsourced)
+                await self.client.queries.bulk_add_data_provider_external_id(c, data)
+
+    @retry
+    async def bulk_persist_sync_fingerprints(
+        self,
+        fingerprints: Dict[int, str],
+        *,
+        connection: asyncpg.Connection = None,
+    ):
+        data = [
+            {"organization_id": organization_id, "fingerprint": fingerprint}
+            for organization_id, fingerprint in fingerprints.items()
+        ]
+        async with self.client.connector.transaction(connection=connection) as c:
+            return await self.client.queries.bulk_persist_sync_fingerprints(c, data)
+
     @retry
     async def delete_and_recreate_all_external_ids(
         self,
@@ -0,0 +1,256 @@
+"""Fast decoding of asyncpg Records into our dataclass models.
+
+Coercing a query result with `typic` copies each Record into a dict, then validates
+and converts every value against the model's annotations. The database has already
+done most of that work for us: a `date` column comes back as a `date`, and our json
+codecs hand back dicts and lists. So for a model whose fields are all types asyncpg
+gives us directly, we generate a function which reads each column by position and
+passes it straight to the model's `__init__`. The only conversions we make are the ones
+the database can't: enums and our `asyncpg.Range` subclasses (e.g., `DateRange`).
+
+A model with a field we can't trust the database for falls back to `typic`.
+"""
+from __future__ import annotations
+
+import collections.abc
+import dataclasses
+import datetime
+import decimal
+import enum
+import sys
+import typing
+import uuid
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import asyncpg
+
+__all__ = ("RecordDecoder", "decoder")
+
+T = TypeVar("T")
+
+# Types which asyncpg (with our codecs) returns as they are.
+_TRUSTED = frozenset(
+    (
+        str,
+        int,
+        float,
+        bool,
+        bytes,
+        decimal.Decimal,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        uuid.UUID,
+        dict,
+        list,
+        Any,
+        object,
+    )
+)
+_TRUSTED_ORIGINS = frozenset(
+    (
+        dict,
+        list,
+        collections.abc.Mapping,
+        collections.abc.Sequence,
+        collections.abc.Collection,
+        collections.abc.Iterable,
+    )
+)
+# Arrays come back as lists, so these are built from them.
+_COLLECTIONS = frozenset((set, frozenset, tuple))
+_NONE = type(None)
+
+
+class UnsupportedModelError(TypeError):
+    """Raised when we can't decode a model without validating it."""
+
+
+class RecordDecoder:
+    """Decodes asyncpg Records into instances of `model`, without re-validating them.
+
+    A decoding function is generated (and cached) for each column layout we see, so a
+    bulk read pays for the column lookups once, not once per row.
+    """
+
+    __slots__ = ("model", "converters", "decoders")
+
+    def __init__(self, model: Type[T]):
+        self.model = model
+        # field name -> the conversion for its column, or None if it's used as is.
+        self.converters: Dict[str, Optional[Callable[[Any], Any]]] = _converters(model)
+        self.decoders: Dict[Tuple[str, ...], Callable[[asyncpg.Record], T]] = {}
+
+    def __repr__(self):
+        model, layouts = self.model.__name__, len(self.decoders)
+        return f"<{self.__class__.__name__} {model=} {layouts=}>"
+
+    def decode(self, record: asyncpg.Record) -> T:
+        return self._get_decoder(record)(record)
+
+    def decode_many(self, records: Iterable[asyncpg.Record]) -> List[T]:
+        records = records if isinstance(records, list) else [*records]
+        if not records:
+            return []
+        return [*map(self._get_decoder(records[0]), records)]
+
+    def decode_values(self, values: Mapping[str, Any]) -> T:
+        """Build the model from column values, converting them as we would a Record's."""
+        converters, arguments = self.converters, {}
+        for name, value in values.items():
+            if name not in converters:
+                continue
+            converter = converters[name]
+            arguments[name] = value if converter is None else converter(value)
+        return self.model(**arguments)
+
+    def _get_decoder(self, record: asyncpg.Record) -> Callable[[asyncpg.Record], T]:
+        columns = tuple(record.keys())
+        decoder = self.decoders.get(columns)
+        if decoder is None:
+            decoder = self.decoders[columns] = self._compile(columns)
+        return decoder
+
+    def _compile(self, columns: Tuple[str, ...]) -> Callable[[asyncpg.Record], T]:
+        namespace: Dict[str, Any] = {"__model": self.model}
+        arguments = []
+        for position, column in enumerate(columns):
+            if column not in self.converters:
+                continue
+            converter = self.converters[column]
+            if converter is None:
+                arguments.append(f"{column}=record[{position}]")
+                continue
+            namespace[f"__convert_{column}"] = converter
+            arguments.append(f"{column}=__convert_{column}(record[{position}])")
+        source = "def decode(record):\n" f"    return __model({', '.join(arguments)})\n"
+        exec(source, namespace)
+        return namespace["decode"]
+
+
+def decoder(model: Type[T]) -> Optional[RecordDecoder]:
+    """Get a decoder for this model, or None if it must be coerced with `typic`."""
+    try:
+        return RecordDecoder(model)
+    except UnsupportedModelError:
+        return None
+
+
+def _converters(model: type) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    if not dataclasses.is_dataclass(model):
+        raise UnsupportedModelError(f"{model!r} is not a dataclass.")
+    # A copy, since `eval` adds `__builtins__` to the globals it's given.
+    namespace = {**vars(sys.modules[model.__module__])}
+    return {
+        field.name: _converter(field.name, _resolve(field.type, namespace))
+        for field in dataclasses.fields(model)
+        if field.init
+    }
+
+
+def _converter(name: str, types: Tuple[Any, ...]) -> Optional[Callable[[Any], Any]]:
+    types = tuple(t for t in types if t is not _NONE)
+    if all(_is_trusted(t) for t in types):
+        return None
+    if len(types) == 1:
+        (kind,) = types
+        if isinstance(kind, type) and issubclass(kind, enum.Enum):
+            return _enum_converter(kind)
+        if isinstance(kind, type) and issubclass(kind, asyncpg.Range):
+            return _range_converter(kind)
+        collection = typing.get_origin(kind) or kind
+        if collection in _COLLECTIONS:
+            return _collection_converter(collection)
+    raise UnsupportedModelError(f"Can't decode field {name!r} of type {types!r}.")
+
+
+def _is_trusted(kind: Any) -> bool:
+    return kind in _TRUSTED or typing.get_origin(kind) in _TRUSTED_ORIGINS
+
+
+def _enum_converter(kind: Type[enum.Enum]) -> Callable[[Any], Any]:
+    # Looking up the member is several times faster than calling the enum.
+    members = {member.value: member for member in kind}
+
+    def convert(value):
+        if value is None:
+            return None
+        try:
+            return members[value]
+        except KeyError:
+            return kind(value)
+
+    return convert
+
+
+def _collection_converter(kind: type) -> Callable[[Any], Any]:
+    def convert(value):
+        return value if value is None or value.__class__ is kind else kind(value)
+
+    return convert
+
+
+def _range_converter(kind: Type[asyncpg.Range]) -> Callable[[Any], Any]:
+    def convert(value):
+        if value is None or value.__class__ is kind:
+            return value
+        return kind(
+            value.lower,
+            value.upper,
+            lower_inc=value.lower_inc,
+            upper_inc=value.upper_inc,
+            empty=value.isempty,
+        )
+
+    return convert
+
+
+def _resolve(annotation: Any, namespace: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Get the types in the (top-level) union of a field's annotation.
+
+    Our models use `from __future__ import annotations` and PEP 604 unions, which
+    can't be evaluated before Python 3.10, so we split the union ourselves.
+    """
+    if not isinstance(annotation, str):
+        return _flatten(annotation)
+    parts, depth, start = [], 0, 0
+    for position, character in enumerate(annotation):
+        if character == "[":
+            depth += 1
+        elif character == "]":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            parts.append(annotation[start:position])
+            start = position + 1
+    parts.append(annotation[start:])
+    types: Tuple[Any, ...] = ()
+    for part in parts:
+        try:
+            resolved = eval(part.strip(), namespace)
+        except Exception as e:
+            raise UnsupportedModelError(f"Can't resolve {part!r}.") from e
+        types += _flatten(resolved)
+    return types
+
+
+def _flatten(annotation: Any) -> Tuple[Any, ...]:
+    if not isinstance(annotation, collections.abc.Hashable):
+        # Not a type at all (e.g., a list).
+        raise UnsupportedModelError(f"Can't resolve {annotation!r}.")
+    if typing.get_origin(annotation) is typing.Union:
+        return typing.get_args(annotation)
+    if annotation is None:
+        return (_NONE,)
+    return (annotation,)
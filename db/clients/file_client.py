@@ -363,6 +363,13 @@ class Files(ServiceProtocol[File]):
             a = await self.client.queries.get_raw_count(c, id=id)
             return a["raw_count"]
 
+    @retry
+    async def get_flush_checkpoint(
+        self, id: int, *, connection: asyncpg.Connection = None
+    ) -> Optional[dict]:
+        async with self.client.connector.connection(c=connection) as c:
+            return await self.client.queries.get_flush_checkpoint(c, id=id)
+
     @retry
     async def set_encoding(
         self,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Tuple
 
 import asyncpg
 import typic
@@ -199,6 +199,112 @@ class FileParseResults(ServiceProtocol[FileParseResult]):
                 c, file_id=file_id, organization_id=organization_id
             )
 
+    @retry
+    async def bulk_persist_parsed_records_chunk_for_file_dual_write_hash(
+        self,
+        file_id: int,
+        *,
+        chunk_size: int,
+        after: asyncpg.Record | None = None,
+        connection: asyncpg.Connection = None,
+    ) -> asyncpg.Record | None:
+        """Same as bulk_persist_parsed_records_for_files_dual_write_hash, for the next
+        `chunk_size` members of the file after the member identity `after`.
+
+        Returns the number of records `flushed`, along with the last member identity in
+        the chunk, or None if there was nothing left to flush.
+        """
+        after = after or {}
+        async with self.client.connector.transaction(connection=connection) as c:
+            await self.client.queries.set_work_mem(c)
+            return await self.client.queries.bulk_persist_parsed_records_chunk_for_file_dual_write_hash(
+                c,
+                file_id=file_id,
+                chunk_size=chunk_size,
+                after_organization_id=after.get("organization_id"),
+                after_unique_corp_id=after.get("unique_corp_id"),
+                after_dependent_id=after.get("dependent_id"),
+            )
+
+    @retry
+    async def copy_file_parse_results(
+        self,
+        *,
+        results: Iterable[FileParseResult] = (),
+        connection: asyncpg.Connection = None,
+    ) -> int:
+        """Stage a series of FileParseResult records with a binary COPY.
+
+        This is a drop-in replacement for `bulk_persist_file_parse_results` which
+        avoids encoding the batch as one giant composite array.
+        """
+        async with self.client.connector.transaction(connection=connection) as c:
+            default_range = await self.client.queries.get_default_range(c)
+            status = await c.copy_records_to_table(
+                "file_parse_results",
+                schema_name="eligibility",
+                columns=COPY_RESULT_COLUMNS,
+                records=_iter_copy_results(results, default_range=default_range),
+            )
+            return _copied_count(status)
+
+    @retry
+    async def copy_file_parse_errors(
+        self,
+        *,
+        errors: Iterable[FileParseError],
+        connection: asyncpg.Connection = None,
+    ) -> int:
+        """Stage a series of FileParseError records with a binary COPY.
+
+        This is a drop-in replacement for `bulk_persist_file_parse_errors`.
+        """
+        async with self.client.connector.transaction(connection=connection) as c:
+            status = await c.copy_records_to_table(
+                "file_parse_errors",
+                schema_name="eligibility",
+                columns=COPY_ERROR_COLUMNS,
+                records=_iter_copy_errors(errors),
+            )
+            return _copied_count(status)
+
+    @retry
+    async def persist_file_parse_seen(
+        self,
+        *,
+        file_id: int,
+        hash_values: Iterable[str] = (),
+        hash_version: int,
+        connection: asyncpg.Connection = None,
+    ) -> int:
+        """Record the existing members whose rows were unchanged in a file."""
+        async with self.client.connector.transaction(connection=connection) as c:
+            return await self.client.queries.persist_file_parse_seen(
+                c,
+                file_id=file_id,
+                hash_values=list(hash_values),
+                hash_version=hash_version,
+            )
+
+    @retry
+    async def touch_seen_members_for_file(
+        self,
+        file_id: int,
+        *,
+        chunk_size: int,
+        connection: asyncpg.Connection = None,
+    ) -> int:
+        """Move the next `chunk_size` unchanged members we've seen for a file to that
+        file.
+
+        Returns the number of seen members in the chunk, or 0 if there were none left.
+        """
+        async with self.client.connector.transaction(connection=connection) as c:
+            await self.client.queries.set_work_mem(c)
+            return await self.client.queries.touch_seen_members_for_file(
+                c, file_id=file_id, chunk_size=chunk_size
+            )
+
     # endregion
 
     # region fetch
@@ -321,6 +427,15 @@ class FileParseResults(ServiceProtocol[FileParseResult]):
                 c, files=files
             )
 
+    @retry
+    async def delete_file_parse_seen_for_files(
+        self, *files: int, connection: asyncpg.Connection = None
+    ) -> int:
+        async with self.client.connector.transaction(connection=connection) as c:
+            return await self.client.queries.delete_file_parse_seen_for_files(
+                c, files=files
+            )
+
     @retry
     async def delete_file_parse_errors_for_files(
         self, *files: int, connection: asyncpg.Connection = None
@@ -335,3 +450,96 @@ class FileParseResults(ServiceProtocol[FileParseResult]):
     def _iterdump(self, models: Iterable[T]) -> Iterator[T]:
         kvs = self._get_kvs
         yield from (kvs(m) for m in models)
+
+
+# region copy
+
+# The columns written by the COPY-based staging writes, in the order they're copied.
+COPY_RESULT_COLUMNS = (
+    "organization_id",
+    "first_name",
+    "last_name",
+    "email",
+    "unique_corp_id",
+    "dependent_id",
+    "date_of_birth",
+    "work_state",
+    "work_country",
+    "record",
+    "custom_attributes",
+    "errors",
+    "warnings",
+    "file_id",
+    "effective_range",
+    "do_not_contact",
+    "gender_code",
+    "employer_assigned_id",
+    "hash_value",
+    "hash_version",
+)
+COPY_ERROR_COLUMNS = (
+    "file_id",
+    "organization_id",
+    "record",
+    "errors",
+    "warnings",
+)
+
+
+def _iter_copy_results(
+    results: Iterable[FileParseResult], *, default_range: asyncpg.Range
+) -> Iterator[Tuple]:
+    # N.B. - This mirrors the `DISTINCT ON` and `coalesce` calls in
+    #   `bulk_persist_file_parse_results`, since COPY can't do either for us.
+    seen = set()
+    for r in results:
+        identity = (
+            r.organization_id,
+            r.file_id,
+            r.unique_corp_id and r.unique_corp_id.lower().lstrip("0"),
+            r.dependent_id and r.dependent_id.lower(),
+        )
+        if identity in seen:
+            continue
+        seen.add(identity)
+        yield (
+            r.organization_id,
+            r.first_name,
+            r.last_name,
+            r.email,
+            r.unique_corp_id,
+            r.dependent_id or "",
+            r.date_of_birth,
+            r.work_state,
+            r.work_country,
+            {} if r.record is None else r.record,
+            {} if r.custom_attributes is None else r.custom_attributes,
+            r.errors,
+            r.warnings,
+            r.file_id,
+            default_range if r.effective_range is None else r.effective_range,
+            r.do_not_contact,
+            r.gender_code,
+            r.employer_assigned_id,
+            r.hash_value,
+            r.hash_version,
+        )
+
+
+def _iter_copy_errors(errors: Iterable[FileParseError]) -> Iterator[Tuple]:
+    for e in errors:
+        yield (
+            e.file_id,
+            e.organization_id,
+            {} if e.record is None else e.record,
+            e.errors,
+            e.warnings,
+        )
+
+
+def _copied_count(status: str) -> int:
+    # asyncpg returns the command tag, e.g. `COPY 10000`.
+    return int(status.rsplit(" ", 1)[-1])
+
+
+# endregion
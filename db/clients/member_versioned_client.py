@@ -3,7 +3,18 @@ from __future__ import annotations
 import contextlib
 import datetime
 from datetime import date
-from typing import Iterable, Iterator, List, Mapping, Optional, Tuple
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import aiosql
 import asyncpg
@@ -11,7 +22,7 @@ import typic
 from mmlib.ops import stats
 
 import constants
-from db.clients import verification_client
+from db.clients import columnar, verification_client
 from db.clients.client import (
     BoundClient,
     CoercingCursor,
@@ -31,6 +42,10 @@ from db.model import (
 )
 
 MemberIDtoRangeT = Tuple[int, asyncpg.Range]
+# Columns we leave as raw JSON when reading columns, rather than parsing every row.
+JSON_COLUMNS = frozenset(("record", "custom_attributes"))
+# How many records we purge in a single transaction.
+PURGE_BATCH_SIZE = 5_000
 
 
 class MembersVersioned(ServiceProtocol[MemberVersioned]):
@@ -67,6 +82,19 @@ class MembersVersioned(ServiceProtocol[MemberVersioned]):
                 c, organization_id=organization_id
             )
 
+    @retry
+    async def get_current_hashes_for_organizations(
+        self,
+        *organization_ids: int,
+        hash_version: int,
+        connection: asyncpg.Connection = None,
+    ) -> List[asyncpg.Record]:
+        """Get the `hash_value` of each member's current record for the organizations."""
+        async with self.client.connector.connection(c=connection) as c:
+            return await self.client.queries.get_current_hashes_for_organizations(
+                c, organization_ids=organization_ids, hash_version=hash_version
+            )
+
     @_coerceable(bulk=True)
     @retry
     async def get_all_historical(
@@ -102,6 +130,47 @@ class MembersVersioned(ServiceProtocol[MemberVersioned]):
                 c, organization_id=organization_id
             )
 
+    @contextlib.asynccontextmanager
+    async def column_cursor_for_org(
+        self,
+        organization_id: int,
+        *,
+        columns: Sequence[str] = (),
+        historical: bool = False,
+        connection: asyncpg.Connection = None,
+    ) -> AsyncIterator[columnar.ColumnCursor[MemberVersioned]]:
+        """Read an organization's records in batches of columns, rather than as models.
+
+        Only `columns` are read (every column, by default), and JSON columns are left
+        as bytes until a row is built, so a job which only needs a few fields scales to
+        our largest organizations.
+
+        Usage:
+            >>> async with members.column_cursor_for_org(1, columns=("id", "email")) as cursor:
+            ...     async for batch in cursor.batches(10_000):
+            ...         emails = batch["email"]
+        """
+        fields = tuple(columns) or tuple(self.decoder.converters)
+        unknown = set(fields) - self.decoder.converters.keys()
+        if unknown:
+            raise ValueError(f"Unknown columns for {self.model.__name__}: {unknown}")
+        select = ", ".join(
+            f'convert_to("{f}"::text, \'UTF8\') AS "{f}"'
+            if f in JSON_COLUMNS
+            else f'"{f}"'
+            for f in fields
+        )
+        table = "member_versioned_historical" if historical else "member_versioned"
+        query = f"SELECT {select} FROM eligibility.{table} WHERE organization_id = $1"
+        # A server-side cursor only lives as long as its transaction.
+        async with self.client.connector.transaction(connection=connection) as c:
+            cursor = await c.cursor(query, organization_id)
+            yield columnar.ColumnCursor(
+                cursor,
+                decoder=self.decoder,
+                json_columns=JSON_COLUMNS.intersection(fields),
+            )
+
     @retry
     async def get_count_for_org(
         self, organization_id: int, *, connection: asyncpg.Connection = None
@@ -638,17 +707,50 @@ class MembersVersioned(ServiceProtocol[MemberVersioned]):
         self,
         *,
         organization_id: int,
+        batch_size: int = PURGE_BATCH_SIZE,
+        before_batch: Callable[[asyncpg.Connection], Awaitable[None]] | None = None,
         connection: asyncpg.Connection = None,
         coerce: bool = False,
     ) -> int:
-        async with self.client.connector.transaction(connection=connection) as c:
-            result = await self.client.queries.purge_expired_records(
+        """Purge an organization's unused or expired records, a batch of IDs at a time.
+
+        The records we must keep for each member are materialized once, up front, and
+        each batch is purged in its own transaction, so we only lock a batch at a time.
+        """
+        async with self.client.connector.connection(c=connection) as c:
+            await self.client.queries.create_purge_keep_set(c)
+            await self.client.queries.truncate_purge_keep_set(c)
+            max_id = await self.client.queries.materialize_purge_keep_set(
                 c, organization_id=organization_id
             )
-            if result:
-                return result[0]["purged_count"]
-            else:
+            if max_id is None:
                 return 0
+            await self.client.queries.analyze_purge_keep_set(c)
+
+            purged, after_id = 0, 0
+            while True:
+                if before_batch is not None:
+                    await before_batch(c)
+                async with c.transaction():
+                    batch = await self.client.queries.purge_expired_records_batch(
+                        c,
+                        organization_id=organization_id,
+                        after_id=after_id,
+                        max_id=max_id,
+                        batch_size=batch_size,
+                    )
+                if batch is None or batch["last_id"] is None:
+                    return purged
+                purged += batch["purged_count"]
+                after_id = batch["last_id"]
+
+    @retry
+    async def get_replication_lag(
+        self, *, connection: asyncpg.Connection = None
+    ) -> float:
+        """Get the replay lag of our slowest replica, in seconds."""
+        async with self.client.connector.connection(c=connection) as c:
+            return await self.client.queries.get_replication_lag(c)
 
     @retry
     async def purge_duplicate_non_hash_optum(
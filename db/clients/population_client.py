@@ -3,13 +3,10 @@ from __future__ import annotations
 import datetime
 from typing import Iterable, Iterator, List, Mapping
 
-import aiosql
 import asyncpg
 import ddtrace
 
 from app.eligibility.populations import model as pop_model
-from app.utils import eligibility_member as e9y_member_utils
-from db import model as db_model
 from db.clients import client as db_client
 from db.clients import postgres_connector
 from db.clients.client import _coerceable
@@ -121,6 +118,7 @@ class Populations(db_client.ServiceProtocol[pop_model.Population]):
                 sub_pop_lookup_keys_csv=record["sub_pop_lookup_keys_csv"],
                 advanced=record["advanced"],
                 organization_id=record["organization_id"],
+                updated_at=record["updated_at"],
             )
 
     @ddtrace.tracer.wrap()
@@ -147,74 +145,9 @@ class Populations(db_client.ServiceProtocol[pop_model.Population]):
                 population_id=record["id"],
                 sub_pop_lookup_keys_csv=record["sub_pop_lookup_keys_csv"],
                 advanced=record["advanced"],
+                updated_at=record["updated_at"],
             )
 
-    @ddtrace.tracer.wrap()
-    @retry
-    async def get_the_sub_pop_id_using_lookup_keys_for_member(
-        self,
-        lookup_keys_csv: str,
-        member: db_model.MemberVersioned | db_model.Member2,
-        population_id: int,
-        *,
-        connection: asyncpg.Connection = None,
-        coerce: bool = True,
-    ) -> int | None:
-        """
-        Dynamically generates the query to get the sub_population ID for
-        the member using the criteria specified in the lookup_keys_csv.
-
-        Example:
-            Given the following input:
-                lookup_keys_csv: "work_state,custom_attributes.employment_status,custom_attributes.group_number"
-                member: {
-                    "id": 1,
-                    ...
-                    "work_state": "NY",
-                    "custom_attributes": {
-                        "employment_status": "Full",
-                        "group_number": "2"
-                    }
-                }
-                population_id: 101
-            The sql string generated would look like:
-                SELECT pop.sub_pop_lookup_map_json->'NY'->'Full'->'2'
-                FROM eligibility.population pop
-                WHERE pop.id = 101;
-
-        If the member, the lookup keys, or the final value doesn't exist,
-        this function will return a None.
-        """
-        lookup_keys = lookup_keys_csv.split(",")
-        if len(lookup_keys) == 0:
-            return None
-
-        # Construct the SQL
-        sql_str = (
-            "-- name: get_sub_pop_id_for_criteria^\n"
-            "SELECT pop.sub_pop_lookup_map_json"
-        )
-        # Add more to the query string
-        for key in lookup_keys:
-            member_attribute = e9y_member_utils.get_member_attribute(member, key)
-            if member_attribute is None:
-                return None
-            sql_str += f"->'{member_attribute}'"
-        sql_str += (
-            " \nFROM eligibility.population pop \n" f"WHERE pop.id = {population_id};\n"
-        )
-
-        # Create the query from the SQL
-        queries = aiosql.from_str(sql_str, "asyncpg")
-
-        # Use the query to get the sub_population ID
-        async with self.client.connector.connection(c=connection) as c:
-            record = await queries.get_sub_pop_id_for_criteria(c)
-
-        if record is not None:
-            record = record[0]
-        return record
-
     # endregion fetch operations
 
     # region mutate operations
@@ -3,8 +3,23 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import contextvars
+import dataclasses
 import functools
-from typing import Awaitable, Callable, Mapping, Optional, Type, TypeVar, overload
+import random
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
+from urllib import parse
 
 import asyncpg
 import orjson
@@ -12,6 +27,7 @@ import typic
 from asyncpg.transaction import Transaction
 from maven import feature_flags
 from mmlib.config import apply_app_environment_namespace
+from mmlib.ops import stats
 
 import constants
 from app.eligibility import constants as e9y_constants
@@ -30,23 +46,64 @@ CONNECTORS: contextvars.ContextVar[
     Optional[Mapping[str, PostgresConnector]]
 ] = contextvars.ContextVar("pg_connector", default=None)
 
+# The connectors we create, one for each workload.
+MAIN = "main"
+READ = "read"
+BATCH = "batch"
+
+# The workload of the current task, which picks the pool its queries run on.
+WORKLOAD: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "pg_workload", default=MAIN
+)
+
+_STATS_PREFIX = "eligibility.db.pool"
+
 # region connector object
 
 
+@dataclasses.dataclass(frozen=True)
+class PoolProfile:
+    """How a connection pool is sized, for the workload it serves."""
+
+    name: str
+    min_size: int = 10
+    max_size: int = 10
+    acquire_timeout: float = 20
+    max_inactive_connection_lifetime: float = 300
+
+
 class PostgresConnector:
     """A simple connector for asyncpg."""
 
-    __slots__ = "dsn", "pool", "initialized", "schema", "_loop", "__dict__"
+    __slots__ = (
+        "dsn",
+        "pool",
+        "initialized",
+        "schema",
+        "profile",
+        "circuit_name",
+        "_loop",
+    )
 
-    def __init__(self, dsn, pool: asyncpg.pool.Pool = None):
+    def __init__(
+        self,
+        dsn,
+        pool: asyncpg.pool.Pool = None,
+        *,
+        profile: PoolProfile = None,
+    ):
         self.dsn = dsn
-        self.pool: asyncpg.pool.Pool = pool or create_pool(dsn)
+        # The circuit breaker for our database is shared with any pool on the same one.
+        self.circuit_name = _circuit_name(dsn)
+        self.profile = profile or pool_profiles()[MAIN]
+        self.pool: asyncpg.pool.Pool = pool or create_pool(dsn, profile=self.profile)
         self.initialized = False
         self._loop = asyncio.get_event_loop()
 
     def __repr__(self):
         dsn, initialized, open = self.dsn, self.initialized, self.open
-        return f"<{self.__class__.__name__} {dsn=} {initialized=} {open=}>"
+        pool = self.profile.name
+        return f"<{self.__class__.__name__} {dsn=} {pool=} {initialized=} {open=}>"
 
     async def initialize(self):
         if not self.initialized:
@@ -55,14 +112,91 @@ class PostgresConnector:
 
     @contextlib.asynccontextmanager
     async def connection(
-        self, *, timeout: int = 20, c: asyncpg.Connection = None
+        self, *, timeout: float = None, c: asyncpg.Connection = None
     ) -> asyncpg.Connection:
         await self.initialize()
         if c:
             yield c
         else:
-            async with self.pool.acquire(timeout=timeout) as conn:
+            conn = await self.acquire(timeout=timeout)
+            try:
                 yield conn
+            finally:
+                await self.pool.release(conn)
+
+    async def acquire(self, *, timeout: float = None) -> asyncpg.Connection:
+        """Acquire a connection from the pool, recording how long we queued for it.
+
+        The timeout defaults to the one for this pool's workload. Within a retried
+        call, we go through the circuit breaker for this connector's database first.
+        """
+        timeout = self.profile.acquire_timeout if timeout is None else timeout
+        if (call := _CIRCUIT_CALL.get()) is not None:
+            await call.enter(self.breaker)
+        tags = [f"db_pool:{self.profile.name}"]
+        start = time.perf_counter()
+        try:
+            conn = await self.pool.acquire(timeout=timeout)
+        except asyncio.TimeoutError:
+            stats.increment(
+                metric_name=f"{_STATS_PREFIX}.acquire_timeout",
+                pod_name=constants.POD,
+                tags=tags,
+            )
+            LOG.warning(
+                "Timed out waiting for a database connection.",
+                pool=self.profile.name,
+                timeout=timeout,
+                pool_size=self.pool.get_size(),
+            )
+            raise
+        stats.gauge(
+            metric_name=f"{_STATS_PREFIX}.acquire_wait_ms",
+            pod_name=constants.POD,
+            metric_value=(time.perf_counter() - start) * 1_000,
+            tags=tags,
+        )
+        stats.gauge(
+            metric_name=f"{_STATS_PREFIX}.in_use",
+            pod_name=constants.POD,
+            metric_value=self.pool.get_size() - self.pool.get_idle_size(),
+            tags=tags,
+        )
+        return conn
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """The circuit breaker for our database, shared with any pool on the same one."""
+        return circuit_breaker(self.circuit_name)
+
+    async def warmup(self, statements: Mapping[str, str]) -> int:
+        """Prepare each of `statements` on every connection the pool opens.
+
+        Preparing a statement has the server parse it and has asyncpg introspect the
+        types of its parameters and columns, which is most of what makes the first
+        run of a query on a new connection slow.
+
+        From now on, the pool prepares them on each new connection as it opens it,
+        including those that replace connections which expired. We prepare them
+        here on any connections it already has open.
+
+        Returns:
+            The number of statements prepared, across the connections held open.
+        """
+        _WARMUP_STATEMENTS[self.profile.name] = {**statements}
+        await self.initialize()
+        connections: list[asyncpg.Connection] = []
+        try:
+            # Hold each connection until we're done, so we get every one of them.
+            for _ in range(self.pool.get_min_size()):
+                connections.append(await self.acquire())
+            prepared = await asyncio.gather(
+                *(_prepare(c, statements, pool=self.profile.name) for c in connections)
+            )
+        finally:
+            for conn in connections:
+                await self.pool.release(conn)
+        return sum(prepared)
 
     @contextlib.asynccontextmanager
     async def transaction(
@@ -89,6 +223,12 @@ class PostgresConnector:
 # region connector methods
 
 
+def _circuit_name(dsn) -> str:
+    # Leave the credentials out, since this ends up in our logs and metrics.
+    dsn = parse.urlsplit(str(dsn))
+    return f"postgres:{dsn.hostname}:{dsn.port}{dsn.path}"
+
+
 @functools.lru_cache()
 def compose_dsn(
     scheme: str,
@@ -143,7 +283,50 @@ async def initialize(*, sighandlers: bool = False):
         await conn.initialize()
 
 
-async def _init_connection(connection: asyncpg.Connection):
+async def warmup(
+    statements: Mapping[str, str], *, connectors: Iterable[str] = (MAIN, READ)
+):
+    """Prepare our hot-path statements on the connections which will serve them."""
+    start = time.perf_counter()
+    connectors, cached = (*connectors,), cached_connectors()
+    prepared = await asyncio.gather(
+        *(cached[name].warmup(statements) for name in connectors)
+    )
+    LOG.info(
+        "Warmed up database connections.",
+        statements=len(statements),
+        prepared=dict(zip(connectors, prepared)),
+        duration_ms=round((time.perf_counter() - start) * 1_000),
+    )
+
+
+async def _prepare(
+    connection: asyncpg.Connection, statements: Mapping[str, str], *, pool: str
+) -> int:
+    prepared = 0
+    for name, sql in statements.items():
+        try:
+            # N.B. - `Connection.prepare` doesn't use the statement cache, so we'd
+            #   prepare a statement which nothing runs. This is how `fetch(sql)` (and
+            #   so aiosql) looks up its statement, so it puts ours in the cache for it.
+            #   It's private, which is why asyncpg is pinned to 0.26.x; the test
+            #   `test_get_statement_fills_statement_cache` checks it on an upgrade.
+            await connection._get_statement(sql, None)
+            prepared += 1
+        except asyncpg.PostgresError as e:
+            # A statement we can't prepare will fail when it's run, too, so there's
+            #   no reason to hold up startup over it.
+            LOG.warning(
+                "Couldn't prepare statement.", statement=name, pool=pool, error=str(e)
+            )
+    return prepared
+
+
+# The statements prepared on each new connection, by the name of its pool.
+_WARMUP_STATEMENTS: Dict[str, Mapping[str, str]] = {}
+
+
+async def _init_connection(connection: asyncpg.Connection, *, pool: str = None):
     await connection.set_type_codec(
         "json",
         # orjson encodes to binary, but libpq (the c bindings for postgres)
@@ -167,15 +350,260 @@ async def _init_connection(connection: asyncpg.Connection):
         format="binary",
     )
 
-
-def create_pool(dsn: str, *, loop: asyncio.AbstractEventLoop = None, **kwargs):
-    kwargs.setdefault("init", _init_connection)
+    # After the codecs, since preparing a statement binds the ones it uses.
+    if pool and (statements := _WARMUP_STATEMENTS.get(pool)):
+        await _prepare(connection, statements, pool=pool)
+
+
+def pool_profiles(db_settings: settings.DB = None) -> Dict[str, PoolProfile]:
+    """The pool profile for each of our connectors, from our settings."""
+    db_settings = db_settings or settings.DB()
+    lifetime = db_settings.pool_max_inactive_connection_lifetime
+    return {
+        MAIN: PoolProfile(
+            name="api",
+            min_size=db_settings.api_pool_min_size,
+            max_size=db_settings.api_pool_max_size,
+            acquire_timeout=db_settings.api_acquire_timeout,
+            max_inactive_connection_lifetime=lifetime,
+        ),
+        BATCH: PoolProfile(
+            name="batch",
+            min_size=db_settings.batch_pool_min_size,
+            max_size=db_settings.batch_pool_max_size,
+            acquire_timeout=db_settings.batch_acquire_timeout,
+            max_inactive_connection_lifetime=lifetime,
+        ),
+        READ: PoolProfile(
+            name="read",
+            min_size=db_settings.read_pool_min_size,
+            max_size=db_settings.read_pool_max_size,
+            acquire_timeout=db_settings.read_acquire_timeout,
+            max_inactive_connection_lifetime=lifetime,
+        ),
+    }
+
+
+def create_pool(
+    dsn: str,
+    *,
+    loop: asyncio.AbstractEventLoop = None,
+    profile: PoolProfile = None,
+    **kwargs,
+):
+    kwargs.setdefault(
+        "init",
+        functools.partial(_init_connection, pool=profile.name if profile else None),
+    )
     kwargs.setdefault("loop", loop)
+    if profile:
+        kwargs.setdefault("min_size", profile.min_size)
+        kwargs.setdefault("max_size", profile.max_size)
+        kwargs.setdefault(
+            "max_inactive_connection_lifetime",
+            profile.max_inactive_connection_lifetime,
+        )
     kwargs.setdefault("min_size", 10)
     kwargs.setdefault("max_size", 10)
     return asyncpg.create_pool(dsn, **kwargs)
 
 
+@contextlib.contextmanager
+def workload(name: str) -> Iterator[str]:
+    """Run the queries made in this block (and any tasks it creates) on `name`'s pool.
+
+    Usage:
+        >>> with workload(BATCH):
+        ...     await repository.flush(file=file)
+    """
+    token = WORKLOAD.set(name)
+    try:
+        yield name
+    finally:
+        WORKLOAD.reset(token)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a database which has been failing."""
+
+
+class CircuitBreaker:
+    """Stops us calling a database which keeps failing, so it has a chance to recover.
+
+    After `failure_threshold` consecutive failed calls the circuit opens for
+    `reset_timeout` seconds. Once that's passed, the circuit is half-open: a single
+    call goes through as a probe while the rest are still turned away. The probe
+    closes the circuit if it succeeds, and opens it for another `reset_timeout` if
+    it fails.
+    """
+
+    __slots__ = (
+        "name",
+        "failure_threshold",
+        "reset_timeout",
+        "failures",
+        "opened_at",
+        "open_since",
+        "probing",
+    )
+
+    def __init__(
+        self, name: str, *, failure_threshold: int = 5, reset_timeout: float = 5.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        # When we last opened the circuit, and when it first opened.
+        self.opened_at: Optional[float] = None
+        self.open_since: Optional[float] = None
+        # Whether a call is out probing the half-open circuit.
+        self.probing = False
+
+    def __repr__(self):
+        name, failures, open = self.name, self.failures, self.is_open
+        return f"<{self.__class__.__name__} {name=} {failures=} {open=}>"
+
+    @property
+    def is_open(self) -> bool:
+        return self.remaining > 0
+
+    @property
+    def remaining(self) -> float:
+        """How many seconds until we'll try the database again."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.reset_timeout - (time.monotonic() - self.opened_at), 0.0)
+
+    def allow(self) -> bool:
+        """Whether a call may go through, taking the probe if the circuit is half-open."""
+        if self.opened_at is None:
+            return True
+        if self.probing or self.is_open:
+            return False
+        self.probing = True
+        return True
+
+    def release(self):
+        """Let another call probe, if ours ended without telling us anything."""
+        self.probing = False
+
+    def record_success(self):
+        if self.open_since is not None:
+            open_seconds = time.monotonic() - self.open_since
+            stats.gauge(
+                metric_name=f"{_RETRY_STATS_PREFIX}.circuit.open_seconds",
+                pod_name=constants.POD,
+                metric_value=open_seconds,
+                tags=[f"circuit:{self.name}"],
+            )
+            LOG.info("Circuit closed.", circuit=self.name, open_seconds=open_seconds)
+        self.failures = 0
+        self.opened_at = self.open_since = None
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.failures < self.failure_threshold:
+            return
+        self.opened_at = time.monotonic()
+        if self.open_since is None:
+            self.open_since = self.opened_at
+            stats.increment(
+                metric_name=f"{_RETRY_STATS_PREFIX}.circuit.opened",
+                pod_name=constants.POD,
+                tags=[f"circuit:{self.name}"],
+            )
+            LOG.error(
+                "Circuit opened.", circuit=self.name, reset_timeout=self.reset_timeout
+            )
+
+
+class _CircuitCall:
+    """The circuit a single retried call went through, and whether it's the probe."""
+
+    __slots__ = ("operation", "breaker", "probe")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.breaker: Optional[CircuitBreaker] = None
+        self.probe = False
+
+    async def enter(self, breaker: CircuitBreaker):
+        """Go through `breaker`, unless we already have on an earlier attempt."""
+        if breaker is self.breaker:
+            return
+        while not breaker.allow():
+            if WORKLOAD.get() != BATCH:
+                stats.increment(
+                    metric_name=f"{_RETRY_STATS_PREFIX}.circuit.rejected",
+                    pod_name=constants.POD,
+                    tags=[f"circuit:{breaker.name}", f"operation:{self.operation}"],
+                )
+                raise CircuitOpenError(
+                    f"The circuit for {breaker.name!r} is open, retry in "
+                    f"{breaker.remaining:.1f}s."
+                )
+            # Batch work waits out the circuit, and any probe in flight.
+            await asyncio.sleep(breaker.remaining or _PROBE_POLL_SECONDS)
+        self.release()
+        self.breaker, self.probe = breaker, breaker.opened_at is not None
+
+    def release(self):
+        if self.probe:
+            self.breaker.release()
+            self.probe = False
+
+
+# The call being retried in the current task, which connectors enter as they're used.
+_CIRCUIT_CALL: contextvars.ContextVar[Optional[_CircuitCall]] = contextvars.ContextVar(
+    "pg_circuit_call", default=None
+)
+_PROBE_POLL_SECONDS = 0.05
+
+
+class RetryBudget:
+    """Caps the retries of an operation at a fraction of its calls.
+
+    Each call deposits `ratio` of a retry, up to `capacity`, and each retry
+    withdraws one, so when everything is failing we make at most `1 + ratio` calls
+    per operation, rather than `1 + retries`.
+    """
+
+    __slots__ = ("ratio", "capacity", "tokens")
+
+    def __init__(self, *, ratio: float = 0.2, capacity: float = 10):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def deposit(self):
+        self.tokens = min(self.tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+_RETRY_STATS_PREFIX = "eligibility.db.retry"
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the named circuit breaker, shared by every operation which uses it."""
+    if (breaker := _BREAKERS.get(name)) is None:
+        breaker = _BREAKERS[name] = CircuitBreaker(name)
+    return breaker
+
+
+def backoff(attempt: int, *, delay: float, max_delay: float) -> float:
+    """Exponential backoff with "full" jitter, so retries from many tasks spread out."""
+    return random.uniform(0, min(max_delay, delay * 2**attempt))
+
+
 @overload
 def retry(
     func: _FuncT,
@@ -188,6 +616,10 @@ def retry(
     *errors: Type[BaseException],
     retries: int = 10,
     delay: float = 0.1,
+    max_delay: float = 2.0,
+    deadline: float = 10.0,
+    budget: float = 0.2,
+    breaker: Optional[str] = None,
 ) -> Callable[[_FuncT], _FuncT]:
     ...
 
@@ -197,6 +629,10 @@ def retry(
     *errors: Type[BaseException],
     retries: int = 10,
     delay: float = 0.1,
+    max_delay: float = 2.0,
+    deadline: float = 10.0,
+    budget: float = 0.2,
+    breaker: Optional[str] = None,
 ):
     """Automatically retry a database operation on a transient error.
 
@@ -204,12 +640,24 @@ def retry(
         - asyncpg.DeadlockDetectedError
         - asyncpg.TooManyConnectionsError
         - asyncpg.PostgresConnectionError
+
+    We back off exponentially from `delay` (up to `max_delay`) with jitter, and give up
+    after `retries` retries, once we've spent `deadline` seconds, or when the
+    operation's retry budget (a `budget` fraction of its calls) is spent.
+
+    Each call counts once against the circuit breaker for the database it ran on:
+    as a success, or as a failure if it gave up on an error other than a deadlock.
+    That's the breaker for the connector it acquired a connection from, or the one
+    named by `breaker`. While a circuit is open, we fail fast with a
+    `CircuitOpenError`, unless we're running a batch workload, which waits for the
+    circuit to close.
     """
     errors = (*{*_TRANSIENT, *errors},)
     logger = LOG.bind(
         watching_errors=[e.__name__ for e in errors],
         retry_delay=delay,
         max_retries=retries,
+        deadline=deadline,
     )
 
     def _retry(
@@ -219,8 +667,33 @@ def retry(
         _errors=errors,
         _logger=logger,
     ) -> _FuncT:
-        @functools.wraps(func_)
-        async def _retry(*args, **kwargs):
+        operation = func_.__qualname__
+        tags = [f"operation:{operation}"]
+        retry_budget = RetryBudget(ratio=budget)
+        named = breaker and circuit_breaker(breaker)
+
+        async def _call(*args, **kwargs):
+            call = _CircuitCall(operation)
+            token = _CIRCUIT_CALL.set(call)
+            try:
+                if named:
+                    await call.enter(named)
+                result = await _retrying(*args, **kwargs)
+            except _errors as e:
+                if call.breaker and not isinstance(e, asyncpg.DeadlockDetectedError):
+                    call.breaker.record_failure()
+                raise
+            else:
+                if call.breaker:
+                    call.breaker.record_success()
+                return result
+            finally:
+                call.release()
+                _CIRCUIT_CALL.reset(token)
+
+        async def _retrying(*args, **kwargs):
+            retry_budget.deposit()
+            start = time.monotonic()
             try:
                 return await func_(*args, **kwargs)
             except _errors as e:
@@ -228,19 +701,42 @@ def retry(
                     "Got a watched error. Entering retry loop.",
                     error=e.__class__.__name__,
                     exception=str(e),
+                    operation=operation,
                 )
                 tries = 0
                 while tries < _retries:
+                    wait = backoff(tries, delay=delay, max_delay=max_delay)
+                    if time.monotonic() - start + wait > deadline:
+                        _logger.warning("Retry deadline passed.", retry=tries)
+                        break
+                    if not retry_budget.withdraw():
+                        stats.increment(
+                            metric_name=f"{_RETRY_STATS_PREFIX}.budget_exhausted",
+                            pod_name=constants.POD,
+                            tags=tags,
+                        )
+                        _logger.warning("Retry budget spent.", retry=tries)
+                        break
                     tries += 1
-                    await asyncio.sleep(delay)
+                    stats.increment(
+                        metric_name=_RETRY_STATS_PREFIX,
+                        pod_name=constants.POD,
+                        tags=[*tags, f"error:{e.__class__.__name__}"],
+                    )
+                    await asyncio.sleep(wait)
                     try:
                         return await func_(*args, **kwargs)
                     except _errors:
                         _logger.warning("Failed on retry.", retry=tries)
+                stats.increment(
+                    metric_name=f"{_RETRY_STATS_PREFIX}.exhausted",
+                    pod_name=constants.POD,
+                    tags=tags,
+                )
                 _logger.error("Couldn't recover on retries. Re-raising original error.")
                 raise e
 
-        return _retry
+        return functools.wraps(func_)(_call)
 
     return _retry(func) if func else _retry
 
@@ -261,18 +757,30 @@ async def teardown(*, signal: int = 0):
 # endregion
 
 
-def cached_connectors(*, loop: asyncio.AbstractEventLoop = None, **kwargs):
-    if (connector := CONNECTORS.get()) is None:
-        main_dsn: str = get_dsn(read_only=False)
-        read_dsn: str = get_dsn(read_only=True)
+def create_connectors(
+    *, loop: asyncio.AbstractEventLoop = None, **kwargs
+) -> Dict[str, PostgresConnector]:
+    """Create a connector, with its own pool, for each workload.
 
-        main_pool = create_pool(main_dsn, loop=loop, **kwargs)
-        read_pool = create_pool(read_dsn, loop=loop, **kwargs)
+    The batch connector shares the primary with the api, but not its connections.
+    """
+    main_dsn: str = get_dsn(read_only=False)
+    read_dsn: str = get_dsn(read_only=True)
+    profiles = pool_profiles()
+    dsns = {MAIN: main_dsn, BATCH: main_dsn, READ: read_dsn}
+    return {
+        name: PostgresConnector(
+            dsn,
+            pool=create_pool(dsn, loop=loop, profile=profiles[name], **kwargs),
+            profile=profiles[name],
+        )
+        for name, dsn in dsns.items()
+    }
 
-        main_connector = PostgresConnector(main_dsn, pool=main_pool)
-        read_connector = PostgresConnector(read_dsn, pool=read_pool)
 
-        CONNECTORS.set({"main": main_connector, "read": read_connector})
+def cached_connectors(*, loop: asyncio.AbstractEventLoop = None, **kwargs):
+    if (connector := CONNECTORS.get()) is None:
+        CONNECTORS.set(create_connectors(loop=loop, **kwargs))
 
         connector = CONNECTORS.get()
 
@@ -288,15 +796,6 @@ class ApplicationConnectors:
 def application_connectors():
     global_connector = ApplicationConnectors()
     if not global_connector.connectors:
-        main_dsn: str = get_dsn(read_only=False)
-        read_dsn: str = get_dsn(read_only=True)
-
-        main_pool = create_pool(main_dsn)
-        read_pool = create_pool(read_dsn)
-
-        main_connector = PostgresConnector(main_dsn, pool=main_pool)
-        read_connector = PostgresConnector(read_dsn, pool=read_pool)
-
-        global_connector.connectors = {"main": main_connector, "read": read_connector}
+        global_connector.connectors = create_connectors()
 
     return global_connector.connectors
@@ -0,0 +1,12 @@
+-- migrate:up
+-- Existing members whose rows were unchanged in a file, so weren't staged in file_parse_results.
+CREATE TABLE IF NOT EXISTS eligibility.file_parse_seen (
+    file_id bigint NOT NULL,
+    member_id bigint NOT NULL,
+    created_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT file_parse_seen_pkey PRIMARY KEY (file_id, member_id)
+);
+
+
+-- migrate:down
+DROP TABLE IF EXISTS eligibility.file_parse_seen;
@@ -0,0 +1,20 @@
+-- migrate:up
+-- Tell listeners which organization's configuration changed, once the change is committed.
+CREATE OR REPLACE FUNCTION eligibility.notify_configuration_change() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+  PERFORM pg_notify(
+    'configuration_changed',
+    (CASE WHEN TG_OP = 'DELETE' THEN OLD.organization_id ELSE NEW.organization_id END)::text
+  );
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER notify_configuration_change AFTER INSERT OR UPDATE OR DELETE ON eligibility.configuration FOR EACH ROW EXECUTE FUNCTION eligibility.notify_configuration_change();
+
+
+-- migrate:down
+DROP TRIGGER IF EXISTS notify_configuration_change ON eligibility.configuration;
+DROP FUNCTION IF EXISTS eligibility.notify_configuration_change();
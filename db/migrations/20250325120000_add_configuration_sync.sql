@@ -0,0 +1,13 @@
+-- migrate:up
+-- A fingerprint of each organization's configuration and headers, as last synced from mono.
+CREATE TABLE IF NOT EXISTS eligibility.configuration_sync (
+    organization_id bigint NOT NULL,
+    fingerprint text NOT NULL,
+    synced_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT configuration_sync_pkey PRIMARY KEY (organization_id),
+    CONSTRAINT configuration_sync_organization_id_fkey FOREIGN KEY (organization_id) REFERENCES eligibility.configuration(organization_id) ON DELETE CASCADE
+);
+
+
+-- migrate:down
+DROP TABLE IF EXISTS eligibility.configuration_sync;
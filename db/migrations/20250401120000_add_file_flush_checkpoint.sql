@@ -0,0 +1,7 @@
+-- migrate:up
+-- The last member identity flushed from file_parse_results for a file, which an interrupted flush resumes after.
+ALTER TABLE eligibility.file ADD COLUMN IF NOT EXISTS flush_checkpoint jsonb;
+
+
+-- migrate:down
+ALTER TABLE eligibility.file DROP COLUMN IF EXISTS flush_checkpoint;
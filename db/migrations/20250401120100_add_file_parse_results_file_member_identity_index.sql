@@ -0,0 +1,6 @@
+-- migrate:up transaction:false
+-- The order we flush a file's staged records in, so each chunk reads from where the last one stopped.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_file_parse_results_file_member_identity ON eligibility.file_parse_results USING btree (file_id, organization_id, ltrim(lower((unique_corp_id)::text), '0'::text), lower((dependent_id)::text));
+
+-- migrate:down
+DROP INDEX IF EXISTS eligibility.idx_file_parse_results_file_member_identity;
@@ -168,6 +168,7 @@ class File:
     success_count: int | None = None
     failure_count: int | None = None
     raw_count: int | None = None
+    flush_checkpoint: dict | None = None
 
 
 @typic.slotted(dict=False)
@@ -7,6 +7,14 @@ SELECT
 FROM eligibility.configuration
 ;
 
+-- name: get_updated_since
+-- Get the parsing configurations which have changed since the given time.
+SELECT
+    configuration.*
+FROM eligibility.configuration
+WHERE configuration.updated_at >= :updated_at
+;
+
 -- name: get^
 -- Get a parsing configuration for a given organization.
 SELECT
@@ -123,4 +131,9 @@ AND external_id like '%' || :external_id || '%';
 SELECT *
 FROM eligibility.configuration
 WHERE organization_id NOT IN
-(SELECT DISTINCT organization_id FROM eligibility.file);
\ No newline at end of file
+(SELECT DISTINCT organization_id FROM eligibility.file);
+
+-- name: get_sync_fingerprints
+-- Get the fingerprint of each organization as it was last synced from mono.
+SELECT organization_id, fingerprint
+FROM eligibility.configuration_sync;
@@ -86,3 +86,43 @@ RETURNING *;
 -- name: delete_all_external_ids<!
 -- Delete all our existing external ID records
 DELETE FROM eligibility.organization_external_id;
+
+-- name: bulk_add_data_provider_external_id*!
+-- Add an external_id without a source, which is unique by its data provider.
+INSERT INTO eligibility.organization_external_id(source, data_provider_organization_id, external_id, organization_id)
+VALUES (:source, :data_provider_organization_id, :external_id, :organization_id)
+ON CONFLICT (data_provider_organization_id, external_id)
+    DO UPDATE SET
+        organization_id = excluded.organization_id,
+        source = excluded.source,
+        data_provider_organization_id = excluded.data_provider_organization_id,
+        external_id = excluded.external_id;
+
+-- name: bulk_delete_external_ids!
+-- Delete the given external IDs: by source and external ID, or, for those without a source,
+--  by data provider and external ID.
+DELETE FROM eligibility.organization_external_id oei
+USING (
+    SELECT
+        unnest(:sources::text[]) AS source,
+        unnest(:data_provider_organization_ids::bigint[]) AS data_provider_organization_id,
+        unnest(:external_ids::text[]) AS external_id
+) AS deleted
+WHERE oei.external_id = deleted.external_id::eligibility.citext
+AND (
+    (deleted.source IS NOT NULL AND oei.source = deleted.source::eligibility.citext)
+    OR (
+        deleted.source IS NULL
+        AND oei.source IS NULL
+        AND oei.data_provider_organization_id IS NOT DISTINCT FROM deleted.data_provider_organization_id
+    )
+);
+
+-- name: bulk_persist_sync_fingerprints*!
+-- Record the fingerprint of each organization as we've synced it from mono.
+INSERT INTO eligibility.configuration_sync(organization_id, fingerprint)
+VALUES (:organization_id, :fingerprint)
+ON CONFLICT (organization_id)
+    DO UPDATE SET
+        fingerprint = excluded.fingerprint,
+        synced_at = CURRENT_TIMESTAMP;
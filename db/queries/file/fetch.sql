@@ -120,6 +120,11 @@ WHERE file.id = :id;
 SELECT failure_count FROM eligibility.file
 WHERE file.id = :id;
 
+-- name: get_flush_checkpoint$
+-- Get the last member identity flushed for given file_id, if a flush of it was interrupted.
+SELECT flush_checkpoint FROM eligibility.file
+WHERE file.id = :id;
+
 -- name: get_raw_count^
 -- Get raw count for given file_id.
 SELECT raw_count FROM eligibility.file
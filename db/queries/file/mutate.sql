@@ -55,16 +55,18 @@ DELETE FROM eligibility.file
 WHERE id = any(:ids);
 
 -- name: set_started_at<!
--- Set the datetime which processing began for this file.
+-- Set the datetime which processing began for this file, and forget any flush of it we started.
 UPDATE eligibility.file
-SET started_at = now()
+SET started_at = now(),
+    flush_checkpoint = NULL
 WHERE id = :id
 RETURNING started_at;
 
 -- name: set_completed_at<!
 -- Set the datetime which processing completed for this file.
 UPDATE eligibility.file
-SET completed_at = now()
+SET completed_at = now(),
+    flush_checkpoint = NULL
 WHERE id = :id
 RETURNING completed_at;
 
@@ -52,3 +52,7 @@ FROM
             file_id = :file_id
         AND created_at >= :created_at
 	) AS new_results;
+
+-- name: get_default_range$
+-- Get the default effective_range applied to staged records which don't have one.
+SELECT eligibility.default_range();
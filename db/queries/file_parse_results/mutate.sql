@@ -215,6 +215,110 @@ WITH deleted as (
 )
 SELECT count(*) FROM deleted;
 
+-- name: delete_file_parse_seen_for_files$
+-- Delete all the unchanged members we've seen for a given file.
+WITH deleted as (
+    DELETE FROM eligibility.file_parse_seen
+    WHERE file_id = ANY (:files::bigint[])
+    RETURNING *
+)
+SELECT count(*) FROM deleted;
+
+-- name: persist_file_parse_seen$
+-- Record the existing members whose rows were unchanged in a file (by their hashes), in place of staging them.
+WITH inserted as (
+    INSERT INTO eligibility.file_parse_seen(file_id, member_id)
+    SELECT :file_id, mv.id
+    FROM eligibility.member_versioned mv
+    WHERE mv.hash_value = ANY(:hash_values::text[])
+        AND mv.hash_version = :hash_version
+    ON CONFLICT DO NOTHING
+    RETURNING *
+)
+SELECT count(*) FROM inserted;
+
+-- name: touch_seen_members_for_file$
+-- Move the next chunk of unchanged members we've seen for a given file to that file.
+-- This mirrors what flushing a staged row does when its hash is already in member_versioned.
+-- Each chunk removes its seen rows, so the next call picks up where this one left off.
+WITH seen AS (
+    DELETE FROM eligibility.file_parse_seen s
+    USING (
+        SELECT member_id
+        FROM eligibility.file_parse_seen
+        WHERE file_id = :file_id
+        ORDER BY member_id
+        LIMIT :chunk_size
+    ) chunk
+    WHERE s.file_id = :file_id
+    AND s.member_id = chunk.member_id
+    RETURNING s.member_id
+), versioned AS (
+    UPDATE eligibility.member_versioned mv
+        SET file_id = :file_id,
+            effective_range = daterange(lower(mv.effective_range), null)
+    FROM seen
+    WHERE mv.id = seen.member_id
+    RETURNING mv.*
+), member_upsert AS (
+    -- Upsert v1 from the matched member_versioned row, just as the flush does from a staged row.
+    INSERT INTO eligibility.member(
+        organization_id,
+        first_name,
+        last_name,
+        email,
+        unique_corp_id,
+        dependent_id,
+        date_of_birth,
+        work_state,
+        work_country,
+        record,
+        custom_attributes,
+        file_id,
+        effective_range,
+        gender_code
+    )
+    SELECT DISTINCT ON (
+            v.organization_id, lower(ltrim(v.unique_corp_id, '0')), lower(v.dependent_id)
+        )
+        v.organization_id,
+        v.first_name,
+        v.last_name,
+        v.email,
+        v.unique_corp_id,
+        v.dependent_id,
+        v.date_of_birth,
+        v.work_state,
+        v.work_country,
+        coalesce(v.record, '{}')::jsonb,
+        coalesce(v.custom_attributes, '{}')::jsonb,
+        v.file_id,
+        v.effective_range,
+        v.gender_code
+    FROM versioned v
+    ORDER BY
+        v.organization_id, lower(ltrim(v.unique_corp_id, '0')), lower(v.dependent_id), v.id DESC
+    ON CONFLICT (
+        organization_id, ltrim(lower(unique_corp_id), '0'), lower(dependent_id)
+        )
+        DO UPDATE SET
+            organization_id = excluded.organization_id,
+            first_name = excluded.first_name,
+            last_name = excluded.last_name,
+            email = excluded.email,
+            unique_corp_id = excluded.unique_corp_id,
+            dependent_id = excluded.dependent_id,
+            date_of_birth = excluded.date_of_birth,
+            work_state = excluded.work_state,
+            work_country = excluded.work_country,
+            record = excluded.record,
+            custom_attributes = excluded.custom_attributes,
+            file_id = excluded.file_id,
+            effective_range = excluded.effective_range,
+            gender_code = excluded.gender_code
+)
+SELECT count(*) FROM seen;
+
 -- name: delete_file_parse_errors_for_files$
 -- Delete all parse results for a given file from their tables.
 WITH deleted as (
@@ -587,6 +691,174 @@ ON CONFLICT (hash_value, hash_version)
             effective_range = daterange(lower(eligibility.member_versioned.effective_range), null);
 
 
+-- name: bulk_persist_parsed_records_chunk_for_file_dual_write_hash^
+-- Upsert the parsed records for the next :chunk_size members of a given file ID to member and
+-- inserts to member_versioned, returning the number of records moved and the last member identity
+-- in the chunk, which the next chunk starts after. Returns no row once there's nothing left.
+-- Chunks are taken in order of the member's identity, so all of a member's records are moved
+-- together. Each chunk is an atomic "move" operation, which also records its last member identity
+-- on the file, so a flush which is interrupted can resume after it.
+WITH chunk AS (
+    -- N.B. - This is the order of idx_file_parse_results_file_member_identity, so each chunk reads
+    --  the index from where the last one stopped, rather than sorting the rest of the file.
+    --  The lower bound for the first chunk is below any member, rather than an `IS NULL OR`,
+    --  so the comparison can always be used as an index condition.
+    SELECT DISTINCT
+        organization_id,
+        ltrim(lower(unique_corp_id), '0') AS unique_corp_id,
+        lower(dependent_id) AS dependent_id
+    FROM eligibility.file_parse_results
+    WHERE file_id = :file_id
+        AND (organization_id, ltrim(lower(unique_corp_id), '0'), lower(dependent_id))
+            > (
+                coalesce(:after_organization_id::bigint, -1),
+                coalesce(:after_unique_corp_id::text, ''),
+                coalesce(:after_dependent_id::text, '')
+            )
+    ORDER BY 1, 2, 3
+    LIMIT :chunk_size
+), last AS (
+    SELECT * FROM chunk ORDER BY 1 DESC, 2 DESC, 3 DESC LIMIT 1
+), checkpoint AS (
+    UPDATE eligibility.file f
+    SET flush_checkpoint = to_jsonb(last)
+    FROM last
+    WHERE f.id = :file_id
+), records AS (
+    DELETE FROM eligibility.file_parse_results pr -- grab the records from the file_parse_results
+    USING chunk
+    WHERE pr.file_id = :file_id
+        AND pr.organization_id = chunk.organization_id
+        AND ltrim(lower(pr.unique_corp_id), '0') = chunk.unique_corp_id
+        AND lower(pr.dependent_id) = chunk.dependent_id
+    RETURNING
+        pr.organization_id,
+        pr.first_name,
+        pr.last_name,
+        pr.email,
+        pr.unique_corp_id,
+        pr.dependent_id,
+        pr.date_of_birth,
+        pr.work_state,
+        pr.work_country,
+        pr.record,
+        pr.custom_attributes,
+        pr.file_id,
+        pr.effective_range,
+        pr.gender_code,
+        pr.employer_assigned_id,
+        pr.hash_value,
+        pr.hash_version
+), member_insert AS (
+    INSERT INTO eligibility.member(  -- insert unique records from e9y.member and return what was inserted
+        organization_id,
+        first_name,
+        last_name,
+        email,
+        unique_corp_id,
+        dependent_id,
+        date_of_birth,
+        work_state,
+        work_country,
+        record,
+        custom_attributes,
+        file_id,
+        effective_range,
+        gender_code
+    )
+    SELECT DISTINCT ON (
+            pr.organization_id, lower(ltrim(pr.unique_corp_id, '0')), lower(pr.dependent_id)
+        )
+        pr.organization_id,
+        pr.first_name,
+        pr.last_name,
+        pr.email,
+        pr.unique_corp_id,
+        pr.dependent_id,
+        pr.date_of_birth,
+        pr.work_state,
+        pr.work_country,
+        coalesce(pr.record, '{}')::jsonb,
+        coalesce(pr.custom_attributes, '{}')::jsonb,
+        pr.file_id,
+        coalesce(pr.effective_range, eligibility.default_range()),
+        pr.gender_code
+    FROM records pr
+    ON CONFLICT (  -- update any records with unique keys we have seen before
+        organization_id, ltrim(lower(unique_corp_id), '0'), lower(dependent_id)
+        )
+        DO UPDATE SET
+            organization_id = excluded.organization_id,
+            first_name = excluded.first_name,
+            last_name = excluded.last_name,
+            email = excluded.email,
+            unique_corp_id = excluded.unique_corp_id,
+            dependent_id = excluded.dependent_id,
+            date_of_birth = excluded.date_of_birth,
+            work_state = excluded.work_state,
+            work_country = excluded.work_country,
+            record = excluded.record,
+            custom_attributes = excluded.custom_attributes,
+            file_id = excluded.file_id,
+            effective_range = excluded.effective_range,
+            gender_code = excluded.gender_code
+), member_versioned_insert AS (
+    INSERT INTO eligibility.member_versioned( -- write everything to member_versioned
+            organization_id,
+            first_name,
+            last_name,
+            email,
+            unique_corp_id,
+            dependent_id,
+            date_of_birth,
+            work_state,
+            work_country,
+            record,
+            custom_attributes,
+            file_id,
+            effective_range,
+            gender_code,
+            employer_assigned_id,
+            hash_value,
+            hash_version
+    )
+    SELECT DISTINCT ON (  -- return the first record we have returned from file_parse_results
+            pr.organization_id, lower(ltrim(pr.unique_corp_id, '0')), lower(pr.dependent_id)
+            )
+            pr.organization_id,
+            pr.first_name,
+            pr.last_name,
+            pr.email,
+            pr.unique_corp_id,
+            pr.dependent_id,
+            pr.date_of_birth,
+            pr.work_state,
+            pr.work_country,
+            coalesce(pr.record, '{}')::jsonb,
+            coalesce(pr.custom_attributes, '{}')::jsonb,
+            pr.file_id,
+            coalesce(pr.effective_range, eligibility.default_range()),
+            pr.gender_code,
+            pr.employer_assigned_id,
+            hash_value,
+            hash_version
+    FROM records pr
+    ON CONFLICT (hash_value, hash_version)
+        DO UPDATE
+                -- if we have seen this row before
+                -- 1. Update file_id to the latest file
+                -- 2. Set the effective_range upper to infinity and lower to the previous lower
+            SET file_id = excluded.file_id,
+                effective_range = daterange(lower(eligibility.member_versioned.effective_range), null)
+)
+SELECT
+    (SELECT count(*) FROM records) AS flushed,
+    last.organization_id,
+    last.unique_corp_id,
+    last.dependent_id
+FROM last;
+
+
 -- name: bulk_persist_parsed_records_for_file_and_org_dual_write_hash
 -- Upsert all the parsed records for a given file ID and organization ID to member and inserts to member_versioned.
 -- This acts as an atomic "move" operation - delete the source and copy to the destination.
@@ -503,3 +503,17 @@ WHERE
     ranked.effective_range @> CURRENT_DATE
     AND ranked.rank = 1
 LIMIT 1;
+
+-- name: get_current_hashes_for_organizations
+-- Get the hash of each member's current (latest) member_versioned record for the given organizations.
+SELECT current.hash_value
+FROM (
+    SELECT DISTINCT ON (organization_id, ltrim(lower(unique_corp_id), '0'), lower(dependent_id))
+        hash_value,
+        hash_version
+    FROM eligibility.member_versioned
+    WHERE organization_id = ANY(:organization_ids::bigint[])
+    ORDER BY organization_id, ltrim(lower(unique_corp_id), '0'), lower(dependent_id), id DESC
+) current
+WHERE current.hash_version = :hash_version
+    AND current.hash_value IS NOT NULL;
@@ -311,36 +311,81 @@ SELECT COUNT(*) FROM eligibility.member_address_versioned;
 
 
 
--- name: purge_expired_records
--- Delete all unused or expired records
-WITH purged_rows AS (
-    DELETE
+-- name: create_purge_keep_set!
+-- Create this session's set of record IDs which must survive a purge.
+CREATE TEMPORARY TABLE IF NOT EXISTS purge_keep_set (id bigint PRIMARY KEY);
+
+-- name: truncate_purge_keep_set!
+TRUNCATE pg_temp.purge_keep_set;
+
+-- name: materialize_purge_keep_set$
+-- Keep our first wallet record for each member of the organization.
+--  Returns the highest record ID for the organization, which bounds the purge:
+--  anything newer may be the first record of a member we didn't see.
+WITH kept AS (
+    INSERT INTO pg_temp.purge_keep_set (id)
+    SELECT min(id)
+    FROM eligibility.member_versioned
+    WHERE organization_id = :organization_id
+    GROUP BY organization_id,
+             unique_corp_id,
+             dependent_id
+    RETURNING id
+)
+-- N.B. - `kept` is run whether or not we read from it.
+SELECT max(id)
+FROM eligibility.member_versioned
+WHERE organization_id = :organization_id;
+
+-- name: analyze_purge_keep_set!
+ANALYZE pg_temp.purge_keep_set;
+
+-- name: purge_expired_records_batch^
+-- Delete the unused or expired records in the next batch of an organization's records
+--  (by ID), moving them to the historical table.
+WITH batch AS (
+    SELECT id, file_id, effective_range
     FROM eligibility.member_versioned
-    WHERE
+    WHERE organization_id = :organization_id
+    AND id > :after_id
+    AND id <= :max_id
+    ORDER BY id
+    LIMIT :batch_size
+), purgeable AS (
+    SELECT batch.id
+    FROM batch
+    -- do not consider optum rows (fileID = none) as we don't mark those as terminated
+    -- exclude records that are still 'valid' or could be pre-verified
+    WHERE batch.file_id IS NOT NULL
+    AND NOT coalesce(batch.effective_range @> CURRENT_DATE, false)
     -- exclude records tied to a verification
-    id NOT IN (SELECT distinct(member_id)
-                       FROM eligibility.member_verification)
-    -- --  do not consider optum rows (fileID = none) as we don't mark those as terminated
-    -- --  exclude records that are still 'valid' or could be pre-verified
-    AND id NOT IN (SELECT id
-                     FROM eligibility.member_versioned mv
-                     WHERE (file_id IS NULL OR (file_id IS NOT NULL AND effective_range @> CURRENT_DATE))
-                     AND organization_id = :organization_id)
-    -- -- exclude our first wallet records
-    AND id NOT IN (SELECT Min(id)
-                     FROM eligibility.member_versioned
-                     WHERE organization_id = :organization_id
-                     GROUP BY organization_id,
-                              unique_corp_id,
-                              dependent_id)
-    -- filter down to our organization
-    AND organization_id = :organization_id
+    AND NOT EXISTS (
+        SELECT 1 FROM eligibility.member_verification mv
+        WHERE mv.member_id = batch.id
+    )
+    -- exclude our first wallet records
+    AND NOT EXISTS (
+        SELECT 1 FROM pg_temp.purge_keep_set keep
+        WHERE keep.id = batch.id
+    )
+), purged_rows AS (
+    DELETE
+    FROM eligibility.member_versioned
+    USING purgeable
+    WHERE eligibility.member_versioned.id = purgeable.id
     RETURNING eligibility.member_versioned.*
 ), purged_ids AS (
     INSERT INTO eligibility.member_versioned_historical
     SELECT * FROM purged_rows
 )
-SELECT COUNT(1) AS purged_count FROM purged_rows;
+SELECT
+    (SELECT max(id) FROM batch) AS last_id,
+    (SELECT count(1) FROM purged_rows) AS purged_count;
+
+-- name: get_replication_lag$
+-- Get the replay lag of our slowest replica, in seconds.
+SELECT coalesce(max(extract(EPOCH FROM replay_lag)), 0)::float
+FROM pg_stat_replication;
 
 
 
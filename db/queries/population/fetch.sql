@@ -30,7 +30,7 @@ ORDER BY activated_at DESC LIMIT 1;
 
 -- name: get_the_population_information_for_user_id^
 -- Gets the active population ID and the sub population lookup keys for the specified user ID
-SELECT pop.id, pop.sub_pop_lookup_keys_csv, pop.advanced, pop.organization_id
+SELECT pop.id, pop.sub_pop_lookup_keys_csv, pop.advanced, pop.organization_id, pop.updated_at
 FROM eligibility.population pop
 WHERE pop.organization_id = (
     SELECT organization_id
@@ -56,7 +56,7 @@ LIMIT 1;
 
 -- name: get_the_population_information_for_user_and_org^
 -- Gets the active population ID and the sub population lookup keys for the specified user and org
-SELECT pop.id, pop.sub_pop_lookup_keys_csv, pop.advanced
+SELECT pop.id, pop.sub_pop_lookup_keys_csv, pop.advanced, pop.updated_at
 FROM eligibility.population pop
 WHERE pop.organization_id = (
     SELECT organization_id
@@ -80,4 +80,4 @@ WHERE pop.organization_id = (
 AND (pop.activated_at IS NOT NULL AND pop.activated_at <= CURRENT_TIMESTAMP)
 AND (pop.deactivated_at IS NULL OR pop.deactivated_at > CURRENT_TIMESTAMP)
 ORDER BY pop.activated_at DESC
-LIMIT 1;
\ No newline at end of file
+LIMIT 1;
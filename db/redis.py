@@ -9,6 +9,7 @@ from typing import (
     Collection,
     Iterable,
     Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -210,6 +211,7 @@ def _retry(
         aioredis.exceptions.TimeoutError,
         retries=retries,
         delay=delay,
+        breaker="redis",
     )
 
 
@@ -341,6 +343,18 @@ class RedisKeyStore:
         async with self.redis.connection(c=c) as c:
             return await c.incr(key, amount=amount)
 
+    @_retry
+    async def mincr(self, *, c: aioredis.Redis = None, **amounts: int) -> List[int]:
+        """Increment a series of keys by their amounts in a single round-trip."""
+        if not amounts:
+            return []
+        c: aioredis.Redis
+        async with self.redis.connection(c=c) as c:
+            async with c.pipeline(transaction=True) as pipe:
+                for key, amount in amounts.items():
+                    pipe.incrby(key, amount)
+                return await pipe.execute()
+
     def scanner(
         self,
         *opargs,
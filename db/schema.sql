@@ -242,6 +242,17 @@ CREATE TABLE eligibility.file_parse_results (
 );
 
 
+--
+-- Name: file_parse_seen; Type: TABLE; Schema: eligibility; Owner: -
+--
+
+CREATE TABLE eligibility.file_parse_seen (
+    file_id bigint NOT NULL,
+    member_id bigint NOT NULL,
+    created_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP
+);
+
+
 --
 -- Name: get_parsed_record_from_file(eligibility.file_parse_results); Type: FUNCTION; Schema: eligibility; Owner: -
 --
@@ -1717,6 +1728,23 @@ RETURNING *
 $$;
 
 
+--
+-- Name: notify_configuration_change(); Type: FUNCTION; Schema: eligibility; Owner: -
+--
+
+CREATE FUNCTION eligibility.notify_configuration_change() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+  PERFORM pg_notify(
+    'configuration_changed',
+    (CASE WHEN TG_OP = 'DELETE' THEN OLD.organization_id ELSE NEW.organization_id END)::text
+  );
+  RETURN NULL;
+END;
+$$;
+
+
 --
 -- Name: trigger_set_timestamp(); Type: FUNCTION; Schema: eligibility; Owner: -
 --
@@ -2904,6 +2932,17 @@ CREATE TABLE eligibility.configuration (
 );
 
 
+--
+-- Name: configuration_sync; Type: TABLE; Schema: eligibility; Owner: -
+--
+
+CREATE TABLE eligibility.configuration_sync (
+    organization_id bigint NOT NULL,
+    fingerprint text NOT NULL,
+    synced_at timestamp with time zone DEFAULT CURRENT_TIMESTAMP
+);
+
+
 --
 -- Name: file; Type: TABLE; Schema: eligibility; Owner: -
 --
@@ -2920,7 +2959,8 @@ CREATE TABLE eligibility.file (
     error eligibility.file_error,
     success_count integer DEFAULT 0,
     failure_count integer DEFAULT 0,
-    raw_count integer DEFAULT 0
+    raw_count integer DEFAULT 0,
+    flush_checkpoint jsonb
 );
 
 
@@ -3796,6 +3836,14 @@ ALTER TABLE ONLY eligibility.configuration
     ADD CONSTRAINT configuration_pkey PRIMARY KEY (organization_id);
 
 
+--
+-- Name: configuration_sync configuration_sync_pkey; Type: CONSTRAINT; Schema: eligibility; Owner: -
+--
+
+ALTER TABLE ONLY eligibility.configuration_sync
+    ADD CONSTRAINT configuration_sync_pkey PRIMARY KEY (organization_id);
+
+
 --
 -- Name: verification_attempt failed_verification_pkey; Type: CONSTRAINT; Schema: eligibility; Owner: -
 --
@@ -3820,6 +3868,14 @@ ALTER TABLE ONLY eligibility.file_parse_results
     ADD CONSTRAINT file_parse_results_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: file_parse_seen file_parse_seen_pkey; Type: CONSTRAINT; Schema: eligibility; Owner: -
+--
+
+ALTER TABLE ONLY eligibility.file_parse_seen
+    ADD CONSTRAINT file_parse_seen_pkey PRIMARY KEY (file_id, member_id);
+
+
 --
 -- Name: file file_pkey; Type: CONSTRAINT; Schema: eligibility; Owner: -
 --
@@ -4164,6 +4220,13 @@ CREATE INDEX idx_file_parse_results_errors ON eligibility.file_parse_results USI
 CREATE INDEX idx_file_parse_results_file_id ON eligibility.file_parse_results USING btree (file_id);
 
 
+--
+-- Name: idx_file_parse_results_file_member_identity; Type: INDEX; Schema: eligibility; Owner: -
+--
+
+CREATE INDEX idx_file_parse_results_file_member_identity ON eligibility.file_parse_results USING btree (file_id, organization_id, ltrim(lower((unique_corp_id)::text), '0'::text), lower((dependent_id)::text));
+
+
 --
 -- Name: idx_file_parse_results_org_id; Type: INDEX; Schema: eligibility; Owner: -
 --
@@ -4716,6 +4779,13 @@ CREATE TRIGGER set_address_timestamp BEFORE UPDATE ON eligibility.member_address
 CREATE TRIGGER set_address_timestamp BEFORE UPDATE ON eligibility.member_address_versioned FOR EACH ROW EXECUTE FUNCTION eligibility.trigger_set_timestamp();
 
 
+--
+-- Name: configuration notify_configuration_change; Type: TRIGGER; Schema: eligibility; Owner: -
+--
+
+CREATE TRIGGER notify_configuration_change AFTER INSERT OR DELETE OR UPDATE ON eligibility.configuration FOR EACH ROW EXECUTE FUNCTION eligibility.notify_configuration_change();
+
+
 --
 -- Name: configuration set_configuration_timestamp; Type: TRIGGER; Schema: eligibility; Owner: -
 --
@@ -4814,6 +4884,14 @@ CREATE TRIGGER set_verification_attempt_timestamp BEFORE UPDATE ON eligibility.v
 CREATE TRIGGER set_verification_timestamp BEFORE UPDATE ON eligibility.verification FOR EACH ROW EXECUTE FUNCTION eligibility.trigger_set_timestamp();
 
 
+--
+-- Name: configuration_sync configuration_sync_organization_id_fkey; Type: FK CONSTRAINT; Schema: eligibility; Owner: -
+--
+
+ALTER TABLE ONLY eligibility.configuration_sync
+    ADD CONSTRAINT configuration_sync_organization_id_fkey FOREIGN KEY (organization_id) REFERENCES eligibility.configuration(organization_id) ON DELETE CASCADE;
+
+
 --
 -- Name: member_custom_attributes custom_attribute_member_id_fkey; Type: FK CONSTRAINT; Schema: eligibility; Owner: -
 --
@@ -5178,4 +5256,9 @@ INSERT INTO public.schema_migrations (version) VALUES
     ('20240905200901'),
     ('20240905200905'),
     ('20241113144104'),
-    ('20250130194943');
+    ('20250130194943'),
+    ('20250310120000'),
+    ('20250320120000'),
+    ('20250325120000'),
+    ('20250401120000'),
+    ('20250401120100');
@@ -142,6 +142,19 @@ class IngestConfigurationRepository:
         formatted_key: str = f"{namespace}:{str(id)}:{key}"
         return await self._redis_store.incr(key=formatted_key)
 
+    @ddtrace.tracer.wrap()
+    async def incr_cache_many(
+        self, *, namespace: str, id: int, amounts: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Increment each key "{namespace}:{id}:{key}" by its amount and return the values"""
+        formatted: Dict[str, str] = {
+            key: f"{namespace}:{str(id)}:{key}" for key in amounts
+        }
+        values: List[int] = await self._redis_store.mincr(
+            **{formatted[key]: amount for key, amount in amounts.items()}
+        )
+        return dict(zip(formatted, values))
+
     @ddtrace.tracer.wrap()
     async def delete_cache(self, *, namespace: str, id: int):
         """Delete all keys at the namespace and id "{namespace}:{id}*"""
@@ -259,6 +272,38 @@ class IngestConfigurationRepository:
 
             return None
 
+    @ddtrace.tracer.wrap()
+    async def get_child_org_infos(
+        self, *, organization_id: int
+    ) -> Dict[str, db_model.ExternalMavenOrgInfo]:
+        """
+        get every child organization of a data provider, so we can map its file rows
+        without a lookup per row
+        @param organization_id: the data provider's organization id
+        @return: client_id -> ExternalMavenOrgInfo of the child organization
+        """
+        eid_org_mapping: Dict[str, int] = await self.get_external_ids_by_data_provider(
+            organization_id=organization_id
+        )
+        if not eid_org_mapping:
+            return {}
+        child_configs: List[
+            db_model.Configuration
+        ] = await self._config_client.get_for_orgs(*set(eid_org_mapping.values()))
+        child_org_infos = {
+            config.organization_id: db_model.ExternalMavenOrgInfo(
+                organization_id=config.organization_id,
+                directory_name=config.directory_name,
+                activated_at=config.activated_at,
+            )
+            for config in child_configs
+        }
+        return {
+            client_id: child_org_infos[child_organization_id]
+            for client_id, child_organization_id in eid_org_mapping.items()
+            if child_organization_id in child_org_infos
+        }
+
     @ddtrace.tracer.wrap()
     @async_ttl_cache.AsyncTTLCache(time_to_live=30 * 60, max_size=2_000)
     async def get_affiliations_header_for_org(
@@ -1,5 +1,6 @@
 import asyncio
-from typing import AnyStr, Optional
+import tempfile
+from typing import AnyStr, BinaryIO, Optional
 
 import ddtrace
 
@@ -84,3 +85,40 @@ class EligibilityFileManager:
             )
         else:
             await self.storage.save_blob(data, name, bucket_name)
+
+    @ddtrace.tracer.wrap()
+    async def put_file(
+        self,
+        file: BinaryIO,
+        name: str,
+        bucket_name: str,
+        *,
+        kek_name: str = None,
+        signing_key_name: str = None,
+    ):
+        """
+        upload the contents of a binary file to GCS bucket and save as GCS file,
+        without reading it into memory
+        encrypt data if kek_name and signing_key_name passed
+        @param file: binary file holding the data to be stored
+        @param name: file name ex: some_directory/encrypted.csv
+        @param bucket_name: GCS bucket name
+        @param kek_name: The name of the target KEK in GC KMS.
+        @param signing_key_name: The name used to determine the signing key for encryption.
+        @return: None
+        """
+        file.seek(0)
+        if self.encrypted and kek_name and signing_key_name:
+            with tempfile.TemporaryFile() as ciphertext:
+                _, metadata = await self.crypto.encrypt_file(
+                    file, ciphertext, kek_name, signing_key_name
+                )
+                await self.storage.save_blob_from_file(
+                    ciphertext,
+                    name,
+                    bucket_name,
+                    content_type="application/octet-stream",
+                    **metadata,
+                )
+        else:
+            await self.storage.save_blob_from_file(file, name, bucket_name)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+import collections
+from typing import Awaitable, Dict, List
 
 import ddtrace
 import structlog
@@ -78,14 +79,50 @@ class PersistenceService:
     async def persist_batch(
         self, *, messages: List[pubsub.PubSubEntry[model.ProcessedNotification]]
     ):
-        """Loop through a batch and persist each record"""
+        """Group a batch by file and type and persist each group in bulk"""
+        files: Dict[int, List[model.ProcessedNotification]] = collections.defaultdict(
+            list
+        )
+        streamed: List[model.ProcessedNotification] = []
+        others: List[model.ProcessedNotification] = []
         for message in messages:
+            if message.data.metadata.type == repository.IngestionType.FILE:
+                files[message.data.metadata.file_id].append(message.data)
+            elif message.data.metadata.type == repository.IngestionType.STREAM:
+                streamed.append(message.data)
+            else:
+                others.append(message.data)
+
+        for file_id, processed in files.items():
+            try:
+                await self.persist_file_batch(file_id=file_id, processed=processed)
+            except Exception as e:
+                logger.exception(
+                    "Batch persist error encountered",
+                    file_id=file_id,
+                    count=len(processed),
+                    error=e,
+                )
+                continue
+
+        if streamed:
+            try:
+                await self.persist_optum_batch(processed=streamed)
+            except Exception as e:
+                logger.exception(
+                    "Batch persist error encountered",
+                    type=repository.IngestionType.STREAM,
+                    count=len(streamed),
+                    error=e,
+                )
+
+        for processed in others:
             try:
-                await self.persist_record(processed=message.data)
+                await self.persist_record(processed=processed)
             except Exception as e:
                 logger.exception(
                     "Message persist error encountered",
-                    metadata=message.data.metadata,
+                    metadata=processed.metadata,
                     error=e,
                 )
                 continue
@@ -105,13 +142,108 @@ class PersistenceService:
             tags=[f"source:{MODULE}", f"type:{processed.metadata.type}"],
         )
 
+    @ddtrace.tracer.wrap()
+    async def persist_file_batch(
+        self, *, file_id: int, processed: List[model.ProcessedNotification]
+    ):
+        """Persist a group of records for a single file, if we have processed the whole file, flush or leave for review"""
+        errors: List[db_model.FileParseError] = []
+        error_processed: List[model.ProcessedNotification] = []
+        valid: List[db_model.FileParseResult] = []
+        valid_processed: List[model.ProcessedNotification] = []
+        for p in processed:
+            if p.record.errors:
+                errors.append(
+                    db_model.FileParseError(
+                        file_id=p.record.file_id,
+                        organization_id=p.record.organization_id,
+                        record=p.record.record,
+                        errors=p.record.errors,
+                        warnings=p.record.warnings,
+                    )
+                )
+                error_processed.append(p)
+            else:
+                valid.append(db_model.FileParseResult(**p.record.__dict__))
+                valid_processed.append(p)
+
+        # Each bulk write commits on its own, so only the group that failed falls back
+        #   to persisting one at a time - the other group is already stored.
+        failed: List[model.ProcessedNotification] = []
+        if errors and not await self._bulk_persist_file_group(
+            file_id=file_id,
+            processed=error_processed,
+            persist=self._file_parse_repo.persist_errors(errors=errors),
+        ):
+            failed.extend(error_processed)
+            errors = []
+        if valid and not await self._bulk_persist_file_group(
+            file_id=file_id,
+            processed=valid_processed,
+            persist=self._file_parse_repo.persist_valid(valid=valid),
+        ):
+            failed.extend(valid_processed)
+            valid = []
+
+        if errors or valid:
+            statsd.increment(
+                metric="eligibility.persist.count",
+                value=len(errors) + len(valid),
+                tags=[f"source:{MODULE}", f"type:{repository.IngestionType.FILE}"],
+            )
+            # increment the counts for success and errors in a single round-trip
+            counts: Dict[str, int] = await self._ingest_config.incr_cache_many(
+                namespace=service.FileIngestionService.FILE_CACHE_NAMESPACE,
+                id=file_id,
+                amounts={
+                    self.FILE_COUNT_SUCCESS_CACHE_KEY: len(valid),
+                    self.FILE_COUNT_ERROR_CACHE_KEY: len(errors),
+                },
+            )
+            if not failed:
+                await self._complete_file(
+                    processed=processed[-1],
+                    num_success=counts[self.FILE_COUNT_SUCCESS_CACHE_KEY],
+                    num_error=counts[self.FILE_COUNT_ERROR_CACHE_KEY],
+                )
+
+        # The per-record path bumps the counts and checks for completion itself, so
+        #   whichever record lands last completes the file.
+        for p in failed:
+            try:
+                await self.persist_record(processed=p)
+            except Exception as err:
+                logger.exception(
+                    "Message persist error encountered",
+                    metadata=p.metadata,
+                    error=err,
+                )
+
+    @staticmethod
+    async def _bulk_persist_file_group(
+        *,
+        file_id: int,
+        processed: List[model.ProcessedNotification],
+        persist: Awaitable,
+    ) -> bool:
+        """Run a bulk write for a group of file records, returning whether it succeeded"""
+        try:
+            await persist
+        except Exception as e:
+            logger.exception(
+                "Bulk persist error encountered, persisting records individually",
+                file_id=file_id,
+                count=len(processed),
+                error=e,
+            )
+            return False
+        return True
+
     @ddtrace.tracer.wrap()
     async def persist_file(self, *, processed: model.ProcessedNotification):
         """Persist a single file record, if we have processed the whole file, flush or leave for review"""
         num_error: int
         num_success: int
-        # get the record count for file (from a cached service function)
-        num_row: int = await self.get_row_count(file_id=processed.metadata.file_id)
 
         if processed.record.errors:
             # convert to FileParseError
@@ -152,6 +284,21 @@ class PersistenceService:
                 id=processed.metadata.file_id,
             )
 
+        await self._complete_file(
+            processed=processed, num_success=num_success, num_error=num_error
+        )
+
+    async def _complete_file(
+        self,
+        *,
+        processed: model.ProcessedNotification,
+        num_success: int,
+        num_error: int,
+    ):
+        """If we have processed the whole file, flush or leave for review"""
+        # get the record count for file (from a cached service function)
+        num_row: int = await self.get_row_count(file_id=processed.metadata.file_id)
+
         if num_error + num_success == num_row:
             if PersistenceService.should_review(total=num_row, success=num_success):
                 logger.info(
@@ -182,9 +329,52 @@ class PersistenceService:
                 id=processed.metadata.file_id,
             )
 
+    @ddtrace.tracer.wrap()
+    async def persist_optum_batch(
+        self, *, processed: List[model.ProcessedNotification]
+    ):
+        """Persist a group of Optum records in bulk"""
+        records: List[db_model.ExternalRecordAndAddress] = [
+            self._to_external_record_and_address(processed=p) for p in processed
+        ]
+        try:
+            await self._member_repo.persist_optum_members(records=records)
+        except Exception as e:
+            # Fall back to persisting one at a time, so a bad record can't lose the
+            #   rest of the group.
+            logger.exception(
+                "Bulk persist error encountered, persisting records individually",
+                type=repository.IngestionType.STREAM,
+                count=len(processed),
+                error=e,
+            )
+            for p in processed:
+                try:
+                    await self.persist_record(processed=p)
+                except Exception as err:
+                    logger.exception(
+                        "Message persist error encountered",
+                        metadata=p.metadata,
+                        error=err,
+                    )
+            return
+
+        statsd.increment(
+            metric="eligibility.persist.count",
+            value=len(processed),
+            tags=[f"source:{MODULE}", f"type:{repository.IngestionType.STREAM}"],
+        )
+
     @ddtrace.tracer.wrap()
     async def persist_optum(self, *, processed: model.ProcessedNotification):
         """Persist a single Optum record"""
+        record_and_address = self._to_external_record_and_address(processed=processed)
+        await self._member_repo.persist_optum_members(records=[record_and_address])
+
+    @staticmethod
+    def _to_external_record_and_address(
+        *, processed: model.ProcessedNotification
+    ) -> db_model.ExternalRecordAndAddress:
         external_record = db_model.ExternalRecord(
             organization_id=processed.record.organization_id,
             first_name=processed.record.first_name,
@@ -201,10 +391,9 @@ class PersistenceService:
             do_not_contact=processed.record.do_not_contact,
             external_id=processed.record.record["external_id"],
         )
-        record_and_address = db_model.ExternalRecordAndAddress(
+        return db_model.ExternalRecordAndAddress(
             external_record=external_record, record_address=processed.address
         )
-        await self._member_repo.persist_optum_members(records=[record_and_address])
 
     @staticmethod
     @ddtrace.tracer.wrap()
@@ -220,7 +409,9 @@ class PersistenceService:
         return persist_rate <= threshold
 
     @ddtrace.tracer.wrap()
-    @async_ttl_cache.AsyncTTLCache(time_to_live=30 * 60, max_size=5_000)
+    @async_ttl_cache.AsyncTTLCache(
+        time_to_live=30 * 60, max_size=5_000, negative_time_to_live=60
+    )
     async def get_row_count(self, *, file_id: int) -> int:
         """Get the total number of rows for this file"""
         return await self._ingest_config.get_cache(
@@ -0,0 +1,100 @@
+"""Compare how quickly we coerce query results to our models, with and without typic.
+
+Rows are generated by the database in the shape of each table, so no data is needed:
+
+    python -m scripts.benchmark_record_decoding --rows 100000
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, List
+
+import asyncpg
+
+from db.clients import (
+    file_parse_results_client,
+    member_versioned_client,
+    postgres_connector,
+    verification_client,
+)
+from db.clients.client import ServiceProtocol
+
+# Each query builds `$1` rows of its table from a json object, so the columns and
+#   their types are exactly what a `SELECT *` on the table would return.
+QUERIES = {
+    member_versioned_client.MembersVersioned: """
+        SELECT (jsonb_populate_record(NULL::eligibility.member_versioned, jsonb_build_object(
+            'id', i, 'organization_id', 1, 'file_id', 1,
+            'first_name', 'first-' || i, 'last_name', 'last-' || i,
+            'email', 'member-' || i || '@example.com', 'date_of_birth', '1990-01-01',
+            'unique_corp_id', 'corp-' || i, 'dependent_id', '', 'work_state', 'NY',
+            'effective_range', '[2024-01-01,)', 'record', jsonb_build_object('id', i),
+            'custom_attributes', '{}'::jsonb, 'hash_value', md5(i::text),
+            'hash_version', 1, 'created_at', now(), 'updated_at', now()
+        ))).* FROM generate_series(1, $1) AS i;
+    """,
+    verification_client.Verifications: """
+        SELECT (jsonb_populate_record(NULL::eligibility.verification, jsonb_build_object(
+            'id', i, 'user_id', i, 'organization_id', 1,
+            'first_name', 'first-' || i, 'last_name', 'last-' || i,
+            'email', 'member-' || i || '@example.com', 'date_of_birth', '1990-01-01',
+            'unique_corp_id', 'corp-' || i, 'verification_type', 'STANDARD',
+            'additional_fields', '{}'::jsonb, 'verification_session', gen_random_uuid(),
+            'created_at', now(), 'updated_at', now(), 'verified_at', now()
+        ))).* FROM generate_series(1, $1) AS i;
+    """,
+    file_parse_results_client.FileParseResults: """
+        SELECT (jsonb_populate_record(NULL::eligibility.file_parse_results, jsonb_build_object(
+            'id', i, 'organization_id', 1, 'file_id', 1,
+            'first_name', 'first-' || i, 'last_name', 'last-' || i,
+            'email', 'member-' || i || '@example.com', 'date_of_birth', '1990-01-01',
+            'unique_corp_id', 'corp-' || i, 'dependent_id', '', 'work_state', 'NY',
+            'effective_range', '[2024-01-01,)', 'record', jsonb_build_object('id', i),
+            'errors', '{}'::text[], 'warnings', '{}'::text[], 'hash_value', md5(i::text),
+            'created_at', now(), 'updated_at', now()
+        ))).* FROM generate_series(1, $1) AS i;
+    """,
+}
+
+
+def rate(coerce: Callable[[List[asyncpg.Record]], list], records, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        coerce(records)
+        best = min(best, time.perf_counter() - start)
+    return len(records) / best
+
+
+async def benchmark(*, rows: int, repeat: int):
+    dsn = postgres_connector.get_dsn()
+    connection = await asyncpg.connect(dsn)
+    try:
+        await postgres_connector._init_connection(connection)
+        print(f"{'model':<20}{'typic rows/s':>16}{'decoder rows/s':>16}{'speedup':>10}")
+        service: ServiceProtocol
+        for service, query in QUERIES.items():
+            records = await connection.fetch(query, rows)
+            assert service.decoder.decode_many(
+                records
+            ) == service.bulk_protocol.transmute({**r} for r in records)
+            before = rate(
+                lambda rs: service.bulk_protocol.transmute({**r} for r in rs),
+                records,
+                repeat,
+            )
+            after = rate(service.decoder.decode_many, records, repeat)
+            print(
+                f"{service.model.__name__:<20}{before:>16,.0f}{after:>16,.0f}"
+                f"{after / before:>9.1f}x"
+            )
+    finally:
+        await connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(benchmark(rows=args.rows, repeat=args.repeat))
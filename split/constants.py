@@ -11,3 +11,5 @@ class AffiliationColumns:
 class FileSplitConstants:
     PARENT_FILE_REVIEW_THRESHOLD = 0.95
     READ_BATCH_SIZE = 1000
+    # how many child files we upload at once
+    UPLOAD_CONCURRENCY = 4
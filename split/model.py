@@ -27,6 +27,11 @@ class SplitFileResult:
         valid_rate = (self.total_rows - self.invalid_rows) / self.total_rows
         return valid_rate <= FileSplitConstants.PARENT_FILE_REVIEW_THRESHOLD
 
+    def close(self):
+        """Release the temporary files holding the child files' rows."""
+        for child_file in self.child_files.values():
+            child_file.writer.close()
+
 
 @dataclasses.dataclass
 class AffiliationsHeader:
@@ -45,7 +50,7 @@ class ChildFileInfo:
     """
     holding all information needed to write a child file
     organization: ExternalMavenOrgInfo which has child organization id and directory_name, will be used for write child file
-    writer: SplitFileCsvWriter holding the columns info and buffer with child file content
+    writer: SplitFileCsvWriter holding the columns info and temporary file with child file content
     """
 
     organization: ExternalMavenOrgInfo
@@ -2,23 +2,57 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import Dict, Sequence
+import tempfile
+from typing import BinaryIO, Dict, Sequence
 
 import structlog
 
 logger = structlog.getLogger(__name__)
 
 EXTRA_HEADER = "extra"
+# How much of a child file we'll hold in memory before spilling it to disk.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+# How much encoded csv we'll buffer before writing it to the spool.
+FLUSH_SIZE = 64 * 1024
 
 
 class SplitFileCsvWriter:
-    def __init__(self, *, fieldnames: Sequence[str]):
+    """Writes the rows of a child file as utf-8 csv.
+
+    Rows are encoded into a temporary file, which is kept in memory until it
+    reaches `spool_max_size`, then moved to disk, so our memory stays flat no matter
+    how large the parent file is.
+    """
+
+    def __init__(
+        self, *, fieldnames: Sequence[str], spool_max_size: int = SPOOL_MAX_SIZE
+    ):
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
         self._buffer = io.StringIO()
         self._writer = csv.DictWriter(self._buffer, fieldnames=fieldnames)
         self._writer.writeheader()
+        self.row_count = 0
 
     def write_row(self, row: Dict):
         self._writer.writerow(row)
-
-    def get_value(self):
-        return self._buffer.getvalue()
+        self.row_count += 1
+        if self._buffer.tell() >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        self._file.seek(0, io.SEEK_END)
+        self._file.write(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def get_file(self) -> BinaryIO:
+        """Get the encoded child file, rewound to the start."""
+        self.flush()
+        self._file.seek(0)
+        return self._file
+
+    def get_value(self) -> str:
+        return self.get_file().read().decode("utf-8")
+
+    def close(self):
+        self._file.close()
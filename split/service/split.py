@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import os
+from typing import Dict, List
 
 import ddtrace
 import structlog
@@ -61,20 +63,72 @@ class FileSplitService:
             # we stop file process
             return None
 
-        return await self._write_split_files(split_file_result=split_file_result)
+        return await self._write_split_files(
+            parent_file_info=parent_file_info, split_file_result=split_file_result
+        )
 
     @ddtrace.tracer.wrap()
     async def _write_split_files(
-        self, *, split_file_result: SplitFileResult
+        self, *, parent_file_info: ParentFileInfo, split_file_result: SplitFileResult
     ) -> db_model.File | None:
         """
-        this function will write the child file to GCS
-        @param split_file_result:
-        @return:
+        this function will write the child files to GCS, a few at a time, under each
+        child organization's directory, so they're picked up for processing
+        @param parent_file_info: ParentFileInfo of the parent file being split
+        @param split_file_result: SplitFileResult holding each child file's rows
+        @return: the parent e9y.file db model, or None if any child file failed to upload
         """
-        # Todo, will be implement in next MR
+        parent_file = parent_file_info.file
+        basename = os.path.basename(parent_file.name)
+        semaphore = asyncio.Semaphore(FileSplitConstants.UPLOAD_CONCURRENCY)
+
+        async def write_child_file(child_file: ChildFileInfo):
+            directory_name = child_file.organization.directory_name
+            if not directory_name:
+                raise ValueError(
+                    f"child organization {child_file.organization.organization_id} "
+                    "has no directory configured"
+                )
+            name = f"{directory_name}/{basename}"
+            async with semaphore:
+                await self._file_manager.put_file(
+                    child_file.writer.get_file(),
+                    name=name,
+                    bucket_name=GCP_SETTINGS.census_file_bucket,
+                    kek_name=GCP_SETTINGS.census_file_kek_name,
+                    signing_key_name=GCP_SETTINGS.census_file_signing_key_name,
+                )
+            logger.info(
+                "Wrote child file",
+                filename=name,
+                organization_id=child_file.organization.organization_id,
+                row_count=child_file.writer.row_count,
+            )
 
-        pass
+        try:
+            results = await asyncio.gather(
+                *(
+                    write_child_file(child_file)
+                    for child_file in split_file_result.child_files.values()
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            split_file_result.close()
+
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            logger.error(
+                "Failed to write child files",
+                file_id=parent_file.id,
+                filename=parent_file.name,
+                organization_id=parent_file.organization_id,
+                failed=len(errors),
+                total=len(results),
+                error=str(errors[0]),
+            )
+            return None
+        return parent_file
 
     @ddtrace.tracer.wrap()
     async def _initialize_parent_file(self, *, filename: str) -> ParentFileInfo | None:
@@ -213,51 +267,50 @@ class FileSplitService:
     ) -> SplitFileResult | None:
         """
         read parent file rows and split rows based on child organization id
-        for each parent file row,
-        1. find child organization by client_id, customer_id source column
-        2. group rows by child organization id in the split file result
+        the child organizations are loaded once up front, then for each parent file row,
+        1. find child organization by client_id source column
+        2. write the row to its child organization's file in the split file result
         @param reader: EligibilityCSVReader which hold the parent file content and information
         @param parent_file_info: SplitFileResult holding the split file result info,
           including row counts and child organization grouped rows. see definition for details
         @return:
         """
         split_file_result = SplitFileResult()
+        client_id_source = parent_file_info.affiliations_header.client_id_source
+        child_orgs: Dict[
+            str, db_model.ExternalMavenOrgInfo
+        ] = await self._ingest_config_repo.get_child_org_infos(
+            organization_id=parent_file_info.file.organization_id
+        )
 
-        for batch in reader.parse(batch_size=FileSplitConstants.READ_BATCH_SIZE):
-            for r in batch:
-                child_org: db_model.ExternalMavenOrgInfo | None = (
-                    await self._ingest_config_repo.get_external_org_info(
-                        source=repository.IngestionType.FILE,
-                        client_id=r[
-                            parent_file_info.affiliations_header.client_id_source
-                        ],
-                        customer_id=r.get(
-                            parent_file_info.affiliations_header.customer_id_source, ""
-                        ),
-                        organization_id=parent_file_info.file.organization_id,
-                    )
-                )
-                # cannot find child org based on client_id, customer_id, mark row invalid
-                if not child_org:
-                    split_file_result.invalid_rows += 1
-                    continue
-                # build the child_files, which is a child organization id -> ChildFileInfo dict.
-                # ChildFileInfo holding necessary information to write a child file
-                if child_org.organization_id not in split_file_result.child_files:
-                    split_file_result.child_files[
+        try:
+            for batch in reader.parse(batch_size=FileSplitConstants.READ_BATCH_SIZE):
+                for r in batch:
+                    child_org = child_orgs.get(r.get(client_id_source))
+                    # cannot find child org based on client_id, mark row invalid
+                    if not child_org:
+                        split_file_result.invalid_rows += 1
+                        continue
+                    # build the child_files, which is a child organization id -> ChildFileInfo dict.
+                    # ChildFileInfo holding necessary information to write a child file
+                    child_file = split_file_result.child_files.get(
                         child_org.organization_id
-                    ] = ChildFileInfo(
-                        organization=child_org,
-                        writer=SplitFileCsvWriter(fieldnames=list(r.keys())),
                     )
-
-                # write row to corresponding child file info
-                split_file_result.child_files[
-                    child_org.organization_id
-                ].writer.write_row(r)
-
-            batch_size = len(batch)
-            split_file_result.total_rows += batch_size
+                    if child_file is None:
+                        child_file = split_file_result.child_files[
+                            child_org.organization_id
+                        ] = ChildFileInfo(
+                            organization=child_org,
+                            writer=SplitFileCsvWriter(fieldnames=list(r.keys())),
+                        )
+
+                    # write row to corresponding child file info
+                    child_file.writer.write_row(r)
+
+                split_file_result.total_rows += len(batch)
+        except Exception:
+            split_file_result.close()
+            raise
 
         # Roughly persisted file counts here, may change in https://mavenclinic.atlassian.net/browse/ELIG-1565
         await self._ingest_config_repo.set_file_count(
@@ -277,5 +330,6 @@ class FileSplitService:
                 total_rows=split_file_result.total_rows,
                 invalid_rows=split_file_result.invalid_rows,
             )
+            split_file_result.close()
             return None
         return split_file_result
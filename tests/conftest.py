@@ -11,6 +11,7 @@ from aioresponses import aioresponses
 from app.common import gcs
 from app.eligibility.gcs import EligibilityFileManager
 from app.eligibility.parse import EligibilityFileParser
+from app.utils import feature_flag
 from config import settings
 
 PROJECT_DIR = pathlib.Path(__file__).parent.parent
@@ -60,6 +61,13 @@ def bootstrap():
             logger.removeHandler(handler)
 
 
+@pytest.fixture(autouse=True)
+def reset_feature_flag_snapshots():
+    feature_flag.reset_snapshots()
+    yield
+    feature_flag.reset_snapshots()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def patch_pubsub():
     with mock.patch("mmlib.pubsub.pub.publish") as m:
@@ -383,15 +383,29 @@ async def e9y_session():
     connection = await connector.pool.acquire()
     transaction = connection.transaction()
     await transaction.start()
-
-    @contextlib.asynccontextmanager
-    async def connect(*, c=None):
-        yield connection
-
-    connector.connection = connect
+    pool = connector.pool
+    connector.pool = _PinnedPool(pool, connection)
     yield connector
+    connector.pool = pool
     await transaction.rollback()
-    await connector.pool.release(connection)
+    await pool.release(connection)
+
+
+class _PinnedPool:
+    """Hands out the one connection the tests run in, so it can be rolled back."""
+
+    def __init__(self, pool: asyncpg.pool.Pool, connection: asyncpg.Connection):
+        self.pool = pool
+        self.connection = connection
+
+    async def acquire(self, *, timeout: float = None) -> asyncpg.Connection:
+        return self.connection
+
+    async def release(self, connection: asyncpg.Connection):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self.pool, name)
 
 
 @pytest.fixture
@@ -641,6 +641,65 @@ class TestConfigurationClient:
 
     # endregion
 
+    # region sync
+    @staticmethod
+    async def test_sync_external_ids_without_source(configuration_test_client):
+        # Given
+        provider, other_provider, sub_config, other_sub_config = [
+            await configuration_test_client.persist(
+                model=data_models.ConfigurationFactory.create(data_provider=provider)
+            )
+            for provider in (True, True, False, False)
+        ]
+        kept, removed, moved = (
+            MavenOrgExternalID(
+                source=None,
+                external_id="shared",
+                organization_id=sub_config.organization_id,
+                data_provider_organization_id=provider.organization_id,
+            ),
+            MavenOrgExternalID(
+                source=None,
+                external_id="shared",
+                organization_id=other_sub_config.organization_id,
+                data_provider_organization_id=other_provider.organization_id,
+            ),
+            MavenOrgExternalID(
+                source=None,
+                external_id="moved",
+                organization_id=sub_config.organization_id,
+                data_provider_organization_id=provider.organization_id,
+            ),
+        )
+        await configuration_test_client.bulk_add_external_id([kept, removed, moved])
+        moved_to = MavenOrgExternalID(
+            source=None,
+            external_id="moved",
+            organization_id=other_sub_config.organization_id,
+            data_provider_organization_id=provider.organization_id,
+        )
+
+        # When
+        await configuration_test_client.sync_external_ids(
+            upserts=[moved_to], deletes=[removed]
+        )
+        saved_external_ids = {
+            (
+                r["data_provider_organization_id"],
+                r["external_id"],
+                r["organization_id"],
+            )
+            for r in await configuration_test_client.get_all_external_ids()
+        }
+
+        # Then
+        assert saved_external_ids == {
+            (provider.organization_id, "shared", sub_config.organization_id),
+            (provider.organization_id, "moved", other_sub_config.organization_id),
+        }
+
+    # endregion
+
     # region delete
     @staticmethod
     async def test_delete(
@@ -670,6 +670,88 @@ class TestFileParseResultsClient:
             (None, None)
         } and (None, None) not in {(m.hash_value, m.hash_version) for m in new_members}
 
+    @staticmethod
+    async def test_copy_file_parse_results(
+        test_file: file_client.File,
+        file_parse_results_test_client,
+    ):
+        # Given
+        inputs: List[
+            file_parse_results_client.FileParseResult
+        ] = factory.FileParseResultFactory.create_batch(
+            10, organization_id=test_file.organization_id, file_id=test_file.id
+        )
+
+        # When
+        num_copied = await file_parse_results_test_client.copy_file_parse_results(
+            results=inputs
+        )
+        created = await file_parse_results_test_client.get_file_parse_results_for_file(
+            test_file.id
+        )
+
+        # Then
+        assert len(created) == num_copied == len(inputs)
+        assert set(
+            (r.organization_id, r.dependent_id, r.unique_corp_id) for r in inputs
+        ) == set((r.organization_id, r.dependent_id, r.unique_corp_id) for r in created)
+
+    @staticmethod
+    async def test_copy_file_parse_results_matches_bulk_persist(
+        test_file: file_client.File,
+        file_parse_results_test_client,
+    ):
+        # Given
+        duplicate = factory.FileParseResultFactory.create(
+            organization_id=test_file.organization_id,
+            file_id=test_file.id,
+            effective_range=None,
+        )
+        inputs = [duplicate, duplicate]
+
+        # When
+        num_copied = await file_parse_results_test_client.copy_file_parse_results(
+            results=inputs
+        )
+        copied = await file_parse_results_test_client.get_file_parse_results_for_file(
+            test_file.id
+        )
+        await file_parse_results_test_client.delete_file_parse_results_for_files(
+            test_file.id
+        )
+        num_persisted = (
+            await file_parse_results_test_client.bulk_persist_file_parse_results(
+                results=inputs
+            )
+        )
+        persisted = (
+            await file_parse_results_test_client.get_file_parse_results_for_file(
+                test_file.id
+            )
+        )
+
+        # Then
+        assert num_copied == num_persisted == 1
+        assert copied[0].effective_range == persisted[0].effective_range
+
+    @staticmethod
+    async def test_copy_file_parse_errors(test_file, file_parse_results_test_client):
+        # Given
+        inputs = factory.FileParseErrorFactory.create_batch(
+            10, organization_id=test_file.organization_id, file_id=test_file.id
+        )
+
+        # When
+        num_copied = await file_parse_results_test_client.copy_file_parse_errors(
+            errors=inputs
+        )
+        output = await file_parse_results_test_client.get_file_parse_errors_for_file(
+            test_file.id
+        )
+
+        # Then
+        assert len(output) == num_copied == len(inputs)
+
     # region fetch
     @staticmethod
     async def test_get_all_file_parse_results(
@@ -1775,6 +1857,52 @@ class TestBulkPersistParsedRecords:
 
     # endregion bulk_persist_parsed_records_for_file_and_org_dual_write_hash
 
+    @staticmethod
+    async def test_bulk_persist_parsed_records_chunk_for_file_dual_write_hash_checkpoints(
+        test_config: model.Configuration,
+        file_test_client,
+        file_parse_results_test_client,
+        member_versioned_test_client,
+    ):
+        # Given
+        file: model.File = await file_test_client.persist(
+            model=factory.FileFactory.create(
+                organization_id=test_config.organization_id
+            )
+        )
+        await file_parse_results_test_client.bulk_persist_file_parse_results(
+            results=factory.FileParseResultFactoryWithHash.create_batch(
+                10,
+                organization_id=test_config.organization_id,
+                file_id=file.id,
+            )
+        )
+
+        # When
+        chunk = await file_parse_results_test_client.bulk_persist_parsed_records_chunk_for_file_dual_write_hash(
+            file.id, chunk_size=4
+        )
+        checkpoint = await file_test_client.get_flush_checkpoint(file.id)
+        after = checkpoint
+        while (
+            next_chunk := await file_parse_results_test_client.bulk_persist_parsed_records_chunk_for_file_dual_write_hash(
+                file.id, chunk_size=4, after=after
+            )
+        ) is not None:
+            after = next_chunk
+
+        # Then
+        members_versioned = await member_versioned_test_client.get_for_file(
+            file_id=file.id
+        )
+        assert chunk["flushed"] == 4
+        assert checkpoint == {
+            "organization_id": chunk["organization_id"],
+            "unique_corp_id": chunk["unique_corp_id"],
+            "dependent_id": chunk["dependent_id"],
+        }
+        assert len(members_versioned) == 10
+
     @staticmethod
     async def test_get_count_hashed_inserted_for_file(
         test_config: model.Configuration,
@@ -1846,3 +1974,59 @@ class TestBulkPersistParsedRecords:
         )
         assert result["hashed_count"] == expected_num_of_members
         assert result["new_count"] == expected_second_num_members
+
+    @staticmethod
+    async def test_touch_seen_members_for_file_restores_member(
+        test_config: model.Configuration,
+        file_test_client,
+        file_parse_results_test_client,
+        member_test_client,
+        member_versioned_test_client,
+    ):
+        """An unchanged member who was expired in v1 is re-opened from member_versioned"""
+        # Given
+        file_1, file_2 = [
+            await file_test_client.persist(
+                model=factory.FileFactory.create(
+                    organization_id=test_config.organization_id
+                )
+            )
+            for _ in range(2)
+        ]
+        versioned = await member_versioned_test_client.persist(
+            model=factory.MemberVersionedFactoryWithHash.create(
+                organization_id=test_config.organization_id,
+                file_id=file_1.id,
+                hash_version=1,
+                effective_range=factory.ExpiredDateRangeFactory.create(),
+            )
+        )
+        await member_test_client.persist(
+            model=factory.MemberFactory.create(
+                organization_id=test_config.organization_id,
+                file_id=file_1.id,
+                unique_corp_id=versioned.unique_corp_id,
+                dependent_id=versioned.dependent_id,
+                first_name="stale",
+                effective_range=factory.ExpiredDateRangeFactory.create(),
+            )
+        )
+        await file_parse_results_test_client.persist_file_parse_seen(
+            file_id=file_2.id, hash_values=[versioned.hash_value], hash_version=1
+        )
+
+        # When
+        touched = await file_parse_results_test_client.touch_seen_members_for_file(
+            file_2.id, chunk_size=1
+        )
+        remaining = await file_parse_results_test_client.touch_seen_members_for_file(
+            file_2.id, chunk_size=1
+        )
+
+        # Then
+        [member] = await member_test_client.get_for_org(test_config.organization_id)
+        assert touched == 1
+        assert remaining == 0
+        assert member.file_id == file_2.id
+        assert member.first_name == versioned.first_name
+        assert member.effective_range.upper is None
@@ -108,6 +108,39 @@ class TestMemberVersionedClient:
             test_member_versioned.organization_id
         ) == [test_member_versioned]
 
+    @staticmethod
+    async def test_column_cursor_for_org(
+        test_member_versioned: member_versioned_client.MemberVersioned,
+        member_versioned_test_client,
+    ):
+        # When
+        async with member_versioned_test_client.column_cursor_for_org(
+            test_member_versioned.organization_id
+        ) as cursor:
+            batches = [batch async for batch in cursor.batches(100)]
+
+        # Then
+        assert [len(b) for b in batches] == [1]
+        assert batches[0]["id"] == (test_member_versioned.id,)
+        assert [*batches[0].rows()] == [test_member_versioned]
+
+    @staticmethod
+    async def test_column_cursor_for_org_selected_columns(
+        test_member_versioned: member_versioned_client.MemberVersioned,
+        member_versioned_test_client,
+    ):
+        # When
+        async with member_versioned_test_client.column_cursor_for_org(
+            test_member_versioned.organization_id, columns=("id", "email")
+        ) as cursor:
+            batch = await cursor.fetch(100)
+
+        # Then
+        assert batch.columns == {
+            "id": (test_member_versioned.id,),
+            "email": (test_member_versioned.email,),
+        }
+
     @staticmethod
     async def test_get_count_for_org(
         test_member_versioned: member_versioned_client.MemberVersioned,
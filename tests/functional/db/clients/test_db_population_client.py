@@ -9,7 +9,7 @@ from tests.functional.conftest import NUMBER_TEST_OBJECTS
 
 from app.eligibility.populations import model as pop_model
 from db import model
-from db.clients import configuration_client, member_versioned_client, population_client
+from db.clients import configuration_client, population_client
 
 pytestmark = pytest.mark.asyncio
 
@@ -276,108 +276,6 @@ class TestPopulationClient:
         # Then
         assert pop_info is None
 
-    @staticmethod
-    @pytest.mark.usefixtures("test_member_verification")
-    @pytest.mark.parametrize(
-        argnames="work_state,custom_attributes,expected_sub_pop_id",
-        argvalues=[
-            ("NY", '{"employment_status": "Part", "group_number": "3"}', 203),
-            ("ZZ", '{"employment_status": "Full", "group_number": "2"}', 202),
-        ],
-        ids=["NY-Part-3", "ZZ-Full-2"],
-    )
-    async def test_get_the_sub_pop_id_using_lookup_keys_for_member(
-        work_state: str,
-        custom_attributes: str,
-        expected_sub_pop_id: int,
-        test_member_versioned: model.MemberVersioned,
-        member_versioned_test_client: member_versioned_client.MembersVersioned,
-        mapped_population: pop_model.Population,
-        population_test_client: population_client.Populations,
-    ):
-        # Given
-        test_member_versioned.work_state = work_state
-        test_member_versioned.custom_attributes = custom_attributes
-        await member_versioned_test_client.persist(model=test_member_versioned)
-
-        # When
-        returned_sub_pop_id = await population_test_client.get_the_sub_pop_id_using_lookup_keys_for_member(
-            lookup_keys_csv=mapped_population.sub_pop_lookup_keys_csv,
-            member=test_member_versioned,
-            population_id=mapped_population.id,
-        )
-
-        # Then
-        assert returned_sub_pop_id == expected_sub_pop_id
-
-    @staticmethod
-    @pytest.mark.usefixtures("test_member_verification")
-    @pytest.mark.parametrize(
-        argnames="record,expected_sub_pop_id",
-        argvalues=[
-            ({"wallet_enabled": True}, 101),
-            ({"wallet_enabled": False}, 102),
-            ({}, None),
-        ],
-        ids=["wallet enabled", "wallet not enabled", "wallet not set"],
-    )
-    async def test_get_the_sub_pop_id_using_lookup_keys_for_member_using_bool(
-        record: dict,
-        expected_sub_pop_id: int,
-        test_member_versioned: model.MemberVersioned,
-        member_versioned_test_client: member_versioned_client.MembersVersioned,
-        mapped_populations_with_bool: pop_model.Population,
-        population_test_client: population_client.Populations,
-    ):
-        # Given
-        test_member_versioned.record = record
-        await member_versioned_test_client.persist(model=test_member_versioned)
-
-        # When
-        returned_sub_pop_id = await population_test_client.get_the_sub_pop_id_using_lookup_keys_for_member(
-            lookup_keys_csv=mapped_populations_with_bool.sub_pop_lookup_keys_csv,
-            member=test_member_versioned,
-            population_id=mapped_populations_with_bool.id,
-        )
-
-        # Then
-        assert returned_sub_pop_id == expected_sub_pop_id
-
-    @staticmethod
-    @pytest.mark.usefixtures("test_member_verification")
-    @pytest.mark.parametrize(
-        argnames="work_state,custom_attributes",
-        argvalues=[
-            ("NY", '{"employment_status": "Party", "group_number": "3"}'),
-            ("ZZ", '{"employment_status": "Full", "group_number": "21"}'),
-            ("NJ", '{"unemployment_status": "Empty", "group_number": "2"}'),
-            ("NY", '{"employment_status": "Full", "group_dumber": "1"}'),
-        ],
-        ids=["NY-Party-3", "ZZ-Full-21", "NJ-None-2", "NY-Full-None"],
-    )
-    async def test_get_the_sub_pop_id_using_lookup_keys_for_member_fail(
-        work_state: str,
-        custom_attributes: str,
-        test_member_versioned: model.MemberVersioned,
-        member_versioned_test_client: member_versioned_client.MembersVersioned,
-        mapped_population: pop_model.Population,
-        population_test_client: population_client.Populations,
-    ):
-        # Given
-        test_member_versioned.work_state = work_state
-        test_member_versioned.custom_attributes = custom_attributes
-        await member_versioned_test_client.persist(model=test_member_versioned)
-
-        # When
-        returned_sub_pop_id = await population_test_client.get_the_sub_pop_id_using_lookup_keys_for_member(
-            lookup_keys_csv=mapped_population.sub_pop_lookup_keys_csv,
-            member=test_member_versioned,
-            population_id=mapped_population.id,
-        )
-
-        # Then
-        assert returned_sub_pop_id is None
-
     @staticmethod
     async def test_set_sub_pop_lookup_info(
         active_test_population: pop_model.Population,
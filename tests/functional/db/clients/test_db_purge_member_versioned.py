@@ -180,6 +180,67 @@ class TestMemberVersionedPurgeClient:
         assert purged_records == [expired_wallet]
         assert len_purged == 1
 
+    @staticmethod
+    async def test_purge_in_batches(
+        member_versioned_test_client, original_wallet, expired_wallet, optum_record
+    ):
+        """Test case where the organization's records span several batches"""
+
+        # Given
+        # When
+        len_purged = await member_versioned_test_client.purge_expired_records(
+            organization_id=original_wallet.organization_id, batch_size=1
+        )
+
+        # Then
+        remaining_records = await member_versioned_test_client.all()
+        assert expired_wallet not in remaining_records
+        assert original_wallet in remaining_records
+
+        purged_records = await member_versioned_test_client.get_all_historical()
+        assert purged_records == [expired_wallet]
+        assert len_purged == 1
+
+    @staticmethod
+    async def test_purge_later_version_of_member(
+        member_versioned_test_client, test_file, original_wallet
+    ):
+        """Test case where the expired record is the newest version of an existing member"""
+
+        # Given
+        other_member = await member_versioned_test_client.persist(
+            model=data_models.MemberVersionedFactory.create(
+                organization_id=test_file.organization_id,
+                file_id=test_file.id,
+                unique_corp_id="other-member",
+                dependent_id="other-member",
+            )
+        )
+        later_version = await member_versioned_test_client.persist(
+            model=data_models.MemberVersionedFactory.create(
+                organization_id=test_file.organization_id,
+                file_id=test_file.id,
+                unique_corp_id=original_wallet.unique_corp_id,
+                dependent_id=original_wallet.dependent_id,
+                effective_range=ExpiredDateRangeFactory.create(),
+            )
+        )
+
+        # When
+        len_purged = await member_versioned_test_client.purge_expired_records(
+            organization_id=original_wallet.organization_id, batch_size=1
+        )
+
+        # Then
+        remaining_records = await member_versioned_test_client.all()
+        assert later_version not in remaining_records
+        assert original_wallet in remaining_records
+        assert other_member in remaining_records
+
+        purged_records = await member_versioned_test_client.get_all_historical()
+        assert purged_records == [later_version]
+        assert len_purged == 1
+
     @staticmethod
     async def test_purge_retain_verification_records(
         member_versioned_test_client,
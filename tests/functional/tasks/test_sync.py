@@ -495,7 +495,7 @@ class TestFileSync:
         )
 
         with patch("mmlib.ops.stats.increment") as mock_increment, patch(
-            "db.clients.configuration_client.Configurations.delete_and_recreate_all_external_ids",
+            "db.clients.configuration_client.Configurations.sync_external_ids",
             side_effect=Exception("mocked FK exception"),
         ):
             # when
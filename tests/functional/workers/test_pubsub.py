@@ -1,4 +1,4 @@
-import datetime
+import time
 from unittest import mock
 
 import pytest
@@ -355,9 +355,7 @@ class TestExternalRecordNotificationsHandler:
             # Set TTL to be 0:30:01 ago so that a second call will already be considered expired
             # The TTL value is set when the initial call is made, so the mocked TTL value must
             # be set before the first call to get_cached_external_ids_by_value.
-            ttl_func_mock.return_value = datetime.datetime.now() - datetime.timedelta(
-                minutes=30, seconds=1
-            )
+            ttl_func_mock.return_value = time.monotonic() - (30 * 60 + 1)
             await get_cached_external_org_infos_by_value(
                 source="foo",
                 external_id="bar",
@@ -0,0 +1,25 @@
+import types
+
+import aioredis
+import pytest
+
+from app.worker import redis
+
+# Needed to run async tests, otherwise they are skipped
+pytestmark = pytest.mark.asyncio
+
+
+async def test_ack_acknowledges_notification(keystore):
+    # Given
+    key = "test-pending-file"
+    c: aioredis.Redis
+    async with keystore.redis.connection() as c:
+        await c.xgroup_create(key, redis.GROUP, id="0", mkstream=True)
+        messageid = await c.xadd(key, {"file_id": "1"})
+        await c.xreadgroup(redis.GROUP, "test-consumer", streams={key: ">"})
+        stream = types.SimpleNamespace(redis=c)
+        # When
+        await redis._ack(stream, key, messageid)
+        # Then
+        pending = await c.xpending(key, redis.GROUP)
+    assert pending["pending"] == 0
@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+from aiosql.adapters.asyncpg import AsyncPGAdapter
+
+from db.clients import adapter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def stats():
+    with mock.patch.object(adapter, "stats") as stats:
+        yield stats
+
+
+async def test_select_is_timed(stats):
+    # Given
+    timed_adapter = adapter.TimedAsyncPGAdapter(namespace="member_2")
+    records = [{"id": 1}]
+
+    # When
+    with mock.patch.object(
+        AsyncPGAdapter, "select", mock.AsyncMock(return_value=records)
+    ) as select:
+        result = await timed_adapter.select(
+            "conn", "get_by_dob_and_email", "SELECT 1", ()
+        )
+
+    # Then
+    assert result == records
+    select.assert_awaited_once_with("conn", "get_by_dob_and_email", "SELECT 1", ())
+    assert stats.timed.call_args.kwargs["metric_name"] == adapter.QUERY_METRIC
+    assert stats.timed.call_args.kwargs["tags"] == [
+        "query:member_2.get_by_dob_and_email"
+    ]
+
+
+async def test_failed_query_is_timed(stats):
+    # Given
+    timed_adapter = adapter.TimedAsyncPGAdapter(namespace="member_versioned")
+
+    # When
+    with mock.patch.object(
+        AsyncPGAdapter,
+        "insert_update_delete",
+        mock.AsyncMock(side_effect=RuntimeError),
+    ):
+        with pytest.raises(RuntimeError):
+            await timed_adapter.insert_update_delete("conn", "purge", "DELETE", ())
+
+    # Then
+    assert stats.timed.return_value.__exit__.called
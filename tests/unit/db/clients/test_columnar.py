@@ -0,0 +1,64 @@
+import datetime
+
+import asyncpg
+from asyncpg.protocol.protocol import _create_record
+
+from db import model
+from db.clients import columnar, decoding
+
+
+def make_record(**columns) -> asyncpg.Record:
+    return _create_record(
+        {name: position for position, name in enumerate(columns)},
+        tuple(columns.values()),
+    )
+
+
+class TestColumnBatch:
+    records = [
+        make_record(
+            id=i,
+            organization_id=1,
+            first_name="first",
+            last_name="last",
+            date_of_birth=datetime.date(1990, 1, 1),
+            record=b'{"id": %d}' % i,
+        )
+        for i in range(3)
+    ]
+
+    @staticmethod
+    def batch() -> columnar.ColumnBatch:
+        return columnar.ColumnBatch.from_records(
+            TestColumnBatch.records,
+            decoder=decoding.decoder(model.MemberVersioned),
+            json_columns=frozenset(("record",)),
+        )
+
+    @staticmethod
+    def test_columns():
+        # When
+        batch = TestColumnBatch.batch()
+
+        # Then
+        assert len(batch) == 3
+        assert batch["id"] == (0, 1, 2)
+        assert batch["record"] == (b'{"id": 0}', b'{"id": 1}', b'{"id": 2}')
+
+    @staticmethod
+    def test_row_parses_json():
+        # When
+        member = TestColumnBatch.batch().row(1)
+
+        # Then
+        assert isinstance(member, model.MemberVersioned)
+        assert member.id == 1
+        assert member.record == {"id": 1}
+
+    @staticmethod
+    def test_rows():
+        # When
+        members = [*TestColumnBatch.batch().rows()]
+
+        # Then
+        assert [m.id for m in members] == [0, 1, 2]
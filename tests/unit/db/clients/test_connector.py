@@ -1,3 +1,11 @@
+import asyncio
+import inspect
+from unittest import mock
+
+import asyncpg
+import pytest
+
+from config import settings
 from db.clients import postgres_connector
 
 
@@ -15,3 +23,171 @@ class TestApplicationConnector:
         connectors = postgres_connector.application_connectors()
         assert connectors["main"] is not None
         assert connectors["read"] is not None
+
+    def test_application_connectors_have_a_batch_pool(self):
+        connectors = postgres_connector.application_connectors()
+        assert connectors["batch"].profile.name == "batch"
+        assert connectors["batch"].pool is not connectors["main"].pool
+        assert connectors["batch"].dsn == connectors["main"].dsn
+
+
+class TestPoolProfiles:
+    def test_pool_profiles_from_settings(self):
+        # Given
+        db_settings = settings.DB(
+            api_pool_min_size=4,
+            api_pool_max_size=8,
+            batch_pool_max_size=2,
+            read_acquire_timeout=1.5,
+        )
+
+        # When
+        profiles = postgres_connector.pool_profiles(db_settings)
+
+        # Then
+        assert profiles[postgres_connector.MAIN] == postgres_connector.PoolProfile(
+            name="api",
+            min_size=4,
+            max_size=8,
+            acquire_timeout=db_settings.api_acquire_timeout,
+            max_inactive_connection_lifetime=(
+                db_settings.pool_max_inactive_connection_lifetime
+            ),
+        )
+        assert profiles[postgres_connector.BATCH].max_size == 2
+        assert profiles[postgres_connector.READ].acquire_timeout == 1.5
+
+    def test_workload(self):
+        # When
+        with postgres_connector.workload(postgres_connector.BATCH):
+            inside = postgres_connector.WORKLOAD.get()
+
+        # Then
+        assert inside == postgres_connector.BATCH
+        assert postgres_connector.WORKLOAD.get() == postgres_connector.MAIN
+
+
+class TestAcquire:
+    @staticmethod
+    @pytest.fixture
+    def connector():
+        pool = mock.MagicMock(spec=asyncpg.pool.Pool)
+        pool.get_size.return_value = 2
+        pool.get_idle_size.return_value = 0
+        return postgres_connector.PostgresConnector(
+            "postgresql://",
+            pool=pool,
+            profile=postgres_connector.PoolProfile(name="batch", acquire_timeout=3),
+        )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_acquire_uses_profile_timeout(connector):
+        # Given
+        connection = mock.MagicMock()
+        connector.pool.acquire = mock.AsyncMock(return_value=connection)
+
+        # When
+        acquired = await connector.acquire()
+
+        # Then
+        assert acquired is connection
+        connector.pool.acquire.assert_awaited_once_with(timeout=3)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(connector):
+        # Given
+        connector.pool.acquire = mock.AsyncMock(side_effect=asyncio.TimeoutError)
+
+        # When
+        with mock.patch.object(postgres_connector, "stats") as stats:
+            with pytest.raises(asyncio.TimeoutError):
+                await connector.acquire(timeout=1)
+
+        # Then
+        assert stats.increment.call_args.kwargs["metric_name"] == (
+            "eligibility.db.pool.acquire_timeout"
+        )
+        assert stats.increment.call_args.kwargs["tags"] == ["db_pool:batch"]
+
+
+class TestWarmup:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_warmup_prepares_every_connection():
+        # Given
+        connections = [mock.MagicMock(), mock.MagicMock()]
+        for connection in connections:
+            connection._get_statement = mock.AsyncMock()
+        pool = mock.MagicMock(spec=asyncpg.pool.Pool)
+        pool.get_min_size.return_value = len(connections)
+        pool.acquire = mock.AsyncMock(side_effect=connections)
+        pool.release = mock.AsyncMock()
+        connector = postgres_connector.PostgresConnector(
+            "postgresql://", pool=pool, profile=postgres_connector.PoolProfile("api")
+        )
+        connector.initialized = True
+        statements = {"member_2.get": "SELECT 1", "member_2.all": "SELECT 2"}
+
+        # When
+        with mock.patch.dict(postgres_connector._WARMUP_STATEMENTS, clear=True):
+            prepared = await connector.warmup(statements)
+            registered = postgres_connector._WARMUP_STATEMENTS["api"]
+
+        # Then
+        assert prepared == 4
+        assert registered == statements
+        for connection in connections:
+            assert connection._get_statement.await_args_list == [
+                mock.call("SELECT 1", None),
+                mock.call("SELECT 2", None),
+            ]
+        assert pool.release.await_count == 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_warmup_skips_bad_statements():
+        # Given
+        connection = mock.MagicMock()
+        connection._get_statement = mock.AsyncMock(
+            side_effect=[asyncpg.UndefinedTableError("missing"), None]
+        )
+        statements = {"member_2.bad": "SELECT * FROM gone", "member_2.get": "SELECT 1"}
+
+        # When
+        prepared = await postgres_connector._prepare(connection, statements, pool="api")
+
+        # Then
+        assert prepared == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_init_connection_prepares_pool_statements():
+        # Given
+        connection = mock.MagicMock()
+        connection.set_type_codec = mock.AsyncMock()
+        connection._get_statement = mock.AsyncMock()
+        statements = {"member_2.get": "SELECT 1"}
+
+        # When
+        with mock.patch.dict(
+            postgres_connector._WARMUP_STATEMENTS, {"api": statements}, clear=True
+        ):
+            await postgres_connector._init_connection(connection, pool="api")
+            await postgres_connector._init_connection(connection, pool="batch")
+
+        # Then
+        connection._get_statement.assert_awaited_once_with("SELECT 1", None)
+
+    @staticmethod
+    def test_get_statement_fills_statement_cache():
+        """Warmup calls asyncpg's private `_get_statement` as `fetch` does, so that
+        it fills the statement cache, which `Connection.prepare` doesn't."""
+        # Given
+        parameters = inspect.signature(asyncpg.Connection._get_statement).parameters
+        prepare = inspect.signature(asyncpg.Connection._prepare).parameters
+        # Then
+        assert [*parameters][1:3] == ["query", "timeout"]
+        assert parameters["use_cache"].default is True
+        assert prepare["use_cache"].default is False
@@ -0,0 +1,110 @@
+import datetime
+from typing import TypedDict
+
+import asyncpg
+import pytest
+from asyncpg.protocol.protocol import _create_record
+
+from db import model
+from db.clients import decoding
+
+
+def make_record(**columns) -> asyncpg.Record:
+    return _create_record(
+        {name: position for position, name in enumerate(columns)},
+        tuple(columns.values()),
+    )
+
+
+class TestDecoder:
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="model_type",
+        argvalues=[model.MemberVersioned, model.Verification, model.FileParseResult],
+        ids=["member_versioned", "verification", "file_parse_result"],
+    )
+    def test_decoder_for_model(model_type):
+        # When
+        decoder = decoding.decoder(model_type)
+
+        # Then
+        assert decoder is not None
+
+    @staticmethod
+    def test_no_decoder_for_non_dataclass():
+        # Given
+        class NotADataclass(TypedDict):
+            id: int
+
+        # When
+        decoder = decoding.decoder(NotADataclass)
+
+        # Then
+        assert decoder is None
+
+    @staticmethod
+    def test_decode_converts_enums_and_ranges():
+        # Given
+        decoder = decoding.decoder(model.Verification)
+        record = make_record(
+            id=1,
+            user_id=2,
+            organization_id=3,
+            verification_type="STANDARD",
+            date_of_birth=datetime.date(1990, 1, 1),
+            ignored="not a field",
+        )
+
+        # When
+        verification = decoder.decode(record)
+
+        # Then
+        assert verification == model.Verification(
+            id=1,
+            user_id=2,
+            organization_id=3,
+            verification_type=model.VerificationTypes.STANDARD,
+            date_of_birth=datetime.date(1990, 1, 1),
+        )
+        assert verification.verification_type is model.VerificationTypes.STANDARD
+
+    @staticmethod
+    def test_decode_many_converts_ranges():
+        # Given
+        decoder = decoding.decoder(model.MemberVersioned)
+        effective_range = asyncpg.Range(datetime.date(2024, 1, 1), None)
+        records = [
+            make_record(
+                id=i,
+                organization_id=1,
+                first_name="first",
+                last_name="last",
+                date_of_birth=datetime.date(1990, 1, 1),
+                effective_range=effective_range,
+                record={"id": i},
+            )
+            for i in range(3)
+        ]
+
+        # When
+        members = decoder.decode_many(records)
+
+        # Then
+        assert [m.id for m in members] == [0, 1, 2]
+        assert all(isinstance(m.effective_range, model.DateRange) for m in members)
+        assert members[0].effective_range == effective_range
+        assert len(decoder.decoders) == 1
+
+    @staticmethod
+    def test_decode_converts_arrays_to_sets():
+        # Given
+        decoder = decoding.decoder(model.Configuration)
+        record = make_record(
+            organization_id=1, directory_name="one", email_domains=["example.com"]
+        )
+
+        # When
+        configuration = decoder.decode(record)
+
+        # Then
+        assert configuration.email_domains == {"example.com"}
@@ -7,8 +7,11 @@ from app.eligibility.domain import repository
 
 @pytest.fixture
 def parsed_records_repo():
+    fpr_client = mock.AsyncMock()
+    # There are no unchanged members to move to the file.
+    fpr_client.touch_seen_members_for_file.return_value = 0
     return repository.ParsedRecordsDatabaseRepository(
-        fpr_client=mock.AsyncMock(),
+        fpr_client=fpr_client,
         member_client=mock.AsyncMock(),
         file_client=mock.AsyncMock(),
     )
@@ -1,8 +1,10 @@
+import asyncio
+from datetime import date
 from unittest import mock
 
 import pytest
 
-from app.eligibility.domain import repository
+from app.eligibility.domain import model, repository
 from db import model as db_model
 
 pytestmark = pytest.mark.asyncio
@@ -24,6 +26,29 @@ class TestParsedRecordsDatabaseRepository:
 
         # Then
         parsed_records_repo.fpr_client.bulk_persist_parsed_records_for_files_dual_write_hash.assert_called_once()
+        parsed_records_repo.fpr_client.touch_seen_members_for_file.assert_called_once_with(
+            file.id, chunk_size=repository.parsed_records_db.FLUSH_CHUNK_SIZE
+        )
+
+    @staticmethod
+    async def test_persist_as_members_touches_seen_members_in_chunks(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file", success_count=10)
+        parsed_records_repo.fpr_client.touch_seen_members_for_file.side_effect = [
+            2,
+            1,
+            0,
+        ]
+
+        # When
+        await parsed_records_repo.persist_as_members(file=file)
+
+        # Then
+        assert (
+            parsed_records_repo.fpr_client.touch_seen_members_for_file.call_count == 3
+        )
 
     @staticmethod
     async def test_persist_as_members_calls_dual_write_hash_with_large_records(
@@ -46,8 +71,224 @@ class TestParsedRecordsDatabaseRepository:
         )
         parsed_records_repo.fpr_client.bulk_persist_parsed_records_for_files_dual_write_hash.assert_called_once()
 
+    @staticmethod
+    async def test_persist_as_members_caps_organization_concurrency(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file", success_count=1000_001)
+        parsed_records_repo.flush_concurrency = 2
+        running, peak = 0, 0
+
+        async def persist_org(file_id, organization_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        parsed_records_repo.fpr_client.bulk_persist_parsed_records_for_file_and_org_dual_write_hash.side_effect = (
+            persist_org
+        )
+
+        # When
+        with mock.patch(
+            "app.eligibility.domain.repository.parsed_records_db.ParsedRecordsDatabaseRepository.get_organization_ids_for_file",
+            return_value={2, 3, 4, 5},
+        ):
+            await parsed_records_repo.persist_as_members(file=file)
+
+        # Then
+        assert (
+            parsed_records_repo.fpr_client.bulk_persist_parsed_records_for_file_and_org_dual_write_hash.call_count
+            == 4
+        )
+        assert peak == 2
+
+    @staticmethod
+    async def test_persist_as_members_organization_error_cancels_others(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file", success_count=1000_001)
+        cancelled = []
+
+        async def persist_org(file_id, organization_id):
+            if organization_id == 2:
+                await asyncio.sleep(0)
+                raise ValueError()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(organization_id)
+                raise
+
+        parsed_records_repo.fpr_client.bulk_persist_parsed_records_for_file_and_org_dual_write_hash.side_effect = (
+            persist_org
+        )
+
+        # When
+        with mock.patch(
+            "app.eligibility.domain.repository.parsed_records_db.ParsedRecordsDatabaseRepository.get_organization_ids_for_file",
+            return_value={2, 3, 4},
+        ), pytest.raises(ValueError):
+            await parsed_records_repo.persist_as_members(file=file)
+
+        # Then
+        assert sorted(cancelled) == [3, 4]
+
+    @staticmethod
+    async def test_persist_as_members_in_chunks(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file", success_count=10)
+        first = {
+            "flushed": 6,
+            "organization_id": 1,
+            "unique_corp_id": "a",
+            "dependent_id": "",
+        }
+        second = {**first, "flushed": 4, "unique_corp_id": "b"}
+        persist_chunk = (
+            parsed_records_repo.fpr_client.bulk_persist_parsed_records_chunk_for_file_dual_write_hash
+        )
+        persist_chunk.side_effect = [first, second, None]
+        parsed_records_repo.file_client.get_flush_checkpoint.return_value = None
+
+        # When
+        with mock.patch(
+            "app.utils.feature_flag.organization_enabled_for_chunked_flush",
+            return_value=True,
+        ):
+            flushed = await parsed_records_repo.persist_as_members(file=file)
+
+        # Then
+        assert flushed == 10
+        assert [c.kwargs["after"] for c in persist_chunk.call_args_list] == [
+            None,
+            first,
+            second,
+        ]
+        parsed_records_repo.fpr_client.bulk_persist_parsed_records_for_files_dual_write_hash.assert_not_called()
+
+    @staticmethod
+    async def test_persist_as_members_in_chunks_resumes_from_checkpoint(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(id=1, organization_id=1, name="file", success_count=10)
+        checkpoint = {"organization_id": 1, "unique_corp_id": "a", "dependent_id": ""}
+        parsed_records_repo.file_client.get_flush_checkpoint.return_value = checkpoint
+        persist_chunk = (
+            parsed_records_repo.fpr_client.bulk_persist_parsed_records_chunk_for_file_dual_write_hash
+        )
+        persist_chunk.side_effect = [None]
+
+        # When
+        with mock.patch(
+            "app.utils.feature_flag.organization_enabled_for_chunked_flush",
+            return_value=True,
+        ):
+            await parsed_records_repo.persist_as_members(file=file)
+
+        # Then
+        parsed_records_repo.file_client.get_flush_checkpoint.assert_awaited_once_with(
+            file.id
+        )
+        assert persist_chunk.call_args.kwargs["after"] == checkpoint
+
     # endregion persist_as_members
 
+    # region persist_valid/persist_errors
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="copy_enabled,expected_valid,expected_errors",
+        argvalues=[
+            (
+                True,
+                "copy_file_parse_results",
+                "copy_file_parse_errors",
+            ),
+            (
+                False,
+                "bulk_persist_file_parse_results",
+                "bulk_persist_file_parse_errors",
+            ),
+        ],
+        ids=["copy", "insert"],
+    )
+    async def test_persist_staging_write_mode(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+        copy_enabled: bool,
+        expected_valid: str,
+        expected_errors: str,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file")
+        parsed_records = model.ParsedFileRecords(
+            valid=[
+                db_model.FileParseResult(
+                    file_id=file.id, organization_id=1, date_of_birth=date.today()
+                )
+            ],
+            errors=[db_model.FileParseError(file_id=file.id, organization_id=1)],
+        )
+
+        # When
+        with mock.patch(
+            "app.utils.feature_flag.organization_enabled_for_copy_staging_writes",
+            return_value=copy_enabled,
+        ):
+            await parsed_records_repo.persist(parsed_records=parsed_records, file=file)
+
+        # Then
+        getattr(parsed_records_repo.fpr_client, expected_valid).assert_called_once()
+        getattr(parsed_records_repo.fpr_client, expected_errors).assert_called_once()
+
+    @staticmethod
+    async def test_persist_known_records_seen(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file")
+        unchanged, changed = (
+            db_model.FileParseResult(
+                file_id=file.id,
+                organization_id=1,
+                date_of_birth=date.today(),
+                hash_value=f"{digest * 64},1",
+            )
+            for digest in ("a", "b")
+        )
+        known = model.KnownHashes([unchanged.hash_value])
+        parsed_records = model.ParsedFileRecords(valid=[unchanged, changed])
+        parsed_records_repo.fpr_client.persist_file_parse_seen.return_value = 1
+        parsed_records_repo.fpr_client.bulk_persist_file_parse_results.return_value = 1
+
+        # When
+        with mock.patch(
+            "app.utils.feature_flag.organization_enabled_for_copy_staging_writes",
+            return_value=False,
+        ):
+            processed = await parsed_records_repo.persist(
+                parsed_records=parsed_records, file=file, known=known
+            )
+
+        # Then
+        assert processed.valid == 2
+        assert list(
+            parsed_records_repo.fpr_client.persist_file_parse_seen.call_args.kwargs[
+                "hash_values"
+            ]
+        ) == [unchanged.hash_value]
+        parsed_records_repo.fpr_client.bulk_persist_file_parse_results.assert_called_once_with(
+            results=[changed]
+        )
+
+    # endregion persist_valid/persist_errors
+
     # region persist_missing
     @staticmethod
     async def test_persist_missing_write_to_member(
@@ -96,6 +337,35 @@ class TestParsedRecordsDatabaseRepository:
             and parsed_records_repo.fpr_client.expire_missing_records_for_file.called
         )
 
+    @staticmethod
+    async def test_persist_missing_error_cancels_other_expiry(
+        parsed_records_repo: repository.ParsedRecordsDatabaseRepository,
+    ):
+        # Given
+        file = db_model.File(organization_id=1, name="file")
+        cancelled = asyncio.Event()
+
+        async def expire_versioned(**kwargs):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        parsed_records_repo.fpr_client.expire_missing_records_for_file_versioned.side_effect = (
+            expire_versioned
+        )
+        parsed_records_repo.fpr_client.expire_missing_records_for_file.side_effect = (
+            ValueError()
+        )
+
+        # When
+        with pytest.raises(ValueError):
+            await parsed_records_repo.persist_missing(file=file)
+
+        # Then
+        assert cancelled.is_set()
+
     # endregion persist_missing
 
     @staticmethod
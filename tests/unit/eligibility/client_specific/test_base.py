@@ -36,6 +36,43 @@ class TestClientSpecificCaller:
         # Then
         assert response == expected
 
+    @staticmethod
+    async def test_call_shares_connector(caller, response_mock):
+        # Given
+        request = factory.ClientSpecificEmployeeRequestFactory.create()
+        response_mock.post(caller.url, status=200, body=orjson.dumps({}))
+        response_mock.post(caller.url, status=200, body=orjson.dumps({}))
+        await caller.initialize()
+        connector = caller.connector
+        # When
+        await caller.call(request=request)
+        await caller.call(request=request)
+        # Then
+        assert caller.connector is connector
+        assert caller.open
+        await caller.close()
+
+    @staticmethod
+    async def test_call_without_initialize_does_not_open_connector(
+        caller, response_mock
+    ):
+        # Given
+        request = factory.ClientSpecificEmployeeRequestFactory.create()
+        response_mock.post(caller.url, status=200, body=orjson.dumps({}))
+        # When
+        await caller.call(request=request)
+        # Then
+        assert not caller.open
+
+    @staticmethod
+    async def test_close(caller):
+        # Given
+        await caller.initialize()
+        # When
+        await caller.close()
+        # Then
+        assert not caller.open
+
     @staticmethod
     @pytest.mark.parametrize(argnames="errno", argvalues=[300, 400, 500])
     async def test_call_error(errno, caller, response_mock):
@@ -1,3 +1,5 @@
+import asyncio
+
 import msal
 import orjson
 import pytest
@@ -70,6 +72,52 @@ class TestMicrosoftSpecificCaller:
         with pytest.raises(microsoft.MicrosoftAuthError):
             await caller.get_token()
 
+    @staticmethod
+    async def test_get_token_reuses_unexpired_token(caller):
+        # Given
+        expected = "token"
+        caller.auth.acquire_token_silent.return_value = {
+            caller._TOKEN_KEY: expected,
+            caller._EXPIRES_IN_KEY: 3600,
+        }
+        # When
+        await caller.get_token()
+        token = await caller.get_token()
+        # Then
+        assert token == expected
+        caller.auth.acquire_token_silent.assert_called_once()
+
+    @staticmethod
+    async def test_get_token_refreshes_expiring_token(caller):
+        # Given
+        expected = "new-token"
+        caller.auth.acquire_token_silent.side_effect = [
+            {caller._TOKEN_KEY: "token", caller._EXPIRES_IN_KEY: 1},
+            {caller._TOKEN_KEY: expected, caller._EXPIRES_IN_KEY: 3600},
+        ]
+        # When
+        await caller.get_token()
+        token = await caller.get_token()
+        # Then
+        assert token == expected
+
+    @staticmethod
+    async def test_initialize_refreshes_token_in_background(caller):
+        # Given
+        expected = "token"
+        caller.auth.acquire_token_silent.return_value = {
+            caller._TOKEN_KEY: expected,
+            caller._EXPIRES_IN_KEY: 3600,
+        }
+        # When
+        await caller.initialize()
+        await asyncio.sleep(0)
+        token = await caller.get_token()
+        await caller.close()
+        # Then
+        assert token == expected
+        caller.auth.acquire_token_silent.assert_called_once()
+
     @staticmethod
     async def test_call_valid_employee(caller, response_mock):
         # Given
@@ -81,6 +129,20 @@ class TestMicrosoftSpecificCaller:
         # Then
         assert response == expected
 
+    @staticmethod
+    async def test_call_does_not_start_token_refresher(caller, response_mock):
+        # Given
+        request = factory.ClientSpecificEmployeeRequestFactory.create()
+        response_mock.post(
+            caller.url,
+            status=200,
+            body=orjson.dumps(factory.MicrosoftResponseFactory.create()),
+        )
+        # When
+        await caller.call(request)
+        # Then
+        assert caller._refresher is None
+
     @staticmethod
     async def test_call_valid_dependent(caller, response_mock):
         # Given
@@ -0,0 +1,91 @@
+import datetime
+from unittest import mock
+
+import pytest
+from tests.factories import data_models as factory
+
+from app.eligibility import configuration_cache
+from db.clients import configuration_client
+
+pytestmark = pytest.mark.asyncio
+
+UPDATED_AT = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def configurations():
+    return mock.create_autospec(configuration_client.Configurations, instance=True)
+
+
+@pytest.fixture
+def cache(configurations):
+    return configuration_cache.ConfigurationCache(configurations)
+
+
+async def test_get_loaded(cache, configurations):
+    # Given
+    config = factory.ConfigurationFactory.create(updated_at=UPDATED_AT)
+    configurations.all.return_value = [config]
+    await cache.load()
+    cache.initialized = True
+
+    # When
+    fetched = await cache.get(config.organization_id)
+
+    # Then
+    assert fetched == config
+    configurations.get.assert_not_called()
+
+
+async def test_get_not_initialized_reads_through(cache, configurations):
+    # Given
+    config = factory.ConfigurationFactory.create(updated_at=UPDATED_AT)
+    configurations.get.return_value = config
+
+    # When
+    await cache.get(config.organization_id)
+    await cache.get(config.organization_id)
+
+    # Then
+    assert configurations.get.call_count == 2
+    assert cache.by_organization == {}
+
+
+async def test_notification_invalidates(cache, configurations):
+    # Given
+    config = factory.ConfigurationFactory.create(updated_at=UPDATED_AT)
+    configurations.all.return_value = [config]
+    configurations.get.return_value = config
+    await cache.load()
+    cache.initialized = True
+
+    # When
+    cache._on_notification(
+        None, 1, configuration_cache.CHANNEL, str(config.organization_id)
+    )
+    await cache.get(config.organization_id)
+
+    # Then
+    configurations.get.assert_called_once_with(config.organization_id)
+
+
+async def test_refresh_fetches_changes_since_newest(cache, configurations):
+    # Given
+    config = factory.ConfigurationFactory.create(updated_at=UPDATED_AT)
+    updated_at = UPDATED_AT + datetime.timedelta(hours=1)
+    changed = factory.ConfigurationFactory.create(
+        organization_id=config.organization_id, updated_at=updated_at
+    )
+    configurations.all.return_value = [config]
+    configurations.get_updated_since.return_value = [changed]
+    await cache.load()
+
+    # When
+    await cache.refresh()
+
+    # Then
+    configurations.get_updated_since.assert_called_once_with(
+        UPDATED_AT - datetime.timedelta(seconds=configuration_cache.REFRESH_OVERLAP)
+    )
+    assert cache.by_organization[config.organization_id] == changed
+    assert cache.updated_at == updated_at
@@ -1,4 +1,6 @@
+import concurrent.futures
 import datetime
+import io
 import os
 from collections import Counter
 from typing import Type
@@ -94,6 +96,41 @@ def test_remap_header_with_optional_default_header_custom_value(
     assert mapped.keys() == header_mapping.with_all_headers().keys()
 
 
+def test_reader_from_stream():
+    # Given
+    header_mapping = model.HeaderMapping(date_of_birth="dob")
+    headers = ",".join(header_mapping.with_defaults().values())
+    lines = "\n".join(
+        ",".join(f"{i}" for _ in header_mapping.with_defaults()) for i in range(3)
+    )
+    data = io.BytesIO(f"{headers}\n{lines}".encode())
+    # When
+    reader = EligibilityCSVReader(header_mapping, data)
+    rows = [*reader]
+    # Then
+    assert [r["date_of_birth"] for r in rows] == ["0", "1", "2"]
+
+
+def test_reader_shards_split_on_record_boundaries():
+    # Given
+    header_mapping = model.HeaderMapping()
+    headers = ",".join(header_mapping.with_defaults().values())
+    lines = "\n".join(
+        ",".join(f'"{i}\n{i}"' for _ in header_mapping.with_defaults())
+        for i in range(5)
+    )
+    data = f"{headers}\n{lines}\n"
+    reader = EligibilityCSVReader(header_mapping, data)
+    # When
+    shards = [*reader.shards(2)]
+    # Then
+    assert len(shards) == 3
+    assert all(shard.startswith(f"{headers}\n") for shard in shards)
+    assert [
+        r for shard in shards for r in EligibilityCSVReader(header_mapping, shard)
+    ] == [*reader]
+
+
 # endregion
 
 
@@ -435,6 +472,87 @@ async def test_parse_error_with_correct_line_no(name, expected, manager):
     assert error_lines == expected
 
 
+@pytest.mark.parametrize(
+    argnames="name",
+    argvalues=[
+        "primary/clean.csv",
+        "primary/email-null-12-email-invalid-22.csv",
+        "primary/missing-employee-id-17.csv",
+        "secondary/dependent-missing-17-email-missing-18.csv",
+    ],
+)
+@pytest.mark.asyncio
+async def test_parse_sharded_matches_parse(name, manager):
+    # Given
+    data = await manager.get(name, "census-files")
+    file: model.File = FileFactory.create(name=name, encoding="utf-8-sig")
+    directory, _ = os.path.split(name)
+    config: model.Configuration = ConfigurationFactory.create(
+        organization_id=file.organization_id,
+        directory_name=directory,
+    )
+    headers = model.HeaderMapping()
+    serial = EligibilityFileParser(
+        file=file, configuration=config, data=data, headers=headers
+    )
+    sharded = EligibilityFileParser(
+        file=file,
+        configuration=config,
+        data=data,
+        headers=headers,
+        optum_file_logging_enabled=False,
+    )
+    # When
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = _line_numbers(sharded.parse_sharded(executor, batch_size=5))
+    # Then
+    assert result == _line_numbers(serial.parse(batch_size=5))
+    assert sharded.parse_line_no == serial.parse_line_no
+
+
+@pytest.mark.asyncio
+async def test_parse_sharded_in_process_pool(manager):
+    """Shards and their results must survive being pickled to and from the
+    process pool the processor parses in."""
+    # Given
+    name = "primary/email-null-12-email-invalid-22.csv"
+    data = await manager.get(name, "census-files")
+    file: model.File = FileFactory.create(name=name, encoding="utf-8-sig")
+    directory, _ = os.path.split(name)
+    config: model.Configuration = ConfigurationFactory.create(
+        organization_id=file.organization_id,
+        directory_name=directory,
+    )
+    headers = model.HeaderMapping()
+    serial = EligibilityFileParser(
+        file=file, configuration=config, data=data, headers=headers
+    )
+    sharded = EligibilityFileParser(
+        file=file,
+        configuration=config,
+        data=data,
+        headers=headers,
+        optum_file_logging_enabled=False,
+    )
+    # When
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        batches = [*sharded.parse_sharded(executor, batch_size=5)]
+    # Then
+    expected = [*serial.parse(batch_size=5)]
+    assert _line_numbers(batches) == _line_numbers(expected)
+    assert [(len(b.valid), len(b.errors)) for b in batches] == [
+        (len(b.valid), len(b.errors)) for b in expected
+    ]
+
+
+def _line_numbers(batches):
+    return [
+        (r.record["parse_line_no"], r.record["unique_corp_id"])
+        for batch in batches
+        for r in (*batch.errors, *batch.valid)
+    ]
+
+
 @pytest.mark.asyncio
 async def test_parse_data_provider_file_with_no_sub_org(manager):
     # Given
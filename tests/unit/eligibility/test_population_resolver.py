@@ -0,0 +1,139 @@
+import datetime
+from unittest import mock
+
+import pytest
+from tests.factories.data_models import MemberVersionedFactory
+
+from app.eligibility.populations import model as pop_model
+from app.eligibility.populations import resolver
+from db.clients import population_client
+
+VERSION = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _population(**kwargs) -> pop_model.Population:
+    return pop_model.Population(
+        **{
+            "id": 1,
+            "organization_id": 1,
+            "sub_pop_lookup_keys_csv": "work_state,custom_attributes.employment_status",
+            "sub_pop_lookup_map_json": {
+                "NY": {"Full": 101, "Part": 102},
+                "ATTRIBUTE_IS_NULL": {"ATTRIBUTE_DEFAULT_CASE": 103},
+                "ATTRIBUTE_DEFAULT_CASE": {
+                    "Full": 104,
+                    "ATTRIBUTE_DEFAULT_CASE": 105,
+                },
+            },
+            "updated_at": VERSION,
+            **kwargs,
+        }
+    )
+
+
+def _pop_info(**kwargs) -> pop_model.PopulationInformation:
+    return pop_model.PopulationInformation(
+        **{
+            "population_id": 1,
+            "sub_pop_lookup_keys_csv": "work_state,custom_attributes.employment_status",
+            "advanced": False,
+            "updated_at": VERSION,
+            **kwargs,
+        }
+    )
+
+
+@pytest.fixture
+def populations():
+    return mock.create_autospec(population_client.Populations, instance=True)
+
+
+@pytest.fixture
+def sub_population_resolver(populations):
+    return resolver.SubPopulationResolver(populations)
+
+
+@pytest.mark.parametrize(
+    argnames="work_state,custom_attributes,advanced,expected",
+    argvalues=[
+        ("NY", {"employment_status": "Full"}, False, 101),
+        ("NY", {"employment_status": "Part"}, False, 102),
+        ("NY", {}, False, None),
+        ("CA", {"employment_status": "Full"}, False, None),
+        ("NY", {"employment_status": "Part"}, True, 102),
+        (None, {"employment_status": "Part"}, True, 103),
+        ("CA", {"employment_status": "Full"}, True, 104),
+        ("CA", {}, True, 105),
+    ],
+    ids=[
+        "NY-Full",
+        "NY-Part",
+        "NY-Null",
+        "Unmapped",
+        "advanced-NY-Part",
+        "advanced-Null-Default",
+        "advanced-Default-Full",
+        "advanced-Default-Default",
+    ],
+)
+def test_compiled_population_resolve(work_state, custom_attributes, advanced, expected):
+    # Given
+    compiled = resolver.CompiledPopulation.compile(_population(advanced=advanced))
+    member = MemberVersionedFactory.create(
+        work_state=work_state, custom_attributes=custom_attributes
+    )
+    # When
+    sub_pop_id = compiled.resolve(member)
+    # Then
+    assert sub_pop_id == expected
+
+
+@pytest.mark.asyncio
+async def test_resolve_compiles_population_once(populations, sub_population_resolver):
+    # Given
+    populations.get.return_value = _population()
+    member = MemberVersionedFactory.create(
+        work_state="NY", custom_attributes={"employment_status": "Full"}
+    )
+    # When
+    first = await sub_population_resolver.resolve(_pop_info(), member)
+    second = await sub_population_resolver.resolve(_pop_info(), member)
+    # Then
+    assert first == second == 101
+    populations.get.assert_called_once_with(pk=1)
+
+
+@pytest.mark.asyncio
+async def test_resolve_recompiles_changed_population(
+    populations, sub_population_resolver
+):
+    # Given
+    updated_at = VERSION + datetime.timedelta(minutes=1)
+    populations.get.side_effect = [
+        _population(),
+        _population(
+            sub_pop_lookup_map_json={"NY": {"Full": 201}}, updated_at=updated_at
+        ),
+    ]
+    member = MemberVersionedFactory.create(
+        work_state="NY", custom_attributes={"employment_status": "Full"}
+    )
+    await sub_population_resolver.resolve(_pop_info(), member)
+    # When
+    sub_pop_id = await sub_population_resolver.resolve(
+        _pop_info(updated_at=updated_at), member
+    )
+    # Then
+    assert sub_pop_id == 201
+    assert populations.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_missing_population(populations, sub_population_resolver):
+    # Given
+    populations.get.return_value = None
+    member = MemberVersionedFactory.create(work_state="NY")
+    # When
+    sub_pop_id = await sub_population_resolver.resolve(_pop_info(), member)
+    # Then
+    assert sub_pop_id is None
@@ -1,8 +1,10 @@
+import asyncio
 from unittest import mock
 
 import pytest
 from tests.factories.data_models import ConfigurationFactory, MavenOrgExternalIDFactory
 
+from app.common import crypto
 from app.eligibility import process
 from app.eligibility.constants import ProcessingResult
 from app.eligibility.domain import model
@@ -13,11 +15,16 @@ from db.mono.client import MavenOrgExternalID
 pytestmark = pytest.mark.asyncio
 
 
+async def stream(data, chunk_size: int = 64):
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
 @pytest.fixture
 def processor_bad_data(
     mock_manager, records, files, members, configs, header_aliases, file_data_bad_format
 ):
-    mock_manager.get.return_value = file_data_bad_format.encode()
+    mock_manager.stream.return_value = stream(file_data_bad_format.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
     processor.store = records
@@ -30,7 +37,7 @@ def processor_bad_data(
 
 async def test_processor_process(mock_manager, config, file, file_data, header_aliases):
     # Given
-    mock_manager.get.return_value = file_data.encode()
+    mock_manager.stream.return_value = stream(file_data.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
     processor.headers = header_aliases
@@ -55,7 +62,7 @@ async def test_processor_process_custom_attributes(
     mock_manager, config, file, file_data, MockHeaderAliases
 ):
     # Given
-    mock_manager.get.return_value = file_data.encode()
+    mock_manager.stream.return_value = stream(file_data.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
     custom_attributes = {
@@ -94,7 +101,7 @@ async def test_processor_process_data_provider(
         data_provider_organization_id=config_data_provider.organization_id,
     )
 
-    mock_manager.get.return_value = file_data.encode()
+    mock_manager.stream.return_value = stream(file_data.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.configs.get_external_ids_by_data_provider.return_value = [external_id]
     processor.manager = mock_manager
@@ -132,7 +139,7 @@ async def test_processor_process_data_provider_with_composite_key(
     )
     # Fake a random composite key
     external_id.external_id = "NIFDNESI:CFNDIN"
-    mock_manager.get.return_value = file_data.encode()
+    mock_manager.stream.return_value = stream(file_data.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.configs.get_external_ids_by_data_provider.return_value = [external_id]
     processor.manager = mock_manager
@@ -160,7 +167,7 @@ async def test_processor_bad_row_data(
     mock_manager, config, file, file_data_bad_format, header_aliases
 ):
     # Given
-    mock_manager.get.return_value = file_data_bad_format.encode()
+    mock_manager.stream.return_value = stream(file_data_bad_format.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
     processor.headers = header_aliases
@@ -177,7 +184,7 @@ async def test_processor_bad_row_data(
 
 async def test_processor_no_file_found(mock_manager, config, file):
     # Given
-    mock_manager.get.return_value = None
+    mock_manager.stream.return_value = None
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
 
@@ -192,23 +199,45 @@ async def test_processor_cant_detect_encoding(
     mock_manager, file_data_bad_format, config, file
 ):
     # Given
-    mock_manager.get.return_value = "I'm not encoded"
+    mock_manager.stream.return_value = stream(b"I'm not encoded")
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
 
     # When
-    result, parsed = await processor.process("key", 1, file=file, config=config)
+    with mock.patch.object(
+        process.cchardet, "detect", side_effect=ValueError("can't detect")
+    ):
+        result, parsed = await processor.process("key", 1, file=file, config=config)
 
     # Then
     assert result == ProcessingResult.BAD_FILE_ENCODING
 
 
+async def test_processor_storage_error_is_not_bad_encoding(mock_manager, config, file):
+    # Given
+    async def failing_stream():
+        yield b"first chunk"
+        raise ConnectionResetError("connection reset")
+
+    mock_manager.stream.return_value = failing_stream()
+    processor = process.EligibilityFileProcessor("test")
+    processor.manager = mock_manager
+
+    # When
+    result, parsed = await processor.process("key", 1, file=file, config=config)
+
+    # Then
+    assert result == ProcessingResult.ERROR_DURING_PROCESSING
+
+
 async def test_processor_processing_error(
     mock_manager, file_data_bad_format, config, file
 ):
     # Given
     e = "РїРѕРј"
-    mock_manager.get.return_value = e.encode("utf-8", errors="backslashreplace")
+    mock_manager.stream.return_value = stream(
+        e.encode("utf-8", errors="backslashreplace")
+    )
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
 
@@ -223,7 +252,7 @@ async def test_processor_set_file_count_called(
     mock_manager, config, file, file_data, header_aliases
 ):
     # Given
-    mock_manager.get.return_value = file_data.encode()
+    mock_manager.stream.return_value = stream(file_data.encode())
     processor = process.EligibilityFileProcessor("test")
     processor.manager = mock_manager
     processor.headers = header_aliases
@@ -250,4 +279,134 @@ async def test_processor_set_file_count_called(
     )
 
 
+async def test_processor_streamed_in_chunks(
+    mock_manager, config, file, file_data, header_aliases
+):
+    # Given
+    mock_manager.stream.return_value = stream(file_data.encode(), chunk_size=7)
+    processor = process.EligibilityFileProcessor("test")
+    processor.manager = mock_manager
+    processor.headers = header_aliases
+
+    # When
+    with mock.patch("app.eligibility.domain.service.persist") as mocked_persist:
+        mocked_persist.return_value = model.ProcessedRecords(valid=10)
+        await processor.process("key", 1, file=file, config=config)
+
+    # Then
+    parsed_records = mocked_persist.call_args.kwargs["parsed_records"]
+    assert len(parsed_records.valid) + len(parsed_records.errors) == 10
+
+
+async def test_processor_persists_batches_concurrently(
+    mock_manager, config, file, file_data, header_aliases
+):
+    # Given
+    concurrency = 3
+    mock_manager.stream.return_value = stream(file_data.encode())
+    processor = process.EligibilityFileProcessor(
+        "test", persist_concurrency=concurrency
+    )
+    processor.manager = mock_manager
+    processor.headers = header_aliases
+    parsed, in_flight, peak, parsed_while_blocked = 0, 0, 0, None
+    all_in_flight = asyncio.Event()
+    stage = process.EligibilityFileProcessor._stage
+
+    async def counting_stage(self, batches, **kwargs):
+        def counted():
+            nonlocal parsed
+            for batch in batches:
+                parsed += 1
+                yield batch
+
+        return await stage(self, counted(), **kwargs)
+
+    async def persist(**kwargs):
+        nonlocal in_flight, peak, parsed_while_blocked
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if in_flight == concurrency and not all_in_flight.is_set():
+            # Give the parser every chance to run ahead while the database is busy.
+            await asyncio.sleep(0.1)
+            parsed_while_blocked = parsed
+            all_in_flight.set()
+        # Serial persists would never get here, since the first would wait forever.
+        await asyncio.wait_for(all_in_flight.wait(), 1)
+        in_flight -= 1
+        return model.ProcessedRecords(valid=1)
+
+    # When
+    with mock.patch(
+        "app.eligibility.domain.service.persist", side_effect=persist
+    ) as mocked_persist, mock.patch.object(
+        process.EligibilityFileProcessor, "_stage", counting_stage
+    ):
+        await processor.process("key", 1, file=file, config=config, batch_size=1)
+
+    # Then
+    line_numbers = [
+        r.record["parse_line_no"]
+        for call in mocked_persist.call_args_list
+        for r in (
+            *call.kwargs["parsed_records"].valid,
+            *call.kwargs["parsed_records"].errors,
+        )
+    ]
+    assert sorted(line_numbers) == list(range(1, 11))
+    assert peak == concurrency
+    # The batches being persisted, those queued, and the one waiting to be queued.
+    assert parsed_while_blocked <= concurrency * 2 + 1 < len(line_numbers)
+
+
+async def test_processor_persist_error(
+    mock_manager, config, file, file_data, header_aliases
+):
+    # Given
+    mock_manager.stream.return_value = stream(file_data.encode())
+    processor = process.EligibilityFileProcessor("test")
+    processor.manager = mock_manager
+    processor.headers = header_aliases
+
+    # When
+    with mock.patch("app.eligibility.domain.service.persist") as mocked_persist:
+        mocked_persist.side_effect = Exception("boom")
+        result, parsed = await processor.process(
+            "key", 1, file=file, config=config, batch_size=1
+        )
+
+    # Then
+    assert result == ProcessingResult.ERROR_DURING_PROCESSING
+
+
+async def test_processor_decryption_error(
+    mock_manager, config, file, file_data, header_aliases
+):
+    # Given
+    async def tampered():
+        async for chunk in stream(file_data.encode()):
+            yield chunk
+        raise crypto.DecryptionError("data authentication failed")
+
+    mock_manager.stream.return_value = tampered()
+    processor = process.EligibilityFileProcessor("test")
+    processor.manager = mock_manager
+    processor.headers = header_aliases
+
+    # When
+    with mock.patch(
+        "app.eligibility.domain.service.persist"
+    ) as mocked_persist, mock.patch(
+        "app.eligibility.domain.repository.ParsedRecordsDatabaseRepository.delete_results"
+    ) as mocked_delete_results, mock.patch(
+        "app.eligibility.domain.repository.ParsedRecordsDatabaseRepository.delete_errors"
+    ):
+        mocked_persist.return_value = model.ProcessedRecords(valid=10)
+        result, parsed = await processor.process("key", 1, file=file, config=config)
+
+    # Then
+    assert result == ProcessingResult.ERROR_DURING_PROCESSING
+    mocked_delete_results.assert_called_once()
+
+
 # endregion
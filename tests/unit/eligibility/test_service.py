@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from typing import Any
 from unittest import mock
@@ -15,8 +16,7 @@ from tests.factories.data_models import (
 )
 
 import app.eligibility.errors
-import app.utils.eligibility_validation
-from app.eligibility import errors, service
+from app.eligibility import configuration_cache, errors, service
 from app.eligibility.service import EligibilityService
 from app.utils.eligibility_validation import is_cached_organization_active
 from db import model
@@ -27,7 +27,10 @@ pytestmark = pytest.mark.asyncio
 
 @pytest.fixture
 def reset_organization_cache():
-    app.utils.eligibility_validation.is_cached_organization_active.reset()
+    configuration_cache.cache().clear()
+    yield
+    configuration_cache.cache().initialized = False
+    configuration_cache.cache().clear()
 
 
 @pytest.fixture(scope="module")
@@ -941,6 +944,7 @@ async def test_get_cached_active_organizations_by_id_use_cache(svc, configs):
     config = factory.ConfigurationFactory.create(implementation=None)
     get_configuration_method = getattr(configs, "get")
     get_configuration_method.side_effect = mock.AsyncMock(return_value=config)
+    configuration_cache.cache().initialized = True
 
     # When
     # Call our method twice- should use the cache on the second round
@@ -959,36 +963,26 @@ async def test_get_cached_active_organizations_by_id_use_cache(svc, configs):
 
 
 @pytest.mark.usefixtures("reset_organization_cache")
-async def test_get_cached_active_organizations_by_id_time_out(svc, configs):
+async def test_get_cached_active_organizations_by_id_invalidated(svc, configs):
     # Given
     config = factory.ConfigurationFactory.create(implementation=None)
     get_configuration_method = getattr(configs, "get")
     get_configuration_method.side_effect = mock.AsyncMock(return_value=config)
+    configuration_cache.cache().initialized = True
 
-    with mock.patch(
-        "app.utils.async_ttl_cache.AsyncTTLCache._InnerCache._get_time_to_live_value"
-    ) as ttl_func_mock:
-        # Given
-        # Set TTL to be 0:30:01 ago so that a second call will already be considered expired
-        # The TTL value is set when the initial call is made, so the mocked TTL value must
-        # be set before the first call to get_cached_external_ids_by_value.
-        ttl_func_mock.return_value = datetime.datetime.now() - datetime.timedelta(
-            minutes=30, seconds=1
-        )
-
-        # When
-        # Call our method twice- we will make two DB calls because the cache expires
-        await is_cached_organization_active(
-            organization_id=config.organization_id,
-            configs=configs,
-        )
-        await is_cached_organization_active(
-            organization_id=config.organization_id,
-            configs=configs,
-        )
+    # When
+    # Call our method twice- we will make two DB calls because the org changed
+    await is_cached_organization_active(
+        organization_id=config.organization_id,
+        configs=configs,
+    )
+    configuration_cache.cache().invalidate(config.organization_id)
+    await is_cached_organization_active(
+        organization_id=config.organization_id,
+        configs=configs,
+    )
 
     # Then
-    # Underlying async coroutine awaited once
     assert get_configuration_method.await_count == 2
 
 
@@ -1742,6 +1736,65 @@ async def test_check_standard_eligibility_raise_error_when_not_fully_synced(
             _ = await svc.check_standard_eligibility(date_of_birth=dob, email=email)
 
 
+async def test_check_standard_eligibility_speculative_member_2_lookup(svc):
+    # Given
+    v1_started, v2_started = asyncio.Event(), asyncio.Event()
+
+    async def get_v1(*args, **kwargs):
+        v1_started.set()
+        await asyncio.wait_for(v2_started.wait(), 1)
+        return member_versioned
+
+    async def get_v2(*args, **kwargs):
+        v2_started.set()
+        await asyncio.wait_for(v1_started.wait(), 1)
+        return member_2
+
+    with mock.patch(
+        "app.eligibility.service.EligibilityService._get_by_dob_and_email_v1",
+        side_effect=get_v1,
+    ), mock.patch(
+        "app.eligibility.service.EligibilityService._get_by_dob_and_email_v2",
+        side_effect=get_v2,
+    ), mock.patch(
+        "app.utils.feature_flag.organization_enabled_for_e9y_2_write",
+        return_value=True,
+    ), mock.patch(
+        "app.utils.feature_flag.is_e9y_2_speculative_read_enabled",
+        return_value=True,
+    ):
+        # When
+        result = await svc.check_standard_eligibility(date_of_birth=dob, email=email)
+
+    # Then
+    assert result == member_2_response
+
+
+async def test_check_standard_eligibility_speculative_member_2_lookup_discarded(
+    svc,
+):
+    # Given
+    with mock.patch(
+        "app.eligibility.service.EligibilityService._get_by_dob_and_email_v1",
+        return_value=member_versioned,
+    ), mock.patch(
+        "app.eligibility.service.EligibilityService._get_by_dob_and_email_v2",
+        side_effect=errors.StandardMatchError(),
+    ), mock.patch(
+        "app.utils.feature_flag.organization_enabled_for_e9y_2_write",
+        return_value=False,
+    ), mock.patch(
+        "app.utils.feature_flag.is_e9y_2_speculative_read_enabled",
+        return_value=True,
+    ):
+        # When
+        result = await svc.check_standard_eligibility(date_of_birth=dob, email=email)
+
+    # Then
+    assert result.first_name == member_versioned.first_name
+    assert result.is_v2 is False
+
+
 async def test_check_alternate_eligibility_return_member_versioned_if_no_need_check_member_2(
     svc, members_versioned, members_2
 ):
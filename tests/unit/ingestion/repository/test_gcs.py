@@ -1,3 +1,4 @@
+import io
 from unittest import mock
 
 import pytest
@@ -114,6 +115,32 @@ class TestEligibilityFileManager:
             key2="val2",
         )
 
+    @staticmethod
+    async def test_put_file_encrypted(file_manager: repository.EligibilityFileManager):
+        # Given
+        metadata = {"key1": "val1", "key2": "val2"}
+        file_manager.encrypted = True
+        file_manager.crypto.encrypt_file.return_value = ("mocked hash", metadata)
+
+        # When
+        save_blob_from_file = file_manager.storage.save_blob_from_file
+        await file_manager.put_file(
+            io.BytesIO(b"any content"),
+            name=TestEligibilityFileManager.file_name,
+            bucket_name=TestEligibilityFileManager.bucket_name,
+            kek_name="kek",
+            signing_key_name="sig",
+        )
+
+        # Then
+        file_manager.crypto.encrypt_file.assert_called_once()
+        save_blob_from_file.assert_called_once()
+        assert save_blob_from_file.call_args.kwargs == {
+            "content_type": "application/octet-stream",
+            "key1": "val1",
+            "key2": "val2",
+        }
+
     @staticmethod
     @pytest.mark.parametrize(
         argnames="kek,sig_key",
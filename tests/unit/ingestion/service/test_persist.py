@@ -517,13 +517,13 @@ class TestPersistRecord:
 
 class TestPersistBatch:
     @staticmethod
-    async def test_persist_batch_calls_persist_record(
+    async def test_persist_batch_persists_stream_in_bulk(
         persist_service: service.PersistenceService,
     ):
         # Given
         batch_size: int = 10
         metadata: model.Metadata = pubsub_factory.MetadataFactory(
-            type=repository.IngestionType.FILE
+            type=repository.IngestionType.STREAM
         )
         processed: model.ProcessedNotification = (
             pubsub_factory.ProcessedNotificationFactory.create(metadata=metadata)
@@ -541,7 +541,16 @@ class TestPersistBatch:
             await persist_service.persist_batch(messages=batch)
 
             # Then
-            assert mock_persist_record.call_count == batch_size
+            mock_persist_record.assert_not_called()
+        persist_service._member_repo.persist_optum_members.assert_called_once()
+        assert (
+            len(
+                persist_service._member_repo.persist_optum_members.call_args.kwargs[
+                    "records"
+                ]
+            )
+            == batch_size
+        )
 
     @staticmethod
     async def test_persist_record_continues_on_exception(
@@ -550,7 +559,7 @@ class TestPersistBatch:
         # Given
         batch_size: int = 10
         metadata: model.Metadata = pubsub_factory.MetadataFactory(
-            type=repository.IngestionType.FILE
+            type=repository.IngestionType.STREAM
         )
         processed: model.ProcessedNotification = (
             pubsub_factory.ProcessedNotificationFactory.create(metadata=metadata)
@@ -563,6 +572,7 @@ class TestPersistBatch:
         _persist_record_side_effects = [Exception] + [
             None for _ in range(batch_size - 1)
         ]
+        persist_service._member_repo.persist_optum_members.side_effect = Exception
         persist_service.persist_record = mock.AsyncMock(
             side_effect=_persist_record_side_effects
         )
@@ -573,6 +583,166 @@ class TestPersistBatch:
         # Then
         assert persist_service.persist_record.call_count == batch_size
 
+    @staticmethod
+    async def test_persist_batch_persists_file_in_bulk(
+        persist_service: service.PersistenceService,
+    ):
+        # Given
+        batch_size: int = 10
+        metadata: model.Metadata = pubsub_factory.MetadataFactory(
+            type=repository.IngestionType.FILE
+        )
+        valid: model.ProcessedNotification = (
+            pubsub_factory.ProcessedNotificationFactory.create(
+                metadata=metadata,
+                record=pubsub_factory.ProcessedMemberFactory(errors=[]),
+            )
+        )
+        error: model.ProcessedNotification = (
+            pubsub_factory.ProcessedNotificationFactory.create(
+                metadata=metadata,
+                record=pubsub_factory.ProcessedMemberFactory(errors=["error"]),
+            )
+        )
+        batch: List[pubsub.PubSubEntry[model.ProcessedNotification]] = [
+            *pubsub_factory.PubSubMessageFactory.create_batch(
+                size=batch_size - 1, data=valid
+            ),
+            pubsub_factory.PubSubMessageFactory.create(data=error),
+        ]
+
+        # When
+        with mock.patch(
+            "ingestion.service.PersistenceService.get_row_count"
+        ) as mock_get_row_count:
+            await persist_service.persist_batch(messages=batch)
+
+        # Then
+        persist_service._file_parse_repo.persist_valid.assert_called_once()
+        persist_service._file_parse_repo.persist_errors.assert_called_once()
+        assert (
+            len(
+                persist_service._file_parse_repo.persist_valid.call_args.kwargs["valid"]
+            )
+            == batch_size - 1
+        )
+        persist_service._ingest_config.incr_cache_many.assert_called_once_with(
+            namespace=service.FileIngestionService.FILE_CACHE_NAMESPACE,
+            id=metadata.file_id,
+            amounts={
+                persist_service.FILE_COUNT_SUCCESS_CACHE_KEY: batch_size - 1,
+                persist_service.FILE_COUNT_ERROR_CACHE_KEY: 1,
+            },
+        )
+        persist_service._ingest_config.incr_cache.assert_not_called()
+        mock_get_row_count.assert_called_once_with(file_id=metadata.file_id)
+
+    @staticmethod
+    async def test_persist_batch_groups_by_file(
+        persist_service: service.PersistenceService,
+    ):
+        # Given
+        batch: List[pubsub.PubSubEntry[model.ProcessedNotification]] = [
+            pubsub_factory.PubSubMessageFactory.create(
+                data=pubsub_factory.ProcessedNotificationFactory.create(
+                    metadata=pubsub_factory.MetadataFactory(
+                        type=repository.IngestionType.FILE, file_id=file_id
+                    ),
+                    record=pubsub_factory.ProcessedMemberFactory(errors=[]),
+                )
+            )
+            for file_id in (1, 2, 1, 2)
+        ]
+
+        # When
+        with mock.patch("ingestion.service.PersistenceService.get_row_count"):
+            await persist_service.persist_batch(messages=batch)
+
+        # Then
+        assert persist_service._file_parse_repo.persist_valid.call_count == 2
+        assert persist_service._ingest_config.incr_cache_many.call_count == 2
+
+    @staticmethod
+    async def test_persist_batch_bulk_error_persists_individually(
+        persist_service: service.PersistenceService,
+    ):
+        # Given
+        batch_size: int = 10
+        metadata: model.Metadata = pubsub_factory.MetadataFactory(
+            type=repository.IngestionType.FILE
+        )
+        processed: model.ProcessedNotification = (
+            pubsub_factory.ProcessedNotificationFactory.create(
+                metadata=metadata,
+                record=pubsub_factory.ProcessedMemberFactory(errors=[]),
+            )
+        )
+        batch: List[
+            pubsub.PubSubEntry[model.ProcessedNotification]
+        ] = pubsub_factory.PubSubMessageFactory.create_batch(
+            size=batch_size, data=processed
+        )
+        persist_service._file_parse_repo.persist_valid.side_effect = Exception
+
+        # When
+        with mock.patch(
+            "ingestion.service.PersistenceService.persist_record"
+        ) as mock_persist_record:
+            await persist_service.persist_batch(messages=batch)
+
+            # Then
+            assert mock_persist_record.call_count == batch_size
+            persist_service._ingest_config.incr_cache_many.assert_not_called()
+
+    @staticmethod
+    async def test_persist_batch_bulk_error_persists_failed_group_individually(
+        persist_service: service.PersistenceService,
+    ):
+        # Given
+        batch_size: int = 10
+        metadata: model.Metadata = pubsub_factory.MetadataFactory(
+            type=repository.IngestionType.FILE
+        )
+        valid: model.ProcessedNotification = (
+            pubsub_factory.ProcessedNotificationFactory.create(
+                metadata=metadata,
+                record=pubsub_factory.ProcessedMemberFactory(errors=[]),
+            )
+        )
+        error: model.ProcessedNotification = (
+            pubsub_factory.ProcessedNotificationFactory.create(
+                metadata=metadata,
+                record=pubsub_factory.ProcessedMemberFactory(errors=["error"]),
+            )
+        )
+        batch: List[pubsub.PubSubEntry[model.ProcessedNotification]] = [
+            *pubsub_factory.PubSubMessageFactory.create_batch(
+                size=batch_size - 1, data=valid
+            ),
+            pubsub_factory.PubSubMessageFactory.create(data=error),
+        ]
+        persist_service._file_parse_repo.persist_errors.side_effect = Exception
+
+        # When
+        with mock.patch(
+            "ingestion.service.PersistenceService.persist_record"
+        ) as mock_persist_record, mock.patch(
+            "ingestion.service.PersistenceService.get_row_count"
+        ) as mock_get_row_count:
+            await persist_service.persist_batch(messages=batch)
+
+            # Then
+            mock_persist_record.assert_called_once_with(processed=error)
+            mock_get_row_count.assert_not_called()
+            persist_service._ingest_config.incr_cache_many.assert_called_once_with(
+                namespace=service.FileIngestionService.FILE_CACHE_NAMESPACE,
+                id=metadata.file_id,
+                amounts={
+                    persist_service.FILE_COUNT_SUCCESS_CACHE_KEY: batch_size - 1,
+                    persist_service.FILE_COUNT_ERROR_CACHE_KEY: 0,
+                },
+            )
+
 
 class TestConsumeProcessed:
     @staticmethod
@@ -4,8 +4,13 @@ from unittest import mock
 
 import pytest
 from ingestion import repository
-from ingestion.repository import IngestionType
-from split.model import AffiliationsHeader, ParentFileInfo, SplitFileResult
+from split.model import (
+    AffiliationsHeader,
+    ChildFileInfo,
+    ParentFileInfo,
+    SplitFileResult,
+)
+from split.repository.csv import SplitFileCsvWriter
 from split.service import split
 from tests.factories import data_models as factories
 
@@ -342,32 +347,18 @@ x,y,00z"""
         file=file, affiliations_header=affiliations_header
     )
 
-    @staticmethod
-    async def mock_get_external_org_info(
-        *,
-        source: IngestionType,
-        client_id: str | None = None,
-        customer_id: str | None = None,
-        organization_id: int | None = None,
-    ):
-        """
-        A mock method to mock _ingest_config_repo.get_external_org_info
-        """
-        _, _ = source, organization_id
-        mapping = {("a", "b"): 1, ("c", "d"): 2}
-        key = (client_id, customer_id)
-        if key not in mapping:
-            return None
-        external_id = mapping[key]
-        return db_model.ExternalMavenOrgInfo(organization_id=external_id)
+    child_org_infos = {
+        "a": db_model.ExternalMavenOrgInfo(organization_id=1, directory_name="one"),
+        "c": db_model.ExternalMavenOrgInfo(organization_id=2, directory_name="two"),
+    }
 
     @staticmethod
     async def test_return_result_when_happy_path(
         file_split_service: split.FileSplitService,
     ):
         # Given
-        file_split_service._ingest_config_repo.get_external_org_info = (
-            TestSplitFile.mock_get_external_org_info
+        file_split_service._ingest_config_repo.get_child_org_infos.return_value = (
+            TestSplitFile.child_org_infos
         )
         file_split_service._ingest_config_repo.set_file_count.return_value = None
 
@@ -404,8 +395,8 @@ x,y,00z"""
         file_split_service: split.FileSplitService,
     ):
         # Given
-        file_split_service._ingest_config_repo.get_external_org_info = (
-            TestSplitFile.mock_get_external_org_info
+        file_split_service._ingest_config_repo.get_child_org_infos.return_value = (
+            TestSplitFile.child_org_infos
         )
         file_split_service._ingest_config_repo.set_file_count.return_value = None
         file_split_service._ingest_config_repo.get_affiliations_header_for_org.return_value = (
@@ -426,7 +417,7 @@ x,y,00z"""
     ):
         # Given
         # no matching child org find
-        file_split_service._ingest_config_repo.get_external_org_info.return_value = None
+        file_split_service._ingest_config_repo.get_child_org_infos.return_value = {}
         file_split_service._ingest_config_repo.set_file_count.return_value = None
 
         res = await file_split_service._split_file(
@@ -437,3 +428,61 @@ x,y,00z"""
 
 
 # endregion
+
+# region test write_split_files
+class TestWriteSplitFiles:
+    file = factories.FileFactory.create(name="parent-directory/parent-file.csv")
+    parent_file_info = ParentFileInfo(
+        file=file, affiliations_header=TestSplitFile.affiliations_header
+    )
+
+    @staticmethod
+    def split_file_result() -> SplitFileResult:
+        child_files = {}
+        for org_id, directory_name in ((1, "one"), (2, "two")):
+            writer = SplitFileCsvWriter(fieldnames=["id"])
+            writer.write_row({"id": f"00{org_id}"})
+            child_files[org_id] = ChildFileInfo(
+                organization=db_model.ExternalMavenOrgInfo(
+                    organization_id=org_id, directory_name=directory_name
+                ),
+                writer=writer,
+            )
+        return SplitFileResult(total_rows=2, child_files=child_files)
+
+    @staticmethod
+    async def test_write_child_files_to_child_directories(
+        file_split_service: split.FileSplitService,
+    ):
+        # When
+        res = await file_split_service._write_split_files(
+            parent_file_info=TestWriteSplitFiles.parent_file_info,
+            split_file_result=TestWriteSplitFiles.split_file_result(),
+        )
+        # Then
+        assert res == TestWriteSplitFiles.file
+        names = {
+            c.kwargs["name"]
+            for c in file_split_service._file_manager.put_file.call_args_list
+        }
+        assert names == {"one/parent-file.csv", "two/parent-file.csv"}
+
+    @staticmethod
+    async def test_return_none_when_child_file_fails(
+        file_split_service: split.FileSplitService,
+    ):
+        # Given
+        file_split_service._file_manager.put_file.side_effect = [
+            None,
+            ConnectionError("upload failed"),
+        ]
+        # When
+        res = await file_split_service._write_split_files(
+            parent_file_info=TestWriteSplitFiles.parent_file_info,
+            split_file_result=TestWriteSplitFiles.split_file_result(),
+        )
+        # Then
+        assert res is None
+
+
+# endregion
@@ -32,7 +32,111 @@ async def test_sync_all_mono_external_ids(configs, maven):
     # When
     await sync.sync_all_mono_external_ids(configs, maven)
     # Then
-    assert configs.delete_and_recreate_all_external_ids.called
+    assert configs.sync_external_ids.called
+
+
+def test_diff_external_ids():
+    # Given
+    unchanged, moved, removed = (
+        MavenOrgExternalID(source="okta", external_id="a", organization_id=1),
+        MavenOrgExternalID(source="okta", external_id="b", organization_id=1),
+        MavenOrgExternalID(source="okta", external_id="c", organization_id=1),
+    )
+    added = MavenOrgExternalID(source="okta", external_id="d", organization_id=2)
+    existing = [unchanged, moved, removed]
+    desired = [
+        MavenOrgExternalID(source="okta", external_id="a", organization_id=1),
+        MavenOrgExternalID(source="okta", external_id="b", organization_id=2),
+        added,
+    ]
+
+    # When
+    upserts, deletes = sync.diff_external_ids(existing, desired)
+
+    # Then
+    assert [(e.external_id, e.organization_id) for e in upserts] == [("b", 2), ("d", 2)]
+    assert deletes == [removed]
+
+
+def test_diff_external_ids_case_change_replaces_external_id():
+    # Given
+    renamed = MavenOrgExternalID(source="okta", external_id="abc", organization_id=1)
+    existing = [renamed]
+    desired = [MavenOrgExternalID(source="okta", external_id="ABC", organization_id=1)]
+
+    # When
+    upserts, deletes = sync.diff_external_ids(existing, desired)
+
+    # Then
+    assert [(e.source, e.external_id) for e in upserts] == [("okta", "ABC")]
+    assert deletes == [renamed]
+
+
+def test_diff_external_ids_without_source_keyed_by_data_provider():
+    # Given
+    kept, removed = (
+        MavenOrgExternalID(
+            source=None,
+            external_id="a",
+            organization_id=1,
+            data_provider_organization_id=10,
+        ),
+        MavenOrgExternalID(
+            source=None,
+            external_id="a",
+            organization_id=2,
+            data_provider_organization_id=20,
+        ),
+    )
+    moved = MavenOrgExternalID(
+        source=None,
+        external_id="b",
+        organization_id=1,
+        data_provider_organization_id=10,
+    )
+    existing = [kept, removed, moved]
+    desired = [
+        kept,
+        MavenOrgExternalID(
+            source=None,
+            external_id="b",
+            organization_id=3,
+            data_provider_organization_id=10,
+        ),
+    ]
+
+    # When
+    upserts, deletes = sync.diff_external_ids(existing, desired)
+
+    # Then
+    assert [(e.external_id, e.organization_id) for e in upserts] == [("b", 3)]
+    assert deletes == [removed]
+
+
+async def test_sync_all_mono_orgs_skips_unchanged(configs, header_aliases, maven):
+    # Given
+    orgs: list = factory.create_batch(
+        dict,
+        size=2,
+        FACTORY_CLASS=base_factory.MavenOrganizationFactory,
+        json__headers={"foo": "bar"},
+    )
+    maven.get_orgs_for_sync_cursor.return_value = patch_cursor(
+        infchunks([dict(o) for o in orgs], 10)
+    )
+    await sync.sync_all_mono_orgs(configs, header_aliases, maven)
+    (fingerprints,) = configs.bulk_persist_sync_fingerprints.call_args.args
+    configs.get_sync_fingerprints.return_value = fingerprints
+    configs.bulk_persist.reset_mock()
+    maven.get_orgs_for_sync_cursor.return_value = patch_cursor(
+        infchunks([dict(o) for o in orgs], 10)
+    )
+
+    # When
+    await sync.sync_all_mono_orgs(configs, header_aliases, maven)
+
+    # Then
+    configs.bulk_persist.assert_not_called()
 
 
 async def test_sync_all_mono_orgs(configs, header_aliases, maven):
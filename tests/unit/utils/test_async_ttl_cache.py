@@ -1,8 +1,11 @@
-import datetime
+import asyncio
+import time
 from unittest import mock
 
 import pytest
 
+from app.utils import async_ttl_cache
+
 
 @pytest.mark.asyncio
 async def test_async_ttl_cache(cached_async_coroutine_fixture):
@@ -68,9 +71,7 @@ async def test_async_ttl_cache_time_out(cached_async_coroutine_fixture):
         # Set TTL to be 0:00:04 ago so that a second call will already be considered expired
         # The TTL value is set when the initial call is made, so the mocked TTL value must
         # be set before the first call to cached_async_coroutine.
-        ttl_func_mock.return_value = datetime.datetime.now() - datetime.timedelta(
-            seconds=4
-        )
+        ttl_func_mock.return_value = time.monotonic() - 4
         await cached_async_coroutine_fixture("test")
         # Underlying function has already been called once
         assert dummy_function_mock.call_count == 1
@@ -144,3 +145,92 @@ async def test_async_ttl_cache_max_size_lru(cached_async_coroutine_fixture):
         # Underlying function has not been called again despite max size limit due to not
         # being least recently used
         assert dummy_function_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_coalesces_concurrent_misses():
+    # Given
+    calls = 0
+    release = asyncio.Event()
+
+    @async_ttl_cache.AsyncTTLCache(time_to_live=3, max_size=2)
+    async def slow(caller_id: str):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return caller_id
+
+    # When
+    pending = [asyncio.create_task(slow("test")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    values = await asyncio.gather(*pending)
+
+    # Then
+    assert values == ["test"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_does_not_cache_errors():
+    # Given
+    side_effect = [ValueError("boom"), "value"]
+
+    @async_ttl_cache.AsyncTTLCache(time_to_live=3, max_size=2)
+    async def flaky(caller_id: str):
+        result = side_effect.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with pytest.raises(ValueError):
+        await flaky("test")
+
+    # When
+    value = await flaky("test")
+
+    # Then
+    assert value == "value"
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_negative_time_to_live():
+    # Given
+    cache = async_ttl_cache.AsyncTTLCache(
+        time_to_live=60, max_size=2, negative_time_to_live=1
+    )
+    inner = cache._inner_cache
+
+    # When
+    positive = inner._get_time_to_live_value(negative=False) - time.monotonic()
+    negative = inner._get_time_to_live_value(negative=True) - time.monotonic()
+
+    # Then
+    assert 59 < positive <= 60
+    assert 0 < negative <= 1
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_ignores_clients_in_key():
+    # Given
+    class Client:
+        pass
+
+    calls = 0
+
+    @async_ttl_cache.AsyncTTLCache(time_to_live=3, max_size=2)
+    async def fetch(organization_id: int, client: Client):
+        nonlocal calls
+        calls += 1
+        return organization_id
+
+    await fetch(1, client=Client())
+
+    # When
+    await fetch(1, client=Client())
+
+    # Then
+    assert calls == 1
+    assert fetch.cache_info() == async_ttl_cache.CacheInfo(
+        hits=1, misses=1, evictions=0, size=1
+    )
@@ -1,3 +1,4 @@
+import time
 from unittest import mock
 
 import pytest
@@ -34,6 +35,20 @@ def test_organization_enabled_for_e9y_2_write(input, enabled_orgs, expected):
         assert res == expected
 
 
+@pytest.mark.parametrize(
+    argnames="input, enabled_orgs,expected",
+    argvalues=[
+        (1, [1], True),
+        (2, [], False),
+        (3, [2], False),
+    ],
+)
+def test_organization_enabled_for_copy_staging_writes(input, enabled_orgs, expected):
+    with mock.patch("maven.feature_flags.json_variation", return_value=enabled_orgs):
+        res = feature_flag.organization_enabled_for_copy_staging_writes(input)
+        assert res == expected
+
+
 @pytest.fixture
 def mock_json_variation():
     with mock.patch("maven.feature_flags.json_variation") as mock_var:
@@ -192,3 +207,33 @@ def test_is_optum_file_logging_enabled(flag_value, expected):
             default=False,
         )
         assert result == expected
+
+
+def test_organization_flags_evaluated_once_per_snapshot(mock_json_variation):
+    # Given
+    mock_json_variation.return_value = [1, 2]
+
+    # When
+    results = [feature_flag.organization_enabled_for_e9y_2_read(i) for i in (1, 2, 3)]
+
+    # Then
+    assert results == [True, True, False]
+    mock_json_variation.assert_called_once()
+
+
+def test_organization_flags_reevaluated_after_snapshot_expires(mock_json_variation):
+    # Given
+    mock_json_variation.return_value = [1]
+    feature_flag.organization_enabled_for_e9y_2_read(1)
+    mock_json_variation.return_value = []
+
+    # When
+    with mock.patch(
+        "time.monotonic",
+        return_value=time.monotonic() + feature_flag.SNAPSHOT_TIME_TO_LIVE + 1,
+    ):
+        enabled = feature_flag.organization_enabled_for_e9y_2_read(1)
+
+    # Then
+    assert enabled is False
+    assert mock_json_variation.call_count == 2
@@ -0,0 +1,83 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from app.utils import speculative
+
+
+@pytest.mark.asyncio
+async def test_speculative_enabled_starts_on_enter():
+    # Given
+    started = asyncio.Event()
+
+    async def read():
+        started.set()
+        return "v2"
+
+    # When
+    async with speculative.Speculative(read, enabled=True) as v2:
+        await asyncio.wait_for(started.wait(), 1)
+        result = await v2.result()
+
+    # Then
+    assert result == "v2"
+
+
+@pytest.mark.asyncio
+async def test_speculative_disabled_runs_on_result():
+    # Given
+    read = mock.AsyncMock(return_value="v2")
+
+    # When
+    async with speculative.Speculative(read, enabled=False) as v2:
+        read.assert_not_called()
+        result = await v2.result()
+
+    # Then
+    assert result == "v2"
+    read.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_speculative_unused_is_cancelled():
+    # Given
+    cancelled = asyncio.Event()
+
+    async def read():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    # When
+    async with speculative.Speculative(read, enabled=True):
+        await asyncio.sleep(0)
+
+    # Then
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_speculative_unused_error_is_discarded():
+    # Given
+    read = mock.AsyncMock(side_effect=ValueError)
+
+    # When
+    async with speculative.Speculative(read, enabled=True) as v2:
+        await asyncio.sleep(0)
+
+    # Then
+    assert isinstance(v2.task.exception(), ValueError)
+
+
+@pytest.mark.asyncio
+async def test_speculative_error_raised_on_result():
+    # Given
+    read = mock.AsyncMock(side_effect=ValueError)
+
+    # When/Then
+    with pytest.raises(ValueError):
+        async with speculative.Speculative(read, enabled=True) as v2:
+            await v2.result()
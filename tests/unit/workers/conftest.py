@@ -14,6 +14,7 @@ def MockEligibilityFileProcessor():
 @pytest.fixture
 def processor(MockEligibilityFileProcessor):
     processor = MockEligibilityFileProcessor.return_value
+    processor.file_size.return_value = None
     yield processor
     processor.reset_mock()
 
@@ -31,6 +32,12 @@ def stream(MockRedisStream):
     stream.reset_mock()
 
 
+@pytest.fixture(autouse=True)
+def ack():
+    with mock.patch("app.worker.redis._ack", autospec=True) as am:
+        yield am
+
+
 @pytest.fixture(scope="package", autouse=True)
 def MockRedisPublisher():
     with mock.patch(
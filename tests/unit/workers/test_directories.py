@@ -0,0 +1,77 @@
+from unittest import mock
+
+import pytest
+from tests.factories import data_models as factory
+
+from app.worker import directories
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def sync_org():
+    with mock.patch(
+        "app.tasks.sync.sync_single_mono_org_for_directory", autospec=True
+    ) as m:
+        yield m
+
+
+@pytest.fixture
+def index(configs, header_aliases, maven):
+    return directories.DirectoryIndex(configs, header_aliases, maven)
+
+
+async def test_resolve_syncs_unknown_directory(index, configs, sync_org):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    sync_org.return_value = config
+
+    # When
+    resolved = await index.resolve(config.directory_name)
+
+    # Then
+    assert resolved == config
+    configs.get_by_directory_name.assert_not_called()
+
+
+async def test_resolve_uses_recently_synced_directory(index, configs, sync_org):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    sync_org.return_value = config
+    configs.get_by_directory_name.return_value = config
+    await index.resolve(config.directory_name)
+
+    # When
+    resolved = await index.resolve(config.directory_name)
+
+    # Then
+    assert resolved == config
+    sync_org.assert_called_once()
+
+
+async def test_resolve_resyncs_stale_directory(index, sync_org):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    sync_org.return_value = config
+    await index.resolve(config.directory_name)
+    index.synced_at[config.directory_name] -= index.max_age
+
+    # When
+    await index.resolve(config.directory_name)
+
+    # Then
+    assert sync_org.call_count == 2
+
+
+async def test_resolve_resyncs_missing_configuration(index, configs, sync_org):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    sync_org.return_value = config
+    configs.get_by_directory_name.return_value = None
+    await index.resolve(config.directory_name)
+
+    # When
+    await index.resolve(config.directory_name)
+
+    # Then
+    assert sync_org.call_count == 2
@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import pytest
@@ -33,7 +34,47 @@ async def test_process_file(stream, processor):
     assert results == [processed]
 
 
-async def test_process_file_no_file(stream, processor):
+async def test_process_file_acks_when_done(stream, processor, ack):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    file = factory.FileFactory.create(organization_id=config.organization_id)
+    key, messageid, notification = PendingFileStreamEntryFactory.create(
+        message__file_id=file.id
+    )
+    processed = ProcessedRecordsFactory.create(valid=processed_data(["foo"]))
+    processor.configs.get.side_effect = mock.AsyncMock(return_value=config)
+    processor.files.get.side_effect = mock.AsyncMock(return_value=file)
+
+    async def process(*args):
+        ack.assert_not_called()
+        return ProcessingResult.PROCESSING_SUCCESSFUL, processed
+
+    processor.process.side_effect = process
+    stream.__aiter__.return_value = [(key, messageid, notification)]
+    # When
+    results = [p async for p in redis.process_file(stream)]
+    # Then
+    assert results == [processed]
+    ack.assert_awaited_once_with(stream, key, messageid)
+
+
+async def test_process_file_does_not_ack_on_error(stream, processor, ack):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    file = factory.FileFactory.create(organization_id=config.organization_id)
+    notification = PendingFileStreamEntryFactory.create(message__file_id=file.id)
+    processor.configs.get.side_effect = mock.AsyncMock(return_value=config)
+    processor.files.get.side_effect = mock.AsyncMock(return_value=file)
+    processor.process.side_effect = mock.AsyncMock(side_effect=ValueError())
+    stream.__aiter__.return_value = [notification]
+    # When
+    results = [p async for p in redis.process_file(stream)]
+    # Then
+    assert results == []
+    ack.assert_not_called()
+
+
+async def test_process_file_no_file(stream, processor, ack):
     # Given
     notification = PendingFileStreamEntryFactory.create()
     processor.files.get.side_effect = mock.AsyncMock(return_value=None)
@@ -42,6 +83,7 @@ async def test_process_file_no_file(stream, processor):
     results = [p async for p in redis.process_file(stream)]
     # Then
     assert results == []
+    ack.assert_awaited_once()
 
 
 async def test_process_file_no_data(stream, processor):
@@ -76,3 +118,78 @@ async def test_process_file_bad_data(stream, processor):
     results = [p async for p in redis.process_file(stream)]
     # Then
     assert results == []
+
+
+async def test_process_file_concurrently(stream, processor):
+    # Given
+    configs = factory.ConfigurationFactory.create_batch(2)
+    slow, fast = (
+        factory.FileFactory.create(organization_id=c.organization_id) for c in configs
+    )
+    notifications = [
+        PendingFileStreamEntryFactory.create(message__file_id=f.id)
+        for f in (slow, fast)
+    ]
+    processed = {
+        f.id: ProcessedRecordsFactory.create(valid=processed_data([f.name]))
+        for f in (slow, fast)
+    }
+    fast_done = asyncio.Event()
+
+    async def process(key, messageid, file, config):
+        if file is slow:
+            await fast_done.wait()
+        else:
+            fast_done.set()
+        return ProcessingResult.PROCESSING_SUCCESSFUL, processed[file.id]
+
+    processor.files.get.side_effect = mock.AsyncMock(side_effect=[slow, fast])
+    processor.configs.get.side_effect = mock.AsyncMock(side_effect=configs)
+    processor.process.side_effect = process
+    stream.__aiter__.return_value = notifications
+    # When
+    results = [p async for p in redis.process_file(stream)]
+    # Then
+    assert results == [processed[fast.id], processed[slow.id]]
+
+
+async def test_process_file_same_organization_serially(stream, processor):
+    # Given
+    config = factory.ConfigurationFactory.create()
+    files = factory.FileFactory.create_batch(3, organization_id=config.organization_id)
+    notifications = [
+        PendingFileStreamEntryFactory.create(message__file_id=f.id) for f in files
+    ]
+    running, order = set(), []
+
+    async def process(key, messageid, file, config):
+        assert not running
+        running.add(file.id)
+        await asyncio.sleep(0)
+        running.remove(file.id)
+        order.append(file.id)
+        return ProcessingResult.PROCESSING_SUCCESSFUL, ProcessedRecordsFactory.create()
+
+    processor.files.get.side_effect = mock.AsyncMock(side_effect=files)
+    processor.configs.get.side_effect = mock.AsyncMock(return_value=config)
+    processor.process.side_effect = process
+    stream.__aiter__.return_value = notifications
+    # When
+    results = [p async for p in redis.process_file(stream)]
+    # Then
+    assert len(results) == 3
+    assert order == [f.id for f in files]
+
+
+@pytest.mark.parametrize(
+    argnames="requested,file_concurrency,pool_size,expected",
+    argvalues=[(4, 4, 10, 2), (4, 1, 10, 4), (4, 4, 2, 1), (1, 4, 40, 1)],
+    ids=["capped", "uncapped", "at-least-one", "requested"],
+)
+async def test_flush_concurrency(requested, file_concurrency, pool_size, expected):
+    # When
+    concurrency = redis.flush_concurrency(
+        requested, file_concurrency=file_concurrency, pool_size=pool_size
+    )
+    # Then
+    assert concurrency == expected
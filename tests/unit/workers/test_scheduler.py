@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from app.worker import scheduler
+
+
+@pytest.fixture
+def file_scheduler():
+    return scheduler.FileScheduler(
+        concurrency=3, large_concurrency=1, large_file_size=100
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="size,expected",
+    argvalues=[(None, False), (0, False), (99, False), (100, True), (101, True)],
+)
+def test_is_large(size, expected, file_scheduler):
+    # When
+    is_large = file_scheduler.is_large(size)
+    # Then
+    assert is_large is expected
+
+
+@pytest.mark.parametrize(
+    argnames="concurrency,large_concurrency,expected",
+    argvalues=[(1, 1, 1), (2, 2, 1), (3, 5, 2), (3, 1, 1)],
+)
+def test_large_concurrency_leaves_room_for_small(
+    concurrency, large_concurrency, expected
+):
+    # When
+    file_scheduler = scheduler.FileScheduler(
+        concurrency=concurrency,
+        large_concurrency=large_concurrency,
+        large_file_size=100,
+    )
+    # Then
+    assert file_scheduler.large_concurrency == expected
+
+
+@pytest.mark.asyncio
+async def test_slot_large_files_capped(file_scheduler):
+    # Given
+    async with file_scheduler.slot(await _admit(file_scheduler, 1), size=100):
+        # When
+        waiting = asyncio.create_task(_enter(file_scheduler, 2, size=100))
+        small = await asyncio.wait_for(_enter(file_scheduler, 3, size=1), 1)
+        await asyncio.sleep(0)
+        # Then
+        assert small is True
+        assert not waiting.done()
+    assert await asyncio.wait_for(waiting, 1) is True
+
+
+@pytest.mark.asyncio
+async def test_slot_total_capped(file_scheduler):
+    # Given
+    entered = [await _admit(file_scheduler, org) for org in (1, 2, 3)]
+    async with file_scheduler.slot(entered[0], size=100), file_scheduler.slot(
+        entered[1], size=1
+    ), file_scheduler.slot(entered[2], size=1):
+        # When
+        waiting = asyncio.create_task(_enter(file_scheduler, 4, size=1))
+        await asyncio.sleep(0)
+        # Then
+        assert not waiting.done()
+    assert await asyncio.wait_for(waiting, 1) is True
+
+
+@pytest.mark.asyncio
+async def test_slot_organization_exclusive(file_scheduler):
+    # Given
+    first = await _admit(file_scheduler, 1)
+    second = await _admit(file_scheduler, 1)
+    async with file_scheduler.slot(first, size=1):
+        # When
+        waiting = asyncio.create_task(_enter(file_scheduler, 1, turn=second, size=1))
+        await asyncio.sleep(0)
+        # Then
+        assert not waiting.done()
+    file_scheduler.finish(first)
+    assert await asyncio.wait_for(waiting, 1) is True
+
+
+@pytest.mark.asyncio
+async def test_queued_files_do_not_hold_reservations(file_scheduler):
+    # Given
+    busy = await _admit(file_scheduler, 1)
+    # When
+    queued = [
+        await asyncio.wait_for(_admit(file_scheduler, 1), 1)
+        for _ in range(file_scheduler.concurrency * 4)
+    ]
+    # Then
+    assert busy.reserved
+    assert not any(turn.reserved for turn in queued)
+    assert await asyncio.wait_for(_enter(file_scheduler, 2, size=1), 1) is True
+
+
+@pytest.mark.asyncio
+async def test_large_file_backlog_does_not_block_small_files(file_scheduler):
+    # Given
+    release = asyncio.Event()
+
+    async def process(turn):
+        try:
+            async with file_scheduler.slot(turn, size=100):
+                await release.wait()
+        finally:
+            file_scheduler.finish(turn)
+
+    large = []
+    for org in range(1, file_scheduler.concurrency * 2 + 5):
+        turn = await asyncio.wait_for(_admit(file_scheduler, org), 1)
+        large.append(asyncio.create_task(process(turn)))
+        await asyncio.sleep(0)
+    # When
+    small = await asyncio.wait_for(_admit(file_scheduler, 0), 1)
+    entered = await asyncio.wait_for(_enter(file_scheduler, 0, turn=small, size=1), 1)
+    # Then
+    assert entered is True
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*large), 1)
+
+
+@pytest.mark.asyncio
+async def test_finish_without_slot_keeps_order(file_scheduler):
+    # Given
+    first, skipped, last = [await _admit(file_scheduler, 1) for _ in range(3)]
+    async with file_scheduler.slot(first, size=1):
+        # When
+        file_scheduler.finish(skipped)
+        waiting = asyncio.create_task(_enter(file_scheduler, 1, turn=last, size=1))
+        await asyncio.sleep(0)
+        # Then
+        assert not waiting.done()
+    file_scheduler.finish(first)
+    assert await asyncio.wait_for(waiting, 1) is True
+
+
+@pytest.mark.asyncio
+async def test_finish_forgets_idle_organizations(file_scheduler):
+    # Given
+    turns = [await _admit(file_scheduler, org) for org in (1, 1, 2)]
+    # When
+    for turn in turns:
+        file_scheduler.finish(turn)
+    await asyncio.sleep(0)
+    # Then
+    assert file_scheduler.turns == {}
+
+
+async def _admit(file_scheduler, organization_id):
+    await file_scheduler.reserve()
+    return file_scheduler.admit(organization_id)
+
+
+async def _enter(file_scheduler, organization_id, *, size, turn=None):
+    turn = turn or await _admit(file_scheduler, organization_id)
+    try:
+        async with file_scheduler.slot(turn, size=size):
+            return True
+    finally:
+        file_scheduler.finish(turn)